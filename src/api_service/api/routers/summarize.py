@@ -1,8 +1,14 @@
+import asyncio
 import os
+import tempfile
+import uuid
+from typing import Optional
 from fastapi import APIRouter, UploadFile, HTTPException, Form, File
 import logging
-from api_service.api.utils.process_pdf import process_pdf_privacy_issues
-from api_service.api.utils.privacy_grader import PrivacyGrader
+from api_service.api.utils.process_pdf import MAPPING_CSV_PATH, analyze_pdf_async, get_issue_catalog
+from api_service.api.utils.analysis_cache import DEFAULT_MAX_BYTES, get_analysis_cache
+from api_service.api.utils.privacy_grader import get_privacy_grader
+from api_service.api.utils.grader_profiles import UnknownProfile
 import traceback
 
 # Initialize the FastAPI router
@@ -11,8 +17,50 @@ router = APIRouter()
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
-# In-memory storage for extracted issues
+# In-memory storage for extracted issues: the latest upload's, for clients that grade without
+# an upload_id (last writer wins when uploads overlap), and each recent upload's by its id
 parsed_issues_storage = {"issues": []}
+parsed_uploads = {}
+MAX_STORED_UPLOADS = int(os.getenv("MAX_STORED_UPLOADS", 1000))
+
+# Grading data lives in the "utils" directory one level above this script's directory
+utils_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils")
+mapping_df_path = os.path.join(utils_dir, "mapping_df.csv")
+category_weights_path = os.path.join(utils_dir, "category_weights.csv")
+grading_artifact_path = os.path.join(utils_dir, "grading_artifact.pkl")
+score_distribution_path = os.path.join(utils_dir, "score_distribution.json")
+scoring_rules_path = os.path.join(utils_dir, "scoring_rules.json")
+weight_profiles_path = os.path.join(utils_dir, "weight_profiles.json")
+
+# Content-addressed cache of PDF analyses, so re-uploaded policies skip the model call
+analysis_cache_path = os.getenv("PDF_ANALYSIS_CACHE_PATH", "/tmp/pdf_analysis_cache.db")
+analysis_cache_max_bytes = int(os.getenv("PDF_ANALYSIS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+
+@router.on_event("startup")
+async def load_privacy_grader():
+    """Build the shared PrivacyGrader and issue catalog once per worker so the first request doesn't pay for them."""
+    get_privacy_grader(mapping_df_path, category_weights_path, grading_artifact_path,
+                       score_distribution_path, scoring_rules_path, weight_profiles_path)
+    get_issue_catalog(MAPPING_CSV_PATH)
+
+
+def store_issues(issues) -> str:
+    """Keep an upload's issues under a new upload_id, dropping the oldest beyond MAX_STORED_UPLOADS."""
+    upload_id = uuid.uuid4().hex
+    parsed_uploads[upload_id] = issues
+    while len(parsed_uploads) > MAX_STORED_UPLOADS:
+        del parsed_uploads[next(iter(parsed_uploads))]
+    parsed_issues_storage["issues"] = issues
+    return upload_id
+
+
+def save_upload(data: bytes) -> str:
+    """Write uploaded PDF bytes to a new temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_out:
+        pdf_out.write(data)
+    return pdf_out.name
+
 
 @router.post("/process-pdf/")
 async def process_pdf(
@@ -29,22 +77,29 @@ async def process_pdf(
         if not pdf_file.filename.endswith(".pdf"):
             raise HTTPException(status_code=400, detail="A valid PDF file is required.")
 
-        # Save the PDF to a temporary path
-        pdf_path = "/tmp/uploaded_pdf.pdf"
-        with open(pdf_path, "wb") as pdf_out:
-            pdf_out.write(await pdf_file.read())
+        # Save the PDF to a temporary path of its own, since other uploads are processed meanwhile
+        pdf_path = await asyncio.to_thread(save_upload, await pdf_file.read())
 
-        # Process the PDF to extract privacy issues
-        found_issues = process_pdf_privacy_issues(
-            pdf_path, project_id, location_id, endpoint_id
-        )
+        # Process the PDF to extract privacy issues (or reuse the analysis of identical bytes).
+        # Extraction runs in a thread and the model call is awaited, so the event loop keeps serving.
+        # Opening the cache the first time opens its SQLite file, so that runs in a thread too
+        try:
+            cache = await asyncio.to_thread(get_analysis_cache, analysis_cache_path, analysis_cache_max_bytes)
+            analysis = await analyze_pdf_async(pdf_path, project_id, location_id, endpoint_id, cache=cache)
+        finally:
+            os.remove(pdf_path)
+        found_issues = analysis.issues
 
-        # Store extracted issues in memory
-        parsed_issues_storage["issues"] = found_issues
+        # Store extracted issues in memory, under an id this upload can be graded by
+        upload_id = store_issues(found_issues)
 
         return {
             "message": "Processing completed successfully.",
+            "upload_id": upload_id,
             "found_issues": found_issues,
+            "cache_hit": analysis.cache_hit,
+            "chars_saved": analysis.chars_saved,
+            "tokens_saved": analysis.tokens_saved,
         }
 
     except Exception as e:
@@ -53,36 +108,50 @@ async def process_pdf(
 
 
 @router.post("/get-grade/")
-async def get_grade():
+async def get_grade(profile: Optional[str] = None, stability: bool = False, upload_id: Optional[str] = None):
     """
-    Grade the parsed privacy issues.
+    Grade the parsed privacy issues of upload_id (as returned by /process-pdf/), or of the
+    latest upload without one, optionally with a named category weight profile. With
+    stability=true the response also estimates how the grade shifts under extraction noise.
     """
     try:
+        if upload_id is None:
+            issues = parsed_issues_storage["issues"]
+        else:
+            issues = parsed_uploads.get(upload_id)
+            if issues is None:
+                raise HTTPException(status_code=404, detail=f"Unknown upload_id {upload_id!r}.")
+
         # Check if issues have been extracted
-        if not parsed_issues_storage["issues"]:
+        if not issues:
             raise HTTPException(
                 status_code=400,
                 detail="No issues have been processed yet. Please process a PDF first.",
             )
 
-        # Dynamically locate the CSV file in the "utils" directory one level above the current script's directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)  # Get the parent directory
-        mapping_df_path = os.path.join(parent_dir, "utils", "mapping_df.csv")
-        category_weights_path = os.path.join(parent_dir, "utils", "category_weights.csv")
-
-        # Initialize the PrivacyGrader
-        grader = PrivacyGrader(mapping_df_path, category_weights_path)
+        # Reuse the worker's shared PrivacyGrader (rebuilt only if the CSV files change)
+        try:
+            grader = get_privacy_grader(mapping_df_path, category_weights_path, grading_artifact_path,
+                                        score_distribution_path, scoring_rules_path, weight_profiles_path,
+                                        profile=profile)
+        except UnknownProfile as e:
+            raise HTTPException(status_code=404, detail=e.args[0])
 
         # Grade the issues
-        report = grader.grade_privacy_issues(parsed_issues_storage["issues"])
+        report = grader.grade_privacy_issues(issues)
 
-        return {
+        response = {
             "overall_grade": report.overall_grade,
             "overall_score": report.overall_score,
+            "overall_percentile": report.overall_percentile,
             "category_scores": report.parent_category_grades,
         }
+        if stability:
+            response["grade_stability"] = grader.grade_stability(issues)
+        return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error grading issues: {str(e)}")
         print(e)
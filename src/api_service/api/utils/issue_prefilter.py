@@ -0,0 +1,95 @@
+import re
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+# Function words plus words nearly every catalog issue shares; they carry no topic
+_STOPWORDS = frozenset("""
+a about after all also an and any are as at be been before by can could do does for from has have
+if in into is it its may more must no not of on or other our over such than that the their them
+then there these they this those through to under up upon us we were what when where which while
+who will with within without would you your yours service services
+""".split())
+
+
+def _stem(token: str) -> str:
+    """Strip common English suffixes so "share", "shares", "shared" and "sharing" meet."""
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if len(token) - len(suffix) >= 3 and token.endswith(suffix):
+            token = token[:-len(suffix)]
+            break
+    return token[:-1] if len(token) > 3 and token.endswith('e') else token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, stemmed content words of a text."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+class IssueIndex:
+    """
+    BM25 ranking of catalog issues against the sections of one document.
+
+    Each catalog line ("parent: issue") is a query made of its issue text only; the parent
+    would add the same terms to every issue of a category. The document's sections are the
+    collection, so a term's IDF reflects how specific it is within that document. Query terms
+    are weighted by how rare they are across the catalog, and each issue's score is divided
+    by its total query weight, so long catalog lines do not outrank short ones just by having
+    more terms to match. Catalog lines are tokenized once into an issue x term matrix over
+    the catalog's own vocabulary; scoring a document only counts those terms in its sections,
+    and every issue is scored against every section in one matrix product.
+    """
+
+    def __init__(self, lines: List[str], k1: float = 1.2, b: float = 0.75):
+        self.lines = lines
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, line in enumerate(lines):
+            for token in set(tokenize(line.split(': ', 1)[-1])):
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+        self.issue_terms = np.zeros((len(lines), len(self.vocabulary)), dtype=np.float64)
+        self.issue_terms[rows, cols] = 1.0
+        # Catalog IDF of each query term, and each issue's total, to normalize its score by
+        self.issue_terms *= np.log1p(len(lines) / np.maximum(self.issue_terms.sum(axis=0), 1.0))
+        self.query_weight = np.maximum(self.issue_terms.sum(axis=1), np.finfo(np.float64).tiny)
+
+    def score(self, sections: List[str]) -> np.ndarray:
+        """Normalized BM25 score of every issue (rows) against every section (columns)."""
+        n_terms = len(self.vocabulary)
+        term_counts = np.zeros((len(sections), n_terms), dtype=np.float64)
+        lengths = np.zeros(len(sections), dtype=np.float64)
+        for row, section in enumerate(sections):
+            tokens = tokenize(section)
+            lengths[row] = len(tokens)
+            ids = [self.vocabulary[token] for token in tokens if token in self.vocabulary]
+            if ids:
+                term_counts[row] = np.bincount(ids, minlength=n_terms)
+
+        if not sections or not lengths.any():
+            return np.zeros((len(self.lines), len(sections)))
+        document_frequency = np.count_nonzero(term_counts, axis=0)
+        idf = np.log1p((len(sections) - document_frequency + 0.5) / (document_frequency + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * lengths / lengths.mean())
+        weights = idf * term_counts * (self.k1 + 1) / (term_counts + norm[:, None])
+        return (self.issue_terms @ weights.T) / self.query_weight[:, None]
+
+    def select(self, sections: List[str], top_issues: int,
+               top_sections: Optional[int] = None) -> Tuple[List[int], List[int]]:
+        """
+        Return the top_issues catalog lines by their best section's score, and the
+        top_sections sections (all when None) that best match any chosen issue. Both are
+        returned in their original order.
+        """
+        scores = self.score(sections)
+        best = scores.max(axis=1) if sections else np.zeros(len(self.lines))
+        # Stable sort: ties keep catalog order, so the selection is deterministic
+        issues = np.sort(np.argsort(-best, kind='stable')[:top_issues])
+        if top_sections is None or not sections:
+            return issues.tolist(), list(range(len(sections)))
+        relevance = scores[issues].max(axis=0) if len(issues) else np.zeros(len(sections))
+        kept = np.sort(np.argsort(-relevance, kind='stable')[:top_sections])
+        return issues.tolist(), kept.tolist()
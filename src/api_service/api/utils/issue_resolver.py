@@ -0,0 +1,106 @@
+import re
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+@dataclass(frozen=True)
+class ResolvedIssue:
+    """An unknown issue string matched to a catalog issue."""
+    original: str
+    resolved: str
+    score: float
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of the lowercased, punctuation-free text, padded at the edges."""
+    normalized = f" {_NON_ALNUM.sub(' ', text.lower()).strip()} "
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+class IssueResolver:
+    """
+    Resolve paraphrased issue strings to the nearest catalog issue.
+
+    Catalog issues are indexed once as a trigram -> catalog id inverted index. A query only
+    touches the posting lists of its own trigrams, and the overlap counts for a whole
+    batch of queries against every catalog entry come out of a single bincount;
+    similarity is the Dice coefficient of the two trigram sets.
+    """
+
+    def __init__(self, issue_index: Dict[Tuple[str, str], "CompiledIssue"], threshold: float = 0.8):
+        self.threshold = threshold
+        self.canonical_issues: List[str] = []
+        sizes = []
+        postings: Dict[str, List[int]] = {}
+
+        for entry in issue_index.values():
+            catalog_id = len(self.canonical_issues)
+            self.canonical_issues.append(f"{entry.parent_issue}: {entry.privacy_issue}")
+            grams = _trigrams(entry.privacy_issue)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(catalog_id)
+
+        self.catalog_sizes = np.array(sizes, dtype=np.float64)
+        self.postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+
+    def score(self, issues: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return each issue's best catalog id (-1 if nothing overlaps) and its Dice score. All
+        queries share one concatenate/bincount over the posting lists they touch.
+        """
+        n_catalog = len(self.canonical_issues)
+        hits = []
+        hit_rows = []
+        hit_lengths = []
+        query_sizes = np.empty(len(issues), dtype=np.float64)
+
+        for row, issue in enumerate(issues):
+            # Compare only the issue part; the parent may be "Unknown" or a near miss
+            privacy_issue = issue.split(':', 1)[1] if ':' in issue else issue
+            grams = _trigrams(privacy_issue)
+            query_sizes[row] = len(grams)
+            for gram in grams:
+                posting = self.postings.get(gram)
+                if posting is not None:
+                    hits.append(posting)
+                    hit_rows.append(row)
+                    hit_lengths.append(len(posting))
+
+        if not hits or n_catalog == 0:
+            return np.full(len(issues), -1), np.zeros(len(issues))
+
+        flat = np.repeat(np.array(hit_rows, dtype=np.int64) * n_catalog, hit_lengths) + np.concatenate(hits)
+        overlaps = np.bincount(flat, minlength=len(issues) * n_catalog).reshape(len(issues), n_catalog)
+        scores = 2.0 * overlaps / (query_sizes[:, None] + self.catalog_sizes[None, :])
+
+        best = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(issues)), best]
+        return np.where(best_scores > 0, best, -1), best_scores
+
+    def best_match(self, issue: str) -> Tuple[Optional[str], float]:
+        """Return the most similar catalog issue (as 'Parent: Issue') and its score."""
+        best, scores = self.score([issue])
+        if best[0] < 0:
+            return None, 0.0
+        return self.canonical_issues[best[0]], float(scores[0])
+
+    def resolve(self, issues: List[str]) -> Tuple[List[ResolvedIssue], List[str]]:
+        """Split issues into those resolved above the threshold and those still unknown."""
+        resolved = []
+        unresolved = []
+        if not issues:
+            return resolved, unresolved
+
+        best, scores = self.score(issues)
+        for issue, catalog_id, score in zip(issues, best.tolist(), scores.tolist()):
+            if catalog_id >= 0 and score >= self.threshold:
+                resolved.append(ResolvedIssue(
+                    original=issue, resolved=self.canonical_issues[catalog_id], score=round(score, 4)
+                ))
+            else:
+                unresolved.append(issue)
+        return resolved, unresolved
@@ -1,27 +1,216 @@
+import asyncio
+import functools
+import hashlib
+import io
+import logging
 import os
+import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 import fitz  # PyMuPDF for PDF extraction
 import vertexai
 import pandas as pd
 from vertexai.generative_models import GenerativeModel
+from api_service.api.utils.analysis_cache import AnalysisCache, content_digest
+from api_service.api.utils.issue_prefilter import IssueIndex
+from api_service.api.utils.text_normalizer import NormalizedText, normalize_pages
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from a PDF file."""
-    text = ""
+# PDF extraction workers for the API (1 = serial); large documents are split across them
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "1"))
+
+# Documents estimated above this many tokens are analyzed in overlapping sections (0 = never),
+# with up to PDF_ANALYSIS_CONCURRENCY model calls in flight
+PDF_CHUNK_TOKENS = int(os.getenv("PDF_CHUNK_TOKENS", "0")) or None
+PDF_ANALYSIS_CONCURRENCY = int(os.getenv("PDF_ANALYSIS_CONCURRENCY", "4"))
+
+# Send only the PDF_PREFILTER_ISSUES catalog issues ranked most relevant (0 = the full catalog),
+# with the PDF_PREFILTER_SECTIONS passages that best match them (0 = the whole text). Off by
+# default: lexical ranking misses real findings (see PREFILTER_TOP_ISSUES), so this is not a
+# free way to cut tokens
+PDF_PREFILTER_ISSUES = int(os.getenv("PDF_PREFILTER_ISSUES", "0")) or None
+PDF_PREFILTER_SECTIONS = int(os.getenv("PDF_PREFILTER_SECTIONS", "0")) or None
+
+# Drop repeated page headers/footers and duplicate paragraphs before prompting (1 = on). Off by
+# default like the other PDF_* switches: it changes the prompt, so it is opted into per deployment
+PDF_NORMALIZE_TEXT = os.getenv("PDF_NORMALIZE_TEXT", "0") != "0"
+
+# The issue catalog next to this module; get_issue_catalog(MAPPING_CSV_PATH) is preloaded at startup
+MAPPING_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mapping_df.csv")
+
+# Documents shorter than this are always extracted serially; a process pool costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 200
+
+
+class PdfPage(NamedTuple):
+    """Text of one PDF page; page numbers start at 1."""
+    number: int
+    text: str
+
+
+def _page_text(page, paragraphs: bool = False) -> str:
+    """A page's text; with paragraphs, its text blocks are separated by blank lines."""
+    if not paragraphs:
+        return page.get_text()
+    return "".join(block[4].rstrip("\n") + "\n\n" for block in page.get_text("blocks") if block[6] == 0)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int, paragraphs: bool = False) -> List[str]:
+    """Pool worker: open the document independently and extract pages [start, stop) in order."""
     with fitz.open(pdf_path) as pdf:
-        for page_num in range(pdf.page_count):
-            page = pdf[page_num]
-            text += page.get_text()
-    return text
+        return [_page_text(pdf[page_num], paragraphs) for page_num in range(start, stop)]
 
 
-def load_privacy_issues(csv_path: str) -> str:
-    """Load privacy issues from CSV and format them as a string."""
-    df = pd.read_csv(csv_path)
+# Process-wide page extraction pools by worker count, started on first use and reused
+_page_pools: Dict[int, ProcessPoolExecutor] = {}
+_page_pools_lock = threading.Lock()
+
+
+def get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared extraction pool with this many workers, starting it on first use."""
+    pool = _page_pools.get(workers)
+    if pool is None:
+        with _page_pools_lock:
+            pool = _page_pools.get(workers)
+            if pool is None:
+                pool = _page_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def _parallel_page_texts(pdf_path: str, page_count: int, workers: int,
+                         paragraphs: bool = False) -> Iterator[str]:
+    """Split the pages into one contiguous range per worker and yield their texts in page order."""
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    pool = get_page_pool(workers)
+    futures = []
+    try:
+        for start, stop in zip(bounds, bounds[1:]):
+            if stop > start:
+                futures.append(pool.submit(_extract_page_range, pdf_path, start, stop, paragraphs))
+        for future in futures:
+            yield from future.result()
+    except BrokenProcessPool:
+        # A worker died; the next extraction starts a fresh pool
+        with _page_pools_lock:
+            if _page_pools.get(workers) is pool:
+                del _page_pools[workers]
+        raise
+    finally:
+        # Stopping early (max_chars) drops the ranges nobody will read; the pool stays up
+        for future in futures:
+            future.cancel()
+
+
+def iter_pdf_pages(pdf_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                   workers: Optional[int] = None, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+                   paragraphs: bool = False) -> Iterator[PdfPage]:
+    """
+    Yield a PDF's pages one at a time, so only the current page's text is held.
+    Extraction stops after max_pages pages, or once max_chars characters have been yielded
+    (the page that crosses the limit is cut off at it). With workers > 1, documents of at
+    least parallel_threshold pages are extracted across a process pool. With paragraphs,
+    each text block of a page ends with a blank line.
+    """
+    remaining = max_chars
+    if remaining is not None and remaining <= 0:
+        return
+    with fitz.open(pdf_path) as pdf:
+        page_count = pdf.page_count if max_pages is None else min(max_pages, pdf.page_count)
+        if workers is not None and workers > 1 and page_count >= parallel_threshold:
+            texts = _parallel_page_texts(pdf_path, page_count, workers, paragraphs)
+        else:
+            texts = (_page_text(pdf[page_num], paragraphs) for page_num in range(page_count))
+
+        try:
+            for page_num, text in enumerate(texts):
+                if remaining is not None:
+                    text = text[:remaining]
+                    remaining -= len(text)
+                yield PdfPage(page_num + 1, text)
+                if remaining is not None and remaining <= 0:
+                    return
+        finally:
+            texts.close()
+
+
+def join_pages(pages: Iterable[PdfPage]) -> str:
+    """Assemble page texts into one string in a single pass."""
+    return "".join(page.text for page in pages)
+
+
+def extract_text_from_pdf(pdf_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                          workers: Optional[int] = None) -> str:
+    """Extract text from a PDF file."""
+    return join_pages(iter_pdf_pages(pdf_path, max_pages, max_chars, workers))
+
+
+def extract_pdf_text(pdf_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                     workers: Optional[int] = None, normalize: bool = False) -> NormalizedText:
+    """
+    Extract a PDF's text for prompting: as extracted, or normalized (see normalize_pages) with
+    normalize. Normalization reads pages as text blocks, so paragraphs are known, and logs
+    what it saved.
+    """
+    if not normalize:
+        text = extract_text_from_pdf(pdf_path, max_pages, max_chars, workers)
+        return NormalizedText(text=text, original_chars=len(text), repeated_lines=0, duplicate_paragraphs=0)
+    pages = iter_pdf_pages(pdf_path, max_pages, max_chars, workers, paragraphs=True)
+    normalized = normalize_pages(page.text for page in pages)
+    logging.info(
+        f"Normalized {os.path.basename(pdf_path)}: {normalized.chars_saved} characters "
+        f"(~{tokens_saved(normalized)} tokens) saved, {normalized.repeated_lines} header/footer lines "
+        f"and {normalized.duplicate_paragraphs} duplicate paragraphs dropped"
+    )
+    return normalized
+
+
+@dataclass(frozen=True)
+class IssueCatalog:
+    """The issue catalog in the two forms a PDF analysis needs, loaded from the mapping CSV once."""
+    prompt_block: str                  # "parent: issue" lines listed in the prompt
+    parent_by_issue: Mapping[str, str]  # Lowercase issue -> parent issue, read-only
+    digest: str                        # SHA-256 of the CSV, for analysis cache keys
+
+
+def load_issue_catalog(csv_path: str) -> IssueCatalog:
+    """Read the mapping CSV once and build the prompt block and issue lookup from it."""
+    with open(csv_path, 'rb') as f:
+        data = f.read()
+    df = pd.read_csv(io.BytesIO(data))
     # Combine parent issue and privacy issue into a single string for each row
-    issues = "\n".join(
-        f"{row['parent_issue']}: {row['privacy_issue']}" for _, row in df.iterrows()
+    prompt_block = "\n".join(df['parent_issue'].astype(str) + ": " + df['privacy_issue'].astype(str))
+    return IssueCatalog(
+        prompt_block=prompt_block,
+        parent_by_issue=MappingProxyType(dict(zip(df['privacy_issue'].str.lower(), df['parent_issue']))),
+        digest=hashlib.sha256(data).hexdigest()
     )
-    return issues
+
+
+# Process-wide catalogs by CSV path, each with the (mtime, size) signature it was loaded at
+_issue_catalogs: Dict[str, Tuple[Tuple[int, int], IssueCatalog]] = {}
+_issue_catalogs_lock = threading.Lock()
+
+
+def get_issue_catalog(csv_path: str) -> IssueCatalog:
+    """Return the shared catalog for csv_path, reloading it only when the file changes."""
+    stat = os.stat(csv_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _issue_catalogs.get(csv_path)
+    if cached is None or cached[0] != signature:
+        with _issue_catalogs_lock:
+            cached = _issue_catalogs.get(csv_path)
+            if cached is None or cached[0] != signature:
+                cached = _issue_catalogs[csv_path] = (signature, load_issue_catalog(csv_path))
+    return cached[1]
+
+
+def load_privacy_issues(csv_path: str) -> str:
+    """Load privacy issues from CSV and format them as a string."""
+    return get_issue_catalog(csv_path).prompt_block
 
 # Define your generation configuration
 generation_config = {
@@ -30,60 +219,402 @@ generation_config = {
     "top_p": 0.95,
 }
 
+class ModelPool:
+    """
+    GenerativeModel handles shared across requests, one per (project, location, endpoint).
 
-def process_pdf_privacy_issues(pdf_path: str, project_id: str, location_id: str, endpoint_id: str):
+    Handles are built lazily on first use: vertexai.init runs once per (project, location),
+    and each model keeps its own prediction client, so auth and channel setup are paid once
+    per endpoint rather than once per upload. Chat sessions carry history and stay
+    per-request. model_factory and init default to GenerativeModel and vertexai.init and can
+    be replaced with fakes in tests. Safe to share between threads.
     """
-    Extracts text from a PDF and sends it to the Vertex AI model for analysis.
+
+    def __init__(self, model_factory: Callable[[str], Any] = None, init: Callable[..., None] = None):
+        self.model_factory = model_factory
+        self.init = init
+        self.setup_seconds: Dict[Tuple[str, str, str], float] = {}
+        self._models: Dict[Tuple[str, str, str], Any] = {}
+        self._initialized = set()
+        self._lock = threading.Lock()
+
+    def get(self, project_id: str, location_id: str, endpoint_id: str):
+        """Return the shared model handle for an endpoint, building it on first use."""
+        key = (project_id, location_id, endpoint_id)
+        model = self._models.get(key)
+        if model is None:
+            with self._lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = self._models[key] = self._build(*key)
+        return model
+
+    def _build(self, project_id: str, location_id: str, endpoint_id: str):
+        start = time.perf_counter()
+        if (project_id, location_id) not in self._initialized:
+            (self.init or vertexai.init)(project=project_id, location=location_id)
+            self._initialized.add((project_id, location_id))
+        model = (self.model_factory or GenerativeModel)(
+            f"projects/{project_id}/locations/{location_id}/endpoints/{endpoint_id}"
+        )
+        seconds = self.setup_seconds[(project_id, location_id, endpoint_id)] = time.perf_counter() - start
+        logging.info(f"Built model handle for endpoint {endpoint_id} in {seconds * 1e3:.1f}ms")
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._initialized.clear()
+            self.setup_seconds.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# Model handles shared by every analysis in this process
+MODEL_POOL = ModelPool()
+
+# Rough prompt-size estimate: English text averages about four characters per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def tokens_saved(normalized: NormalizedText) -> int:
+    """Estimated prompt tokens that normalization removed."""
+    return -(-normalized.original_chars // CHARS_PER_TOKEN) - estimate_tokens(normalized.text)
+
+
+def _section_units(text: str, max_chars: int) -> List[str]:
+    """Paragraphs, with any paragraph over max_chars split into lines and any such line cut to size."""
+    units = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        if not paragraph.strip():
+            continue
+        if len(paragraph) <= max_chars:
+            units.append(paragraph)
+            continue
+        for line in paragraph.split('\n'):
+            units.extend(line[i:i + max_chars] for i in range(0, len(line), max_chars) if line[i:i + max_chars].strip())
+    return units
+
+
+def split_sections(text: str, max_tokens: int = 2000, overlap_tokens: int = 200) -> List[str]:
     """
-    # Step 1: Extract text from PDF
-    input_text = extract_text_from_pdf(pdf_path)
-    
-    # Dynamically locate the CSV path
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(current_dir, "mapping_df.csv")
-    
-    privacy_issues = load_privacy_issues(csv_path)
-    
-    # Step 2: Initialize Vertex AI
-    vertexai.init(project=project_id, location=location_id)
-    
-    # Step 3: Initialize the Generative Model with your endpoint
-    model = GenerativeModel(
-        f"projects/{project_id}/locations/{location_id}/endpoints/{endpoint_id}"
-    )
-    
-    # Step 4: Start a chat session
-    chat = model.start_chat()
-    
-    # Step 5: Send messages to the model
-    response = chat.send_message(
-        [
-            f"Privacy Issues List:\n{privacy_issues}",
-            f"Extracted PDF Text:\n{input_text}",
-            "Which privacy issues from the list are found in the text above?",
-        ],
-        generation_config=generation_config,
-    )
-    # Step 6: Print the response
-    response_list = [item.strip() for item in response.text.split(',')]
-    
-    # Print the response for verification
-    mapping_df = pd.read_csv(csv_path)
-    mapping_dict = dict(zip(mapping_df['privacy_issue'].str.lower(), mapping_df['parent_issue']))
+    Split text into sections of at most max_tokens (estimated) along paragraph boundaries.
+    Each section starts with up to overlap_tokens of the previous section's trailing
+    paragraphs, so an issue described across a boundary is seen whole at least once.
+    """
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be at least 0 and less than max_tokens")
+    max_chars, overlap_chars = max_tokens * CHARS_PER_TOKEN, overlap_tokens * CHARS_PER_TOKEN
+
+    sections, current, current_chars = [], [], 0
+    for unit in _section_units(text, max_chars):
+        unit_chars = len(unit) + 2  # Units are joined by a blank line
+        if current and current_chars + unit_chars > max_chars + 2:
+            sections.append("\n\n".join(current))
+            carried, carried_chars = [], 0
+            for previous in reversed(current):
+                if carried_chars + len(previous) + 2 > overlap_chars:
+                    break
+                carried.insert(0, previous)
+                carried_chars += len(previous) + 2
+            current, current_chars = carried, carried_chars
+            while current and current_chars + unit_chars > max_chars + 2:
+                current_chars -= len(current.pop(0)) + 2
+        current.append(unit)
+        current_chars += unit_chars
+    if current:
+        sections.append("\n\n".join(current))
+    return sections
+
+
+def merge_issue_lists(issue_lists: Iterable[List[str]]) -> List[str]:
+    """Union of per-section issue lists, case-insensitively de-duplicated, in first-seen order."""
+    seen, merged = set(), []
+    for issues in issue_lists:
+        for issue in issues:
+            key = issue.lower()
+            if key not in seen:
+                seen.add(key)
+                merged.append(issue)
+    return merged
+
+
+# Process-wide BM25 indexes of the catalog issues, by catalog digest
+_issue_indexes: Dict[str, IssueIndex] = {}
+_issue_indexes_lock = threading.Lock()
+
+# Passage size for the pre-filter: small enough that kept sections are mostly on-topic
+PREFILTER_SECTION_TOKENS = 300
+# Candidates kept when a pre-filter is asked for without a size. On the hand-labelled bundled
+# PDFs (tests/data/prefilter_labels.csv) it keeps about 80% of the real findings; smaller
+# values drop far more, so the pre-filter trades recall for tokens and stays opt-in
+PREFILTER_TOP_ISSUES = 160
+
+
+def get_issue_index(catalog: IssueCatalog) -> IssueIndex:
+    """Return the shared IssueIndex of a catalog's prompt lines, building it on first use."""
+    index = _issue_indexes.get(catalog.digest)
+    if index is None:
+        with _issue_indexes_lock:
+            index = _issue_indexes.get(catalog.digest)
+            if index is None:
+                index = _issue_indexes[catalog.digest] = IssueIndex(catalog.prompt_block.split("\n"))
+    return index
+
+
+def prefilter(catalog: IssueCatalog, text: str, top_issues: int = PREFILTER_TOP_ISSUES,
+              top_sections: Optional[int] = None,
+              section_tokens: int = PREFILTER_SECTION_TOKENS) -> Tuple[IssueCatalog, str]:
+    """
+    Narrow an analysis to the top_issues catalog issues that rank highest (BM25) against the
+    text's sections and, with top_sections, the text to the sections that best match them.
+    The narrowed catalog keeps the full issue lookup, so any issue the model names is formatted.
+    """
+    sections = split_sections(text, section_tokens, 0)
+    index = get_issue_index(catalog)
+    issues, kept = index.select(sections, top_issues, top_sections)
+    narrowed = replace(catalog, prompt_block="\n".join(index.lines[i] for i in issues))
+    if top_sections is None:
+        return narrowed, text
+    return narrowed, "\n\n".join(sections[i] for i in kept)
+
+
+def _issue_messages(catalog: IssueCatalog, text: str) -> List[str]:
+    """The prompt asking which catalog issues a text contains."""
+    return [
+        f"Privacy Issues List:\n{catalog.prompt_block}",
+        f"Extracted PDF Text:\n{text}",
+        "Which privacy issues from the list are found in the text above?",
+    ]
+
+
+def _format_issues(catalog: IssueCatalog, response_text: str) -> List[str]:
+    """Format the model's comma-separated answer as "parent: issue" strings."""
+    # Sections without findings come back empty; skip blank items rather than reporting "Unknown: "
+    response_list = [item.strip() for item in response_text.split(',') if item.strip()]
 
     # Format response list with parent issues
     formatted_response_list = []
     for issue in response_list:
         issue_lower = issue.lower()
-        parent_issue = mapping_dict.get(issue_lower, "Unknown")
+        parent_issue = catalog.parent_by_issue.get(issue_lower, "Unknown")
         formatted_response_list.append(f"{parent_issue}: {issue}")
+    return formatted_response_list
+
+
+def identify_issues(model, catalog: IssueCatalog, text: str) -> List[str]:
+    """Ask the model which catalog issues a text contains, formatted as "parent: issue"."""
+    # Step 4: Start a chat session
+    chat = model.start_chat()
+
+    # Step 5: Send messages to the model
+    response = chat.send_message(_issue_messages(catalog, text), generation_config=generation_config)
+    # Step 6: Format the response with parent issues
+    return _format_issues(catalog, response.text)
+
+
+def analyze_sections(model, catalog: IssueCatalog, sections: List[str], concurrency: int = 4) -> List[str]:
+    """Analyze sections concurrently (at most concurrency model calls in flight) and merge the results."""
+    if not sections:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(sections)))) as executor:
+        issue_lists = list(executor.map(lambda section: identify_issues(model, catalog, section), sections))
+    return merge_issue_lists(issue_lists)
+
+
+async def identify_issues_async(model, catalog: IssueCatalog, text: str) -> List[str]:
+    """identify_issues through the SDK's async API, so the event loop keeps serving while the model answers."""
+    chat = model.start_chat()
+    response = await chat.send_message_async(_issue_messages(catalog, text), generation_config=generation_config)
+    return _format_issues(catalog, response.text)
+
+
+async def analyze_sections_async(model, catalog: IssueCatalog, sections: List[str],
+                                 concurrency: int = 4) -> List[str]:
+    """analyze_sections on the event loop: at most concurrency awaited model calls at a time."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def analyze(section: str) -> List[str]:
+        async with semaphore:
+            return await identify_issues_async(model, catalog, section)
+
+    return merge_issue_lists(await asyncio.gather(*(analyze(section) for section in sections)))
+
+
+# Bump when the prompt wording or response parsing changes, so cached analyses are not reused
+PROMPT_VERSION = "2"
+
+
+@dataclass(frozen=True)
+class PdfAnalysis:
+    """A PDF's extracted text and formatted issues, and whether they came from the analysis cache."""
+    text: str
+    issues: List[str]
+    cache_hit: bool = False
+    chars_saved: int = 0   # Removed by normalization before prompting
+    tokens_saved: int = 0
+
+
+def prompt_version(csv_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                   chunk_tokens: Optional[int] = None, chunk_overlap_tokens: int = 200,
+                   top_issues: Optional[int] = None, top_sections: Optional[int] = None,
+                   normalize: bool = False) -> str:
+    """
+    Everything besides the PDF and endpoint that changes an analysis: prompt, issue catalog,
+    limits, normalization, chunking and pre-filtering.
+    """
+    version = f"{PROMPT_VERSION}:{get_issue_catalog(csv_path).digest[:16]}:{max_pages}:{max_chars}"
+    if chunk_tokens is not None:
+        version += f":chunks={chunk_tokens}/{chunk_overlap_tokens}"
+    if top_issues is not None:
+        version += f":prefilter={top_issues}/{top_sections}"
+    if normalize:
+        version += ":normalized"
+    return version
+
+
+def analyze_pdf(pdf_path: str, project_id: str, location_id: str, endpoint_id: str,
+                max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                workers: Optional[int] = PDF_EXTRACT_WORKERS, cache: Optional[AnalysisCache] = None,
+                models: Optional[ModelPool] = None, chunk_tokens: Optional[int] = PDF_CHUNK_TOKENS,
+                chunk_overlap_tokens: int = 200, concurrency: int = PDF_ANALYSIS_CONCURRENCY,
+                top_issues: Optional[int] = PDF_PREFILTER_ISSUES,
+                top_sections: Optional[int] = PDF_PREFILTER_SECTIONS,
+                normalize: bool = PDF_NORMALIZE_TEXT) -> PdfAnalysis:
+    """
+    Extracts text from a PDF and sends it to the Vertex AI model for analysis.
+    max_pages and max_chars bound how much of the document is extracted, and workers
+    splits large documents across a process pool. With normalize, repeated page
+    headers/footers and duplicate paragraphs are dropped first (see extract_pdf_text). With a cache, a PDF whose bytes were
+    already analyzed by the same endpoint and prompt is answered without either step.
+    Model handles come from models (the process-wide MODEL_POOL by default). Text estimated
+    above chunk_tokens is split into overlapping sections that are analyzed concurrently,
+    at most concurrency at a time, and their issues merged. With top_issues, the prompt lists
+    only that many catalog issues, ranked locally against the text (see prefilter), and with
+    top_sections only the best matching passages of the text are sent.
+    """
+    csv_path = MAPPING_CSV_PATH
+    endpoint = f"projects/{project_id}/locations/{location_id}/endpoints/{endpoint_id}"
+    if cache is not None:
+        cache_key = (content_digest(pdf_path), endpoint,
+                     prompt_version(csv_path, max_pages, max_chars, chunk_tokens, chunk_overlap_tokens,
+                                    top_issues, top_sections, normalize))
+        cached = cache.get(*cache_key)
+        if cached is not None:
+            return PdfAnalysis(text=cached.text, issues=cached.issues, cache_hit=True,
+                               chars_saved=cached.chars_saved, tokens_saved=cached.tokens_saved)
+
+    # Step 1: Extract text from PDF, normalized for prompting
+    extracted = extract_pdf_text(pdf_path, max_pages, max_chars, workers, normalize)
+    input_text = extracted.text
     
+    catalog = get_issue_catalog(csv_path)
+
+    # Narrow the prompt to the catalog issues (and passages) that rank as relevant
+    model_text = input_text
+    if top_issues is not None:
+        catalog, model_text = prefilter(catalog, input_text, top_issues, top_sections)
+    
+    # Steps 2-3: Reuse (or lazily build) the Vertex AI model handle for this endpoint
+    model = (MODEL_POOL if models is None else models).get(project_id, location_id, endpoint_id)
+    
+    # Steps 4-6: Ask the model in one call, or section by section for long documents
+    if chunk_tokens is not None and estimate_tokens(model_text) > chunk_tokens:
+        sections = split_sections(model_text, chunk_tokens, chunk_overlap_tokens)
+        formatted_response_list = analyze_sections(model, catalog, sections, concurrency)
+    else:
+        formatted_response_list = identify_issues(model, catalog, model_text)
+
     # Print the response for verification
     print("Model Response (with parent issues):")
     for issue in formatted_response_list:
         print(f"- {issue}")
-    
-    return formatted_response_list
+
+    if cache is not None:
+        cache.put(*cache_key, text=input_text, issues=formatted_response_list,
+                  chars_saved=extracted.chars_saved, tokens_saved=tokens_saved(extracted))
+    return PdfAnalysis(text=input_text, issues=formatted_response_list,
+                       chars_saved=extracted.chars_saved, tokens_saved=tokens_saved(extracted))
+
+
+async def analyze_pdf_async(pdf_path: str, project_id: str, location_id: str, endpoint_id: str,
+                            max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                            workers: Optional[int] = PDF_EXTRACT_WORKERS, cache: Optional[AnalysisCache] = None,
+                            models: Optional[ModelPool] = None, chunk_tokens: Optional[int] = PDF_CHUNK_TOKENS,
+                            chunk_overlap_tokens: int = 200, concurrency: int = PDF_ANALYSIS_CONCURRENCY,
+                            top_issues: Optional[int] = PDF_PREFILTER_ISSUES,
+                            top_sections: Optional[int] = PDF_PREFILTER_SECTIONS,
+                            normalize: bool = PDF_NORMALIZE_TEXT,
+                            executor: Optional[Executor] = None) -> PdfAnalysis:
+    """
+    analyze_pdf for an event loop. Hashing, cache lookups, text extraction and everything else
+    that can block (loading the issue catalog, initializing Vertex AI for a new endpoint,
+    pre-filtering, splitting long texts) run in executor (the loop's default thread pool unless
+    given), and model calls are awaited through the async API, so one worker can keep many uploads in flight.
+    """
+    csv_path = MAPPING_CSV_PATH
+    loop = asyncio.get_running_loop()
+    endpoint = f"projects/{project_id}/locations/{location_id}/endpoints/{endpoint_id}"
+    if cache is not None:
+        digest = await loop.run_in_executor(executor, content_digest, pdf_path)
+        # The prompt version includes the catalog digest, so it may load the catalog's CSV
+        version = await loop.run_in_executor(executor, functools.partial(
+            prompt_version, csv_path, max_pages, max_chars, chunk_tokens, chunk_overlap_tokens,
+            top_issues, top_sections, normalize
+        ))
+        cache_key = (digest, endpoint, version)
+        cached = await loop.run_in_executor(executor, cache.get, *cache_key)
+        if cached is not None:
+            return PdfAnalysis(text=cached.text, issues=cached.issues, cache_hit=True,
+                               chars_saved=cached.chars_saved, tokens_saved=cached.tokens_saved)
+
+    extracted = await loop.run_in_executor(
+        executor, extract_pdf_text, pdf_path, max_pages, max_chars, workers, normalize
+    )
+    input_text = extracted.text
+    catalog = await loop.run_in_executor(executor, get_issue_catalog, csv_path)
+    model_text = input_text
+    if top_issues is not None:
+        catalog, model_text = await loop.run_in_executor(
+            executor, prefilter, catalog, input_text, top_issues, top_sections
+        )
+    # The first handle for a project and location runs vertexai.init under the pool's lock
+    model = await loop.run_in_executor(
+        executor, (MODEL_POOL if models is None else models).get, project_id, location_id, endpoint_id
+    )
+
+    if chunk_tokens is not None and estimate_tokens(model_text) > chunk_tokens:
+        sections = await loop.run_in_executor(
+            executor, split_sections, model_text, chunk_tokens, chunk_overlap_tokens
+        )
+        formatted_response_list = await analyze_sections_async(model, catalog, sections, concurrency)
+    else:
+        formatted_response_list = await identify_issues_async(model, catalog, model_text)
+
+    print("Model Response (with parent issues):")
+    for issue in formatted_response_list:
+        print(f"- {issue}")
+
+    if cache is not None:
+        await loop.run_in_executor(
+            executor, functools.partial(cache.put, *cache_key, text=input_text, issues=formatted_response_list,
+                                        chars_saved=extracted.chars_saved, tokens_saved=tokens_saved(extracted))
+        )
+    return PdfAnalysis(text=input_text, issues=formatted_response_list,
+                       chars_saved=extracted.chars_saved, tokens_saved=tokens_saved(extracted))
+
+
+def process_pdf_privacy_issues(pdf_path: str, project_id: str, location_id: str, endpoint_id: str,
+                               max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                               workers: Optional[int] = PDF_EXTRACT_WORKERS,
+                               cache: Optional[AnalysisCache] = None) -> List[str]:
+    """Extract and analyze a PDF (see analyze_pdf), returning just the formatted issue list."""
+    return analyze_pdf(pdf_path, project_id, location_id, endpoint_id, max_pages, max_chars, workers, cache).issues
 
 # Example usage
 if __name__ == "__main__":
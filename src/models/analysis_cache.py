@@ -0,0 +1,173 @@
+"""
+Content-addressed cache of PDF analysis results.
+
+An analysis is keyed by the SHA-256 of the PDF's bytes, the model endpoint and the prompt
+version, so re-uploading a popular policy skips both text extraction and the model call.
+Entries (compressed extracted text, the formatted issue list and what normalization saved) live in one SQLite file
+that is kept under max_bytes by evicting the least recently used entries.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Access order is a counter rather than wall time, so LRU order never depends on clock
+# resolution. It is read from the file inside the writing statement, so processes sharing one
+# database keep one order; the lookup walks the last_access index
+_NEXT_ACCESS = '(SELECT COALESCE(MAX(last_access), 0) + 1 FROM analyses)'
+
+
+@dataclass(frozen=True)
+class CachedAnalysis:
+    """A stored analysis of one PDF."""
+    text: str
+    issues: List[str]
+    chars_saved: int = 0   # Removed by normalization before prompting
+    tokens_saved: int = 0
+
+
+def content_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Bounded LRU store of PDF analyses in an embedded SQLite database.
+
+    Lookups go through the (content_sha256, model, prompt_version) primary key. Each hit
+    refreshes the entry's access time, and every insert evicts the least recently used
+    entries until the stored bytes fit in max_bytes. Safe to share between threads.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.execute(
+                '''CREATE TABLE IF NOT EXISTS analyses (
+                       content_sha256 TEXT NOT NULL,
+                       model TEXT NOT NULL,
+                       prompt_version TEXT NOT NULL,
+                       text BLOB NOT NULL,
+                       issues TEXT NOT NULL,
+                       chars_saved INTEGER NOT NULL DEFAULT 0,
+                       tokens_saved INTEGER NOT NULL DEFAULT 0,
+                       size INTEGER NOT NULL,
+                       last_access INTEGER NOT NULL,
+                       PRIMARY KEY (content_sha256, model, prompt_version)
+                   ) WITHOUT ROWID'''
+            )
+            self.connection.execute('CREATE INDEX IF NOT EXISTS analyses_lru ON analyses (last_access)')
+            # Files written before savings were stored report 0 for their existing entries
+            columns = {row[1] for row in self.connection.execute('PRAGMA table_info(analyses)')}
+            for column in ('chars_saved', 'tokens_saved'):
+                if column not in columns:
+                    self.connection.execute(f'ALTER TABLE analyses ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0')
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "AnalysisCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connection.execute('SELECT COUNT(*) FROM analyses').fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM analyses').fetchone()[0]
+
+    def get(self, content_sha256: str, model: str, prompt_version: str) -> Optional[CachedAnalysis]:
+        """Return a stored analysis (refreshing its LRU position), or None."""
+        key = (content_sha256, model, prompt_version)
+        with self._lock:
+            row = self.connection.execute(
+                'SELECT text, issues, chars_saved, tokens_saved FROM analyses WHERE content_sha256 = ? AND model = ? AND prompt_version = ?', key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self.connection:
+                self.connection.execute(
+                    f'UPDATE analyses SET last_access = {_NEXT_ACCESS} '
+                    'WHERE content_sha256 = ? AND model = ? AND prompt_version = ?', key
+                )
+        text, issues, chars_saved, tokens_saved = row
+        return CachedAnalysis(text=zlib.decompress(text).decode('utf-8'), issues=json.loads(issues),
+                              chars_saved=chars_saved, tokens_saved=tokens_saved)
+
+    def put(self, content_sha256: str, model: str, prompt_version: str, text: str, issues: List[str],
+            chars_saved: int = 0, tokens_saved: int = 0) -> None:
+        """Store an analysis, then evict least recently used entries beyond max_bytes."""
+        compressed = zlib.compress(text.encode('utf-8'))
+        issues_json = json.dumps(issues)
+        size = len(compressed) + len(issues_json)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+
+        with self._lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO analyses '
+                '(content_sha256, model, prompt_version, text, issues, chars_saved, tokens_saved, size, last_access) '
+                f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, {_NEXT_ACCESS})',
+                (content_sha256, model, prompt_version, compressed, issues_json, chars_saved, tokens_saved, size)
+            )
+            total = self.connection.execute('SELECT SUM(size) FROM analyses').fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            evict = []
+            for key_sha, key_model, key_prompt, entry_size in self.connection.execute(
+                'SELECT content_sha256, model, prompt_version, size FROM analyses ORDER BY last_access'
+            ):
+                if total <= self.max_bytes:
+                    break
+                evict.append((key_sha, key_model, key_prompt))
+                total -= entry_size
+            self.connection.executemany(
+                'DELETE FROM analyses WHERE content_sha256 = ? AND model = ? AND prompt_version = ?', evict
+            )
+
+    def clear(self) -> None:
+        with self._lock, self.connection:
+            self.connection.execute('DELETE FROM analyses')
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide caches by database path, so every request shares one connection
+_analysis_caches: Dict[str, AnalysisCache] = {}
+_analysis_caches_lock = threading.Lock()
+
+
+def get_analysis_cache(db_path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> AnalysisCache:
+    """Return the process's AnalysisCache for db_path, opening it on first use."""
+    cache = _analysis_caches.get(db_path)
+    if cache is None:
+        with _analysis_caches_lock:
+            cache = _analysis_caches.get(db_path)
+            if cache is None:
+                cache = _analysis_caches[db_path] = AnalysisCache(db_path, max_bytes)
+    return cache
@@ -0,0 +1,160 @@
+import numpy as np
+from itertools import chain
+from typing import List, Dict, Set, Tuple
+from dataclasses import dataclass
+
+from .privacy_grader import PrivacyGrader
+
+
+# Negative ids of strings that are not scored: unknown issues (which a resolver may still
+# match) and known issues under the wrong parent (which PrivacyGrader drops, unresolved)
+UNKNOWN_ISSUE = -1
+MISPLACED_ISSUE = -2
+
+
+class _IssueIdMemo(dict):
+    """Raw issue string -> catalog issue id (or a negative id above), parsing each distinct string once."""
+
+    def __init__(self, issue_ids: Dict[Tuple[str, str], int], canonical: Dict[str, int], valid_issues: Set[str]):
+        super().__init__(canonical)
+        self.issue_ids = issue_ids
+        self.valid_issues = valid_issues
+
+    def __missing__(self, item: str) -> int:
+        issue_id = UNKNOWN_ISSUE
+        if ':' in item:
+            parent_issue, privacy_issue = map(str.strip, item.split(':', 1))
+            issue_lower = privacy_issue.lower()
+            issue_id = self.issue_ids.get((parent_issue, issue_lower), UNKNOWN_ISSUE)
+            if issue_id == UNKNOWN_ISSUE and issue_lower in self.valid_issues:
+                issue_id = MISPLACED_ISSUE
+        self[item] = issue_id
+        return issue_id
+
+
+@dataclass
+class BatchGradeResult:
+    """Array-valued grading results for many services, one row per input issue list."""
+    categories: List[str]
+    category_scores: np.ndarray   # (services, categories), 0-1 like _calculate_category_scores
+    category_grades: np.ndarray   # (services, categories) letter grades
+    overall_scores: np.ndarray    # (services,), 0-1 like _calculate_overall_score
+    overall_grades: np.ndarray    # (services,) letter grades
+    issue_counts: np.ndarray      # (services,) number of issues that were scored
+
+    def category_scores_for(self, row: int) -> Dict[str, float]:
+        """Return one service's category scores in the same shape as the scalar grader."""
+        return {category: float(score) for category, score in zip(self.categories, self.category_scores[row])}
+
+
+class BatchGrader:
+    """
+    Vectorized grading of many issue lists at once.
+
+    Issue lists are encoded as a sparse (COO) service x issue incidence matrix, which is
+    reduced to per-category classification counts and scored by the grader's compiled
+    scoring rules in one evaluation. Every float operation happens in the same order as
+    PrivacyGrader._score_category and _calculate_overall_score, so the results match the
+    scalar path exactly. If the grader has an issue resolver, unknown strings are resolved
+    as grade_privacy_issues resolves them, each distinct string once for the whole batch.
+    """
+
+    def __init__(self, grader: PrivacyGrader):
+        self.grader = grader
+
+        # Category order follows the grader's own iteration order (used by the overall sum)
+        self.categories = list(grader.all_parent_categories)
+        category_ids = {category: i for i, category in enumerate(self.categories)}
+
+        # Classification order follows the compiled rules (classification_weights order)
+        self.rules = grader.compiled_scoring_rules()
+        self.classifications = self.rules.classifications
+        classification_ids = {classification: i for i, classification in enumerate(self.classifications)}
+        self.category_weights = np.array(
+            [grader.category_weights[c] for c in self.categories], dtype=np.float64
+        )
+
+        # Catalog issue id -> (category id, classification id); canonical strings are pre-seeded
+        # into the per-call parse memo since a corpus repeats them over and over
+        self.issue_ids: Dict[Tuple[str, str], int] = {}
+        self.canonical_ids: Dict[str, int] = {}
+        issue_categories = []
+        issue_classifications = []
+        for key, entry in grader.issue_index.items():
+            self.issue_ids[key] = len(issue_categories)
+            self.canonical_ids[f"{entry.parent_issue}: {entry.privacy_issue}"] = len(issue_categories)
+            issue_categories.append(category_ids[entry.parent_issue])
+            issue_classifications.append(classification_ids[entry.classification])
+        self.issue_categories = np.array(issue_categories, dtype=np.int64)
+        self.issue_classifications = np.array(issue_classifications, dtype=np.int64)
+
+        # Grade boundaries as an ascending threshold array for searchsorted
+        boundaries = sorted(grader.grade_boundaries.items())
+        self.thresholds = np.array([threshold for threshold, _ in boundaries], dtype=np.float64)
+        self.grade_letters = np.array(['F'] + [grade.value for _, grade in boundaries])
+
+    def encode(self, issue_lists: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode issue lists as COO (row, issue id) pairs of the service x issue incidence matrix."""
+        memo = _IssueIdMemo(self.issue_ids, self.canonical_ids, self.grader.valid_privacy_issues)
+        cols = np.fromiter(map(memo.__getitem__, chain.from_iterable(issue_lists)), dtype=np.int64)
+        if self.grader.issue_resolver is not None and (cols == UNKNOWN_ISSUE).any():
+            self._resolve_unknown(memo)
+            cols = np.fromiter(map(memo.__getitem__, chain.from_iterable(issue_lists)), dtype=np.int64)
+        lengths = np.fromiter(map(len, issue_lists), dtype=np.int64, count=len(issue_lists))
+        rows = np.repeat(np.arange(len(issue_lists), dtype=np.int64), lengths)
+
+        known = cols >= 0
+        return rows[known], cols[known]
+
+    def _resolve_unknown(self, memo: _IssueIdMemo) -> None:
+        """Point each unknown string the grader's resolver matches at its catalog issue's id."""
+        unknown = [item for item, issue_id in memo.items() if issue_id == UNKNOWN_ISSUE]
+        resolved_issues, _ = self.grader.issue_resolver.resolve(unknown)
+        for resolved in resolved_issues:
+            # Parsed like any other string, as the scalar path re-groups resolved issues
+            memo[resolved.original] = memo[resolved.resolved]
+
+    def count(self, rows: np.ndarray, cols: np.ndarray, n_services: int) -> np.ndarray:
+        """Reduce the incidence matrix to (services, categories, classifications) counts."""
+        n_categories = len(self.categories)
+        n_classifications = len(self.classifications)
+        flat = (rows * n_categories + self.issue_categories[cols]) * n_classifications + self.issue_classifications[cols]
+        counts = np.bincount(flat, minlength=n_services * n_categories * n_classifications)
+        return counts.reshape(n_services, n_categories, n_classifications)
+
+    def score(self, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute category and overall scores from classification counts."""
+        # Categories without findings score 1.0, as in the scalar path
+        category_scores = self.rules.score(counts, self.category_weights)
+        category_scores = np.where(counts.sum(axis=2) > 0, category_scores, 1.0)
+
+        # Weighted average, summed category by category like the scalar path
+        total_weight = 0.0
+        for weight in self.category_weights:
+            total_weight += weight
+        if total_weight == 0:
+            return category_scores, np.zeros(counts.shape[0])
+
+        weighted_sum = np.zeros(counts.shape[0])
+        for j, weight in enumerate(self.category_weights):
+            weighted_sum = weighted_sum + category_scores[:, j] * weight
+        return category_scores, weighted_sum / total_weight
+
+    def to_grades(self, scores: np.ndarray) -> np.ndarray:
+        """Convert scores to letter grades using the grader's boundaries."""
+        return self.grade_letters[np.searchsorted(self.thresholds, scores, side='right')]
+
+    def grade(self, issue_lists: List[List[str]]) -> BatchGradeResult:
+        """Grade many services' issue lists in one pass."""
+        rows, cols = self.encode(issue_lists)
+        counts = self.count(rows, cols, len(issue_lists))
+        category_scores, overall_scores = self.score(counts)
+
+        return BatchGradeResult(
+            categories=self.categories,
+            category_scores=category_scores,
+            category_grades=self.to_grades(category_scores),
+            overall_scores=overall_scores,
+            overall_grades=self.to_grades(overall_scores),
+            issue_counts=np.bincount(rows, minlength=len(issue_lists))
+        )
@@ -0,0 +1,46 @@
+"""
+Compare grading a synthetic corpus one service at a time against BatchGrader.
+
+Run from src/:  python -m models.benchmarks.bench_batch_grader [n_services]
+"""
+import os
+import random
+import sys
+import time
+import pandas as pd
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+from models.batch_grader import BatchGrader
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def synthetic_corpus(grader: PrivacyGrader, n_services: int, seed: int = 215):
+    """Random issue lists drawn from the catalog, sized like typical ToS;DR services."""
+    catalog = [f"{entry.parent_issue}: {entry.privacy_issue}" for entry in grader.issue_index.values()]
+    rng = random.Random(seed)
+    return [rng.sample(catalog, rng.randint(5, 60)) for _ in range(n_services)]
+
+
+def main(n_services: int = 10_000):
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    grader = PrivacyGrader(mapping_df, category_weights)
+    corpus = synthetic_corpus(grader, n_services)
+
+    start = time.perf_counter()
+    for issues in corpus:
+        grader.grade_privacy_issues(issues)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BatchGrader(grader).grade(corpus)
+    batch_seconds = time.perf_counter() - start
+
+    print(f"services:          {n_services}")
+    print(f"scalar loop:       {scalar_seconds:.3f}s")
+    print(f"BatchGrader:       {batch_seconds:.3f}s (including construction)")
+    print(f"speedup:           {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
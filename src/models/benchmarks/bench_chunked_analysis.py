@@ -0,0 +1,63 @@
+"""
+Whole-document analysis against overlapping sections analyzed concurrently, on a synthetic
+long policy. The endpoint is a local stand-in whose latency grows with prompt size
+(base + tokens * per_token), roughly how a hosted model's prefill time behaves; token
+counts are the CHARS_PER_TOKEN estimate, not a real tokenizer.
+
+Run from src/:  python -m models.benchmarks.bench_chunked_analysis [paragraphs]
+"""
+import random
+import sys
+import time
+from types import SimpleNamespace
+from models.get_issues import IssueCatalog, analyze_sections, estimate_tokens, identify_issues, split_sections
+
+BASE_SECONDS = 0.05
+PER_TOKEN_SECONDS = 20e-6
+CONCURRENCY = (1, 4, 8)
+
+WORDS = ("data personal third parties share retain delete account service content cookies "
+         "consent license rights users information process store transfer law notice").split()
+CATALOG = IssueCatalog(
+    prompt_block="Ownership: issue a\nUser Rights: issue b",
+    parent_by_issue={"issue a": "Ownership", "issue b": "User Rights"},
+    digest="0" * 64,
+)
+
+
+class LatencyModel:
+    def start_chat(self):
+        return self
+
+    def send_message(self, messages, generation_config=None):
+        prompt = "\n".join(messages)
+        time.sleep(BASE_SECONDS + estimate_tokens(prompt) * PER_TOKEN_SECONDS)
+        return SimpleNamespace(text=", ".join(issue for issue in ("issue a", "issue b") if issue in prompt))
+
+
+def synthetic_policy(n_paragraphs: int, seed: int = 22) -> str:
+    rng = random.Random(seed)
+    paragraphs = [" ".join(rng.choices(WORDS, k=80)) for _ in range(n_paragraphs)]
+    paragraphs[n_paragraphs // 3] += " issue a"
+    paragraphs[-1] += " issue b"
+    return "\n\n".join(paragraphs)
+
+
+def main(n_paragraphs: int = 400):
+    text = synthetic_policy(n_paragraphs)
+    model = LatencyModel()
+    sections = split_sections(text, max_tokens=2000, overlap_tokens=200)
+    print(f"{estimate_tokens(text):,} estimated tokens, {len(sections)} sections of <= 2000 (200 overlap)")
+    print(f"{'analysis':<30}{'wall time':>12}{'issues':>8}")
+
+    start = time.perf_counter()
+    issues = identify_issues(model, CATALOG, text)
+    print(f"{'single call':<30}{time.perf_counter() - start:>11.2f}s{len(issues):>8}")
+    for concurrency in CONCURRENCY:
+        start = time.perf_counter()
+        issues = analyze_sections(model, CATALOG, sections, concurrency)
+        print(f"{f'sections, concurrency={concurrency}':<30}{time.perf_counter() - start:>11.2f}s{len(issues):>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
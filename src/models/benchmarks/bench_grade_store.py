@@ -0,0 +1,61 @@
+"""
+Insert and look up synthetic grades in GradeStore, next to the legacy save_grade_to_csv.
+
+Run from src/:  python -m models.benchmarks.bench_grade_store [n_grades]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from models.grade_store import GradeStore
+from models.privacy_grader import PrivacyGrader
+
+GRADES = "ABCDF"
+
+
+def main(n_grades: int = 100_000, n_legacy: int = 1_000):
+    rng = random.Random(215)
+    rows = [(f"service-{i:06d}", rng.choice(GRADES), round(rng.uniform(0, 100), 2)) for i in range(n_grades)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with GradeStore(os.path.join(tmp_dir, "grades.db")) as store:
+            start = time.perf_counter()
+            store.upsert_many(rows)
+            bulk_seconds = time.perf_counter() - start
+
+            updates = rng.sample(rows, 10_000)
+            start = time.perf_counter()
+            for service_name, grade, score in updates:
+                store.upsert(service_name, grade, score)
+            single_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for service_name, _, _ in updates:
+                store.get(service_name)
+            lookup_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            store.export_csv(os.path.join(tmp_dir, "export.csv"))
+            export_seconds = time.perf_counter() - start
+
+        csv_path = os.path.join(tmp_dir, "legacy.csv")
+        start = time.perf_counter()
+        for service_name, grade, _ in rows[:n_legacy]:
+            PrivacyGrader.save_grade_to_csv(service_name, grade, csv_path)
+        legacy_seconds = time.perf_counter() - start
+
+    results = [
+        (f"bulk upsert ({n_grades} rows, one transaction)", bulk_seconds, ""),
+        ("single upserts (10000, one transaction each)", single_seconds,
+         f"{single_seconds / 10_000 * 1e6:.0f}us each"),
+        ("lookups (10000)", lookup_seconds, f"{lookup_seconds / 10_000 * 1e6:.1f}us each"),
+        (f"export_csv ({n_grades} rows)", export_seconds, ""),
+        (f"legacy save_grade_to_csv ({n_legacy} rows)", legacy_seconds,
+         f"{legacy_seconds / n_legacy * 1e3:.1f}ms each, growing with file size"),
+    ]
+    for label, seconds, note in results:
+        print(f"{label:<50}{seconds:.3f}s  {note}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,165 @@
+"""
+Benchmark suite for the grading subsystem: grader construction, single-grade latency at
+1/10/30/100/1000 issues, cached grades, grade-stability estimates and corpus-scale batch
+throughput, each with peak memory. Results can be saved as a JSON baseline and later runs compared against it.
+A typical report has about 30 issues; its uncached grade is checked against a 100µs target.
+
+Run from src/:  python -m models.benchmarks.bench_grader [--save baseline.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+import pandas as pd
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+from models.batch_grader import BatchGrader
+from models.grading_artifact import MODELS_DIR, build_grading_artifact
+
+MAPPING_CSV = os.path.join(MODELS_DIR, "mapping_df.csv")
+WEIGHTS_CSV = os.path.join(MODELS_DIR, "category_weights.csv")
+
+ISSUE_LIST_SIZES = (1, 10, 30, 100, 1000)
+TYPICAL_GRADE = 'grade/issues=30'
+TYPICAL_GRADE_TARGET_S = 100e-6
+
+
+def synthetic_issue_list(grader: PrivacyGrader, size: int, rng: random.Random) -> List[str]:
+    """An issue list of the given size drawn from the catalog (with repeats past its size)."""
+    catalog = [f"{entry.parent_issue}: {entry.privacy_issue}" for entry in grader.issue_index.values()]
+    return rng.choices(catalog, k=size)
+
+
+def synthetic_corpus(grader: PrivacyGrader, n_services: int, rng: random.Random) -> List[List[str]]:
+    """Issue lists sized like typical ToS;DR services."""
+    return [synthetic_issue_list(grader, rng.randint(5, 60), rng) for _ in range(n_services)]
+
+
+def measure(func: Callable[[], object], number: int = 1, repeat: int = 5) -> Dict[str, float]:
+    """
+    Per-call wall time over `repeat` rounds of `number` calls, plus the peak traced allocation
+    of one call and the memory still held by its result.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        'median_s': statistics.median(timings),
+        'min_s': min(timings),
+        'peak_kib': peak / 1024,
+        'retained_kib': retained / 1024,
+    }
+
+
+def run_suite(n_services: int = 10_000, seed: int = 215) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    mapping_df = pd.read_csv(MAPPING_CSV)
+    category_weights = load_weights_from_csv(WEIGHTS_CSV)
+    results = {}
+
+    results['construct/dataframe'] = measure(lambda: PrivacyGrader(mapping_df, category_weights))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        artifact_path = os.path.join(tmp_dir, "grading_artifact.pkl")
+        build_grading_artifact(MAPPING_CSV, WEIGHTS_CSV, artifact_path)
+        results['construct/artifact'] = measure(lambda: PrivacyGrader.from_artifact(artifact_path))
+
+    # The report cache is disabled so every call grades from scratch
+    uncached = PrivacyGrader(mapping_df, category_weights, cache_size=0)
+    for size in ISSUE_LIST_SIZES:
+        issues = synthetic_issue_list(uncached, size, rng)
+        results[f'grade/issues={size}'] = measure(
+            lambda: uncached.grade_privacy_issues(issues), number=max(1, 1000 // size)
+        )
+
+    cached = PrivacyGrader(mapping_df, category_weights)
+    issues = synthetic_issue_list(cached, 100, rng)
+    cached.grade_privacy_issues(issues)
+    results['grade_cached/issues=100'] = measure(lambda: cached.grade_privacy_issues(issues), number=1000)
+
+    for size in (10, 100):
+        issues = synthetic_issue_list(cached, size, rng)
+        results[f'stability/issues={size}'] = measure(lambda: cached.grade_stability(issues), number=10)
+
+    corpus = synthetic_corpus(uncached, n_services, rng)
+    results[f'scalar_loop/services={n_services}'] = measure(
+        lambda: [uncached.grade_privacy_issues(issues) for issues in corpus], repeat=3
+    )
+    batch_grader = BatchGrader(uncached)
+    results[f'batch/services={n_services}'] = measure(lambda: batch_grader.grade(corpus), repeat=3)
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Print each benchmark's change against the baseline; returns the names that regressed."""
+    regressions = []
+    print(f"\n{'benchmark':<35}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, current in results.items():
+        if name not in baseline:
+            print(f"{name:<35}{'-':>12}{current['median_s'] * 1e3:>10.3f}ms{'new':>8}")
+            continue
+        ratio = current['median_s'] / baseline[name]['median_s']
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<35}{baseline[name]['median_s'] * 1e3:>10.3f}ms"
+              f"{current['median_s'] * 1e3:>10.3f}ms{ratio:>7.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--services', type=int, default=10_000, help='corpus size for the batch benchmarks')
+    parser.add_argument('--save', help='write results to this JSON baseline')
+    parser.add_argument('--compare', help='compare results against this JSON baseline')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='flag benchmarks whose median time grew by more than this factor')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.services)
+    print(f"{'benchmark':<35}{'median':>12}{'min':>12}{'peak':>14}{'retained':>14}")
+    for name, result in results.items():
+        print(f"{name:<35}{result['median_s'] * 1e3:>10.3f}ms{result['min_s'] * 1e3:>10.3f}ms"
+              f"{result['peak_kib']:>10.1f} KiB{result['retained_kib']:>10.1f} KiB")
+
+    typical = results[TYPICAL_GRADE]['min_s']
+    print(f"\n{TYPICAL_GRADE}: {typical * 1e6:.0f}µs (best round), target {TYPICAL_GRADE_TARGET_S * 1e6:.0f}µs: "
+          f"{'met' if typical < TYPICAL_GRADE_TARGET_S else 'MISSED'}")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f)['results'], args.threshold)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': results,
+            }, f, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
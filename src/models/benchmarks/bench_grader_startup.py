@@ -0,0 +1,60 @@
+"""
+Cold-start a PrivacyGrader in fresh interpreters, from the CSVs and from a compiled
+grading artifact.
+
+Run from src/:  python -m models.benchmarks.bench_grader_startup [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from models.grading_artifact import MODELS_DIR, build_grading_artifact
+
+MAPPING_CSV = os.path.join(MODELS_DIR, "mapping_df.csv")
+WEIGHTS_CSV = os.path.join(MODELS_DIR, "category_weights.csv")
+
+FROM_CSV = (
+    "import pandas as pd\n"
+    "from models.privacy_grader import PrivacyGrader, load_weights_from_csv\n"
+    "PrivacyGrader(pd.read_csv({mapping!r}), load_weights_from_csv({weights!r}))\n"
+)
+FROM_ARTIFACT = (
+    "import sys\n"
+    "from models.privacy_grader import PrivacyGrader\n"
+    "PrivacyGrader.from_artifact({artifact!r})\n"
+    "assert 'pandas' not in sys.modules\n"
+)
+
+
+def cold_start(code: str, runs: int) -> float:
+    """Median wall time of a fresh interpreter running code, including all imports."""
+    src_dir = os.path.dirname(MODELS_DIR)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=src_dir, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(runs: int = 5):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        artifact_path = os.path.join(tmp_dir, "grading_artifact.pkl")
+        build_grading_artifact(MAPPING_CSV, WEIGHTS_CSV, artifact_path)
+
+        baseline = cold_start("pass", runs)
+        csv_seconds = cold_start(FROM_CSV.format(mapping=MAPPING_CSV, weights=WEIGHTS_CSV), runs)
+        artifact_seconds = cold_start(FROM_ARTIFACT.format(artifact=artifact_path), runs)
+
+    results = [
+        ("bare interpreter", baseline, ""),
+        ("PrivacyGrader from CSVs (pandas)", csv_seconds, f"+{csv_seconds - baseline:.3f}s"),
+        ("PrivacyGrader.from_artifact", artifact_seconds, f"+{artifact_seconds - baseline:.3f}s"),
+    ]
+    for label, seconds, note in results:
+        print(f"{label:<50}{seconds:.3f}s  {note}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
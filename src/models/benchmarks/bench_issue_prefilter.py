@@ -0,0 +1,110 @@
+"""
+Recall and prompt size of the BM25 issue pre-filter.
+
+With the ToS;DR labelled data (one row per service, document text and labelled issue, as
+used to train multi_class_model), reports for each top-N the share of labelled catalog
+issues that survive the pre-filter, with the estimated prompt tokens it sends. Recall is
+always reported for the bundled PDFs against their hand labels (tests/data/prefilter_labels.csv,
+one row per document and issue with the passage that supports it), followed by prompt sizes
+and ranking time.
+
+Run from src/:  python -m models.benchmarks.bench_issue_prefilter [labelled.csv]
+"""
+import glob
+import os
+import statistics
+import sys
+import time
+import pandas as pd
+from models.get_issues import (estimate_tokens, extract_pdf_text, extract_text_from_pdf, get_issue_catalog,
+                               get_issue_index, prefilter, split_sections, PREFILTER_SECTION_TOKENS,
+                               PREFILTER_TOP_ISSUES)
+
+LABELLED_DATA = "gs://legal-terms-data/tosdr-data/modeling/df_mod_v1.csv"
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mapping_df.csv")
+PDF_DIRECTORY = os.path.join(os.path.dirname(CATALOG_PATH), "pdf_directory")
+PDF_LABELS = os.path.join(os.path.dirname(CATALOG_PATH), "tests", "data", "prefilter_labels.csv")
+TOP_ISSUES = (10, 20, 40, 80, PREFILTER_TOP_ISSUES)
+TOP_SECTIONS = 20
+
+
+def prompt_tokens(catalog, text: str) -> int:
+    return estimate_tokens(catalog.prompt_block) + estimate_tokens(text)
+
+
+def recall_report(labelled: pd.DataFrame, catalog) -> None:
+    index = get_issue_index(catalog)
+    row_by_issue = {line.split(": ", 1)[-1].lower(): row for row, line in enumerate(index.lines)}
+    documents = labelled.groupby(["service", "full_text_clean"], as_index=False)["privacy_issue"].agg(list)
+
+    found = {n: 0 for n in TOP_ISSUES}
+    total = 0
+    full_tokens, filtered_tokens = [], {n: [] for n in TOP_ISSUES}
+    for text, issues in zip(documents["full_text_clean"].astype(str), documents["privacy_issue"]):
+        labels = {row_by_issue[issue.lower()] for issue in issues if issue.lower() in row_by_issue}
+        if not labels:
+            continue
+        total += len(labels)
+        sections = split_sections(text, PREFILTER_SECTION_TOKENS, 0)
+        full_tokens.append(prompt_tokens(catalog, text))
+        for n in TOP_ISSUES:
+            candidates, _ = index.select(sections, n)
+            found[n] += len(labels.intersection(candidates))
+            filtered_tokens[n].append(prompt_tokens(*prefilter(catalog, text, n, TOP_SECTIONS)))
+
+    print(f"{len(documents)} labelled documents, {total} labelled catalog issues")
+    print(f"full prompt: median {statistics.median(full_tokens):,.0f} estimated tokens")
+    print(f"{'top issues':<12}{'recall':>8}{f'median tokens (top {TOP_SECTIONS} sections)':>40}")
+    for n in TOP_ISSUES:
+        print(f"{n:<12}{found[n] / total:>8.1%}{statistics.median(filtered_tokens[n]):>40,.0f}")
+
+
+def pdf_recall_report(catalog) -> None:
+    """Recall of the hand-labelled issues of the bundled PDFs, from the text analyze_pdf prompts with."""
+    index = get_issue_index(catalog)
+    row_by_line = {line: row for row, line in enumerate(index.lines)}
+    labels = pd.read_csv(PDF_LABELS)
+    found, total = {n: 0 for n in TOP_ISSUES}, 0
+    print(f"{'document':<14}{'labels':>8}" + "".join(f"{f'top {n}':>10}" for n in TOP_ISSUES))
+    for document, rows in labels.groupby("document"):
+        text = extract_pdf_text(os.path.join(PDF_DIRECTORY, f"{document}.pdf")).text
+        sections = split_sections(text, PREFILTER_SECTION_TOKENS, 0)
+        wanted = {row_by_line[f"{parent}: {issue}"] for parent, issue in zip(rows["parent_issue"], rows["privacy_issue"])}
+        hits = {n: len(wanted.intersection(index.select(sections, n)[0])) for n in TOP_ISSUES}
+        total += len(wanted)
+        for n in TOP_ISSUES:
+            found[n] += hits[n]
+        print(f"{document:<14}{len(wanted):>8}" + "".join(f"{hits[n]:>10}" for n in TOP_ISSUES))
+    print(f"{'recall':<14}{total:>8}" + "".join(f"{found[n] / total:>10.1%}" for n in TOP_ISSUES) + "\n")
+
+
+def pdf_report(catalog) -> None:
+    print(f"{'document':<14}{'full tokens':>12}" + "".join(f"{f'top {n}':>10}" for n in TOP_ISSUES) + f"{'rank':>10}")
+    for pdf_path in sorted(glob.glob(os.path.join(PDF_DIRECTORY, "*.pdf"))):
+        text = extract_text_from_pdf(pdf_path)
+        start = time.perf_counter()
+        prefilter(catalog, text, TOP_ISSUES[0], TOP_SECTIONS)
+        seconds = time.perf_counter() - start
+        sizes = [prompt_tokens(*prefilter(catalog, text, n, TOP_SECTIONS)) for n in TOP_ISSUES]
+        name = os.path.splitext(os.path.basename(pdf_path))[0]
+        print(f"{name:<14}{prompt_tokens(catalog, text):>12,}" +
+              "".join(f"{size:>10,}" for size in sizes) + f"{seconds * 1e3:>8.1f}ms")
+
+
+def main(labelled_path: str = LABELLED_DATA):
+    catalog = get_issue_catalog(CATALOG_PATH)
+    print(f"catalog: {len(get_issue_index(catalog).lines)} issues, "
+          f"{estimate_tokens(catalog.prompt_block):,} estimated tokens; sections of {PREFILTER_SECTION_TOKENS}, "
+          f"top {TOP_SECTIONS} sections kept\n")
+    pdf_recall_report(catalog)
+    try:
+        labelled = pd.read_csv(labelled_path)
+    except Exception as e:
+        print(f"No labelled data ({labelled_path}: {type(e).__name__}); ToS;DR recall not measured.\n")
+        pdf_report(catalog)
+        return
+    recall_report(labelled, catalog)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,51 @@
+"""
+Time IssueResolver on a 100-item model response of paraphrased catalog issues.
+
+Run from src/:  python -m models.benchmarks.bench_issue_resolver
+"""
+import os
+import random
+import time
+import pandas as pd
+from models.privacy_grader import PrivacyGrader
+from models.issue_resolver import IssueResolver
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def paraphrase(issue: str, rng: random.Random) -> str:
+    """Cheap stand-in for an LLM paraphrase: drop a word, re-case, add punctuation."""
+    words = issue.split()
+    if len(words) > 4:
+        del words[rng.randrange(len(words))]
+    return "Unknown: " + " ".join(words).upper() + "."
+
+
+def main(n_items: int = 100, repeats: int = 50):
+    grader = PrivacyGrader(pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv")))
+
+    start = time.perf_counter()
+    resolver = IssueResolver(grader.issue_index)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    rng = random.Random(215)
+    entries = rng.sample(list(grader.issue_index.values()), n_items)
+    response = [paraphrase(entry.privacy_issue, rng) for entry in entries]
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        resolved, _ = resolver.resolve(response)
+    resolve_ms = (time.perf_counter() - start) / repeats * 1e3
+
+    resolved_by_original = {r.original: r.resolved for r in resolved}
+    correct = sum(
+        resolved_by_original.get(item) == f"{entry.parent_issue}: {entry.privacy_issue}"
+        for item, entry in zip(response, entries)
+    )
+    print(f"index build:               {build_ms:.2f}ms")
+    print(f"resolve {n_items} items:         {resolve_ms:.2f}ms")
+    print(f"resolved above threshold:  {len(resolved)}/{n_items} ({correct} to the source issue)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Per-upload Vertex AI setup (vertexai.init + GenerativeModel + start_chat, as before) against
+a shared ModelPool handle. Runs offline with the real SDK objects: no request is sent, so
+the prediction client's auth and channel setup, which a pooled handle also keeps, is not
+included.
+
+Run from src/:  python -m models.benchmarks.bench_model_pool [uploads]
+"""
+import statistics
+import sys
+import time
+import warnings
+import vertexai
+from vertexai.generative_models import GenerativeModel
+from models.get_issues import ModelPool
+
+PROJECT, LOCATION, ENDPOINT = "bench-project", "us-central1", "1234567890"
+
+
+def per_upload() -> None:
+    vertexai.init(project=PROJECT, location=LOCATION)
+    GenerativeModel(f"projects/{PROJECT}/locations/{LOCATION}/endpoints/{ENDPOINT}").start_chat()
+
+
+def main(uploads: int = 1000):
+    warnings.simplefilter("ignore")
+    pool = ModelPool()
+    cases = [
+        ("per-upload init + model", per_upload),
+        ("ModelPool.get", lambda: pool.get(PROJECT, LOCATION, ENDPOINT).start_chat()),
+    ]
+    for label, func in cases:
+        timings = []
+        for _ in range(uploads):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        print(f"{label:<30}first {timings[0] * 1e3:>8.3f}ms   median {statistics.median(timings) * 1e6:>8.1f}us")
+    print(f"pool setup (first use): {pool.setup_seconds[(PROJECT, LOCATION, ENDPOINT)] * 1e3:.3f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
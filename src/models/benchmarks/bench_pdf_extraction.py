@@ -0,0 +1,85 @@
+"""
+PDF text extraction on a synthetic 500-page policy: the old `text += page.get_text()` loop
+against the page generator and join, the early stop of max_pages/max_chars, each with peak
+memory, and process-pool extraction at 1, 2, 4 and 8 workers.
+
+Run from src/:  python -m models.benchmarks.bench_pdf_extraction [pages]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import fitz
+from models.get_issues import extract_text_from_pdf
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+WORDS = ("data personal third parties share retain delete account service content cookies "
+         "consent license rights users information process store transfer law notice").split()
+
+
+def synthetic_pdf(path: str, n_pages: int, seed: int = 215) -> None:
+    """A policy-like PDF with about 45 lines of text per page."""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for _ in range(n_pages):
+        page = doc.new_page()
+        lines = [" ".join(rng.choices(WORDS, k=12)) for _ in range(45)]
+        page.insert_text((50, 50), "\n".join(lines), fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+def extract_concatenating(pdf_path: str) -> str:
+    """The previous implementation, kept for comparison."""
+    text = ""
+    with fitz.open(pdf_path) as pdf:
+        for page_num in range(pdf.page_count):
+            page = pdf[page_num]
+            text += page.get_text()
+    return text
+
+
+def measure(func, repeat: int = 5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024, len(result)
+
+
+def main(n_pages: int = 500):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "synthetic_policy.pdf")
+        synthetic_pdf(pdf_path, n_pages)
+
+        cases = [
+            ("concatenate (+=)", lambda: extract_concatenating(pdf_path)),
+            ("iter_pdf_pages + join", lambda: extract_text_from_pdf(pdf_path)),
+            ("max_pages=50", lambda: extract_text_from_pdf(pdf_path, max_pages=50)),
+            ("max_chars=100_000", lambda: extract_text_from_pdf(pdf_path, max_chars=100_000)),
+        ]
+        print(f"{n_pages}-page PDF")
+        print(f"{'extraction':<30}{'median':>10}{'peak':>14}{'chars':>12}")
+        for label, func in cases:
+            seconds, peak_kib, n_chars = measure(func)
+            print(f"{label:<30}{seconds * 1e3:>8.1f}ms{peak_kib:>10.1f} KiB{n_chars:>12,}")
+
+        print(f"\nprocess pool ({os.cpu_count()} CPUs)")
+        serial_seconds = None
+        for workers in WORKER_COUNTS:
+            seconds, _, _ = measure(lambda: extract_text_from_pdf(pdf_path, workers=workers), repeat=3)
+            serial_seconds = serial_seconds or seconds
+            print(f"{f'workers={workers}':<30}{seconds * 1e3:>8.1f}ms{serial_seconds / seconds:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,158 @@
+import csv
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class StoredGrade:
+    """A service's saved privacy grade."""
+    service_name: str
+    grade: str
+    overall_score: Optional[float] = None
+
+
+class GradeStore:
+    """
+    Persistent privacy grades in an embedded SQLite database.
+
+    Grades are keyed by service name through the table's primary key index, so each upsert
+    and lookup is O(log n) instead of the full read/concat/rewrite of save_grade_to_csv.
+    Per-category scores can be stored alongside the overall grade.
+
+    This is a standalone utility for offline grading runs, like save_grade_to_csv: the API
+    grades anonymous uploads and does not persist grades. Its stored scores are what
+    score_distribution.py rebuilds the percentile distribution from.
+    """
+
+    def __init__(self, db_path: str = 'privacy_grades.db'):
+        self.db_path = str(db_path)
+        self.connection = sqlite3.connect(self.db_path)
+        if self.db_path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.execute(
+                '''CREATE TABLE IF NOT EXISTS grades (
+                       service_name TEXT PRIMARY KEY,
+                       grade TEXT NOT NULL,
+                       overall_score REAL
+                   ) WITHOUT ROWID'''
+            )
+            self.connection.execute(
+                '''CREATE TABLE IF NOT EXISTS category_scores (
+                       service_name TEXT NOT NULL,
+                       parent_category TEXT NOT NULL,
+                       score REAL NOT NULL,
+                       PRIMARY KEY (service_name, parent_category)
+                   ) WITHOUT ROWID'''
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "GradeStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM grades').fetchone()[0]
+
+    def __contains__(self, service_name: str) -> bool:
+        return self.connection.execute(
+            'SELECT 1 FROM grades WHERE service_name = ?', (service_name,)
+        ).fetchone() is not None
+
+    @staticmethod
+    def _insert_sql(overwrite: bool) -> str:
+        if overwrite:
+            return ('INSERT INTO grades (service_name, grade, overall_score) VALUES (?, ?, ?) '
+                    'ON CONFLICT(service_name) DO UPDATE SET '
+                    'grade = excluded.grade, overall_score = excluded.overall_score')
+        # Matches save_grade_to_csv: an existing grade is preserved
+        return 'INSERT OR IGNORE INTO grades (service_name, grade, overall_score) VALUES (?, ?, ?)'
+
+    def upsert(self, service_name: str, grade: str, overall_score: Optional[float] = None,
+               overwrite: bool = True) -> None:
+        """Insert or update one service's grade."""
+        with self.connection:
+            self.connection.execute(self._insert_sql(overwrite), (service_name, grade, overall_score))
+
+    def upsert_many(self, grades: Iterable[Tuple[str, str, Optional[float]]], overwrite: bool = True) -> None:
+        """Insert or update many (service_name, grade, overall_score) rows in one transaction."""
+        with self.connection:
+            self.connection.executemany(self._insert_sql(overwrite), grades)
+
+    def save_report(self, service_name: str, report, overwrite: bool = True) -> None:
+        """Store a PrivacyReport's overall grade and per-category scores in one transaction."""
+        with self.connection:
+            cursor = self.connection.execute(
+                self._insert_sql(overwrite), (service_name, report.overall_grade, report.overall_score)
+            )
+            if cursor.rowcount == 0:
+                return  # Existing grade preserved
+            self.connection.execute('DELETE FROM category_scores WHERE service_name = ?', (service_name,))
+            self.connection.executemany(
+                'INSERT INTO category_scores (service_name, parent_category, score) VALUES (?, ?, ?)',
+                [(service_name, category, category_report.score)
+                 for category, category_report in report.parent_category_grades.items()]
+            )
+
+    def get(self, service_name: str) -> Optional[StoredGrade]:
+        """Look up one service's grade, or None if it has not been graded."""
+        row = self.connection.execute(
+            'SELECT service_name, grade, overall_score FROM grades WHERE service_name = ?', (service_name,)
+        ).fetchone()
+        return StoredGrade(*row) if row else None
+
+    def get_category_scores(self, service_name: str) -> Dict[str, float]:
+        """Look up one service's stored per-category scores."""
+        return dict(self.connection.execute(
+            'SELECT parent_category, score FROM category_scores WHERE service_name = ?', (service_name,)
+        ))
+
+    def sorted_overall_scores(self) -> List[float]:
+        """All stored overall scores in ascending order, sorted by SQLite."""
+        return [score for (score,) in self.connection.execute(
+            'SELECT overall_score FROM grades WHERE overall_score IS NOT NULL ORDER BY overall_score'
+        )]
+
+    def sorted_category_scores(self) -> Dict[str, List[float]]:
+        """All stored per-category scores, each category's in ascending order."""
+        category_scores: Dict[str, List[float]] = {}
+        for category, score in self.connection.execute(
+            'SELECT parent_category, score FROM category_scores ORDER BY parent_category, score'
+        ):
+            category_scores.setdefault(category, []).append(score)
+        return category_scores
+
+    def __iter__(self) -> Iterator[StoredGrade]:
+        for row in self.connection.execute(
+            'SELECT service_name, grade, overall_score FROM grades ORDER BY service_name'
+        ):
+            yield StoredGrade(*row)
+
+    def export_csv(self, csv_path: str) -> int:
+        """Stream all grades to a CSV in the privacy_grades.csv layout; returns the row count."""
+        count = 0
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['service_name', 'grade', 'overall_score'])
+            for stored in self:
+                writer.writerow([stored.service_name, stored.grade,
+                                 '' if stored.overall_score is None else stored.overall_score])
+                count += 1
+        return count
+
+    def import_csv(self, csv_path: str, overwrite: bool = False) -> int:
+        """Load an existing privacy_grades.csv into the store in one transaction; returns the row count."""
+        with open(csv_path, newline='') as f:
+            rows = [
+                (row['service_name'], row['grade'],
+                 float(row['overall_score']) if row.get('overall_score') else None)
+                for row in csv.DictReader(f)
+            ]
+        self.upsert_many(rows, overwrite=overwrite)
+        return len(rows)
@@ -0,0 +1,70 @@
+"""
+Named category weight profiles, each compiled once into a grader that shares the base
+grader's issue catalog.
+
+Profiles are loaded from JSON mapping profile names to category weight overrides:
+
+    {"partner-a": {"Ownership": 0.8, "User Rights": 0.2}, "partner-b": {...}}
+"""
+import json
+from typing import Dict, List, Optional
+
+from .privacy_grader import PrivacyGrader
+
+DEFAULT_PROFILE = "default"
+
+
+class UnknownProfile(KeyError):
+    """Raised when a grading profile name is not configured."""
+
+
+def load_weight_profiles(path: str) -> Dict[str, Dict[str, float]]:
+    """Load {profile name: {category: weight}} from a JSON file."""
+    with open(path) as f:
+        data = json.load(f)
+    return {
+        str(name): {str(category): float(weight) for category, weight in weights.items()}
+        for name, weights in data.items()
+    }
+
+
+class GraderProfiles:
+    """
+    Per-profile graders over one immutable catalog.
+
+    Each profile is built once with PrivacyGrader.with_category_weights, so it only adds its
+    weights and its own report cache; picking a profile per request is a dict lookup. The
+    base grader is available as the "default" profile. The corpus score distribution was
+    graded under the base weights, so only the default profile reports percentiles.
+    """
+
+    def __init__(self, base_grader: PrivacyGrader, profiles: Dict[str, Dict[str, float]] = None):
+        self.base_grader = base_grader
+        self.graders: Dict[str, PrivacyGrader] = {DEFAULT_PROFILE: base_grader}
+        for name, category_weights in (profiles or {}).items():
+            self.add(name, category_weights)
+
+    def add(self, name: str, category_weights: Dict[str, float]) -> PrivacyGrader:
+        """Compile a profile from category weight overrides, replacing any profile of that name."""
+        if name == DEFAULT_PROFILE:
+            raise ValueError(f"'{DEFAULT_PROFILE}' is reserved for the base grader")
+        grader = self.base_grader.with_category_weights(category_weights)
+        self.graders[name] = grader
+        return grader
+
+    def get(self, name: Optional[str] = None) -> PrivacyGrader:
+        """Return a profile's grader; None selects the default profile."""
+        try:
+            return self.graders[DEFAULT_PROFILE if name is None else name]
+        except KeyError:
+            raise UnknownProfile(f"Unknown grading profile '{name}'; available: {self.names}") from None
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self.graders)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.graders
+
+    def __len__(self) -> int:
+        return len(self.graders)
@@ -0,0 +1,95 @@
+"""
+Compile mapping_df.csv and category_weights.csv into one versioned binary artifact, so a
+grader can start with PrivacyGrader.from_artifact() instead of importing pandas and
+parsing both CSVs.
+
+Build from src/:  python -m models.grading_artifact [mapping_csv] [weights_csv] [artifact_path]
+"""
+import hashlib
+import os
+import pickle
+import sys
+from typing import Dict
+
+ARTIFACT_VERSION = 2
+
+MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ARTIFACT_PATH = os.path.join(MODELS_DIR, "grading_artifact.pkl")
+
+
+class GradingArtifactError(ValueError):
+    """Raised when a grading artifact is unreadable or was built for another version."""
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes, used to tie an artifact to the CSVs it was built from."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_grading_artifact(mapping_df_path: str, category_weights_path: str, artifact_path: str,
+                           scoring_rules=None) -> Dict:
+    """
+    Compile both CSVs (and the scoring rules, the defaults unless given) into a pickle of
+    plain Python containers and write it atomically.
+    """
+    import pandas as pd
+    from .privacy_grader import PrivacyGrader, load_weights_from_csv
+
+    grader = PrivacyGrader(pd.read_csv(mapping_df_path), load_weights_from_csv(category_weights_path),
+                           scoring_rules=scoring_rules)
+    artifact = {
+        'version': ARTIFACT_VERSION,
+        'source_digests': {
+            'mapping': file_digest(mapping_df_path),
+            'category_weights': file_digest(category_weights_path),
+        },
+        'catalog_rows': [tuple(map(str, row)) for row in grader.catalog_rows],
+        'category_weights': {str(category): float(weight) for category, weight in grader.category_weights.items()},
+        'scoring_rules': grader.scoring_rules.to_dict(),
+    }
+
+    tmp_path = f"{artifact_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, artifact_path)
+    return artifact
+
+
+def load_grading_artifact(artifact_path: str) -> Dict:
+    """Load and version-check a compiled grading artifact."""
+    try:
+        with open(artifact_path, 'rb') as f:
+            artifact = pickle.load(f)
+    except (pickle.UnpicklingError, EOFError) as e:
+        raise GradingArtifactError(f"Unreadable grading artifact {artifact_path}: {e}") from e
+
+    version = artifact.get('version') if isinstance(artifact, dict) else None
+    if version != ARTIFACT_VERSION:
+        raise GradingArtifactError(
+            f"Grading artifact {artifact_path} has version {version}, expected {ARTIFACT_VERSION}; "
+            f"rebuild it with build_grading_artifact"
+        )
+    return artifact
+
+
+def artifact_is_current(artifact_path: str, mapping_df_path: str, category_weights_path: str) -> bool:
+    """True if the artifact exists, has this version and was built from the CSVs' current contents."""
+    try:
+        artifact = load_grading_artifact(artifact_path)
+    except (OSError, GradingArtifactError):
+        return False
+    return artifact['source_digests'] == {
+        'mapping': file_digest(mapping_df_path),
+        'category_weights': file_digest(category_weights_path),
+    }
+
+
+if __name__ == "__main__":
+    mapping_df_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(MODELS_DIR, "mapping_df.csv")
+    category_weights_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(MODELS_DIR, "category_weights.csv")
+    artifact_path = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_ARTIFACT_PATH
+
+    artifact = build_grading_artifact(mapping_df_path, category_weights_path, artifact_path)
+    print(f"Wrote {artifact_path} ({len(artifact['catalog_rows'])} issues, "
+          f"{len(artifact['category_weights'])} category weights, {os.path.getsize(artifact_path)} bytes)")
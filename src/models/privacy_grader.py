@@ -1,10 +1,29 @@
+import copy
+import io
 import os
-import pandas as pd
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+import threading
+from typing import List, Dict, Tuple, Optional, Callable, Iterable, Iterator, Mapping, Sequence, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
 from enum import Enum
-# from get_issues import process_pdf_privacy_issues
-from .get_issues import *
+from collections import OrderedDict
+from collections import abc
+import hashlib
+from itertools import islice
+from math import inf
+from operator import mul
+from types import MappingProxyType
+from .grading_artifact import load_grading_artifact
+from .scoring_rules import ScoringRules, DEFAULT_SCORING_RULES
+
+if TYPE_CHECKING:
+    # pandas (and numpy, via the resolver) are only imported where they are used, so a
+    # grader loaded from a compiled artifact starts without them
+    import pandas as pd
+    from .issue_resolver import ResolvedIssue
+    from .scoring_rules import CompiledScoringRules
+    from .grade_stability import GradeStability
+
+
 def get_storage_client():
     """Returns a Google Cloud Storage client."""
     from google.cloud import storage
@@ -12,6 +31,7 @@ def get_storage_client():
 
 def load_weights_from_csv(filepath: str) -> Dict[str, float]:
     """Load category weights from CSV file into format needed by grader."""
+    import pandas as pd
     df = pd.read_csv(filepath)
     return dict(zip(df['parent_category'], df['weight']))
 
@@ -34,6 +54,7 @@ def upload_df_to_gcs(bucket_name, df, destination_blob_name):
 
 def read_csv_from_gcs(bucket_name, source_blob_name):
     """Read a CSV file from GCS into a DataFrame."""
+    import pandas as pd
     storage_client = get_storage_client()
     bucket = storage_client.bucket(bucket_name)
     blob = bucket.blob(source_blob_name)
@@ -52,52 +73,341 @@ class Grade(Enum):
     F = "F"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CompiledIssue:
+    """Precompiled lookup entry for a single (parent, issue) pair."""
+    parent_issue: str
+    privacy_issue: str
+    classification: str
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryState:
+    """Intermediate scoring state for one category: counts by classification and uncapped base score."""
+    counts: Mapping[str, int]
+    base_score: float
+
+
+class CategoryStates(abc.Mapping):
+    """
+    Read-only {category: CategoryState} view over one grade's per-category counts and base scores.
+
+    Grading only needs the plain count dicts, so a CategoryState (with its read-only counts) is
+    built the first time a category is accessed; a report nobody re-grades allocates none.
+    """
+    __slots__ = ('counts', 'base_scores', '_states')
+
+    def __init__(self, counts: Dict[str, Dict[str, int]], base_scores: Dict[str, float]):
+        self.counts = counts  # Shared by cached reports, so never mutated after grading
+        self.base_scores = base_scores
+        self._states: Dict[str, CategoryState] = {}
+
+    def __getitem__(self, category: str) -> CategoryState:
+        state = self._states.get(category)
+        if state is None:
+            state = self._states[category] = CategoryState(
+                MappingProxyType(self.counts[category]), self.base_scores[category]
+            )
+        return state
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.counts)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self.counts)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, category: object) -> bool:
+        return category in self.counts
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(frozen=True, slots=True)
+class GradeState:
+    """Per-category state kept from a grade, so what-if re-grading skips parsing and lookups."""
+    categories: CategoryStates
+    classification_weights: Mapping[str, float]
+
+
+@dataclass(frozen=True)
+class WhatIfResult:
+    """Scores and grades recomputed from a GradeState under alternative weights or boundaries."""
+    overall_grade: str
+    overall_score: float
+    category_scores: Dict[str, float]
+    category_grades: Dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
 class PrivacyCategoryReport:
     """Detailed report for a privacy category."""
     parent_category: str
     grade: str
     score: float
-    good_issues: List[str]
-    neutral_issues: List[str]
-    bad_issues: List[str]
+    good_issues: Tuple[str, ...]
+    neutral_issues: Tuple[str, ...]
+    bad_issues: Tuple[str, ...]
     total_possible_issues: int
     category_weight: float
+    percentile: Optional[float] = None
+
+
+class IssueLog(abc.Sequence):
+    """
+    Read-only view of the items one or more append-only lists held when it was taken, in order.
+
+    GradingSession only ever appends to its issue lists; each snapshot holds views of them, so
+    a batch copies nothing it added earlier and never changes what an earlier snapshot shows.
+    Compares equal to a tuple of the same items.
+    """
+    __slots__ = ('_segments', '_length')
+
+    def __init__(self, *lists: List):
+        self._segments = tuple((items, len(items)) for items in lists)
+        self._length = sum(length for _, length in self._segments)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        index = range(self._length)[index]  # Normalizes negative indexes and raises IndexError
+        for items, length in self._segments:
+            if index < length:
+                return items[index]
+            index -= length
+
+    def __iter__(self) -> Iterator:
+        for items, length in self._segments:
+            yield from islice(items, length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (tuple, IssueLog)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+
+@dataclass(frozen=True)
+class CategoryLayout:
+    """Fixed category order of a grader's catalog; report arrays are indexed by position in it."""
+    categories: Tuple[str, ...]
+    index: Dict[str, int]
+    total_possible_issues: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class GradingTables:
+    """What every grade reads from a grader's settings, rebuilt only when its config version changes."""
+    layout: CategoryLayout
+    boundaries: List[Tuple[float, str]]          # (threshold, letter), highest first, ending with F at -inf
+    clean_grade: str                             # Grade of a category without findings
+    penalized: Tuple[str, ...]                   # Classifications that rank a category among the worst
+    weights: Tuple[float, ...]                   # Category weights in layout order
+    total_weight: float
+    classification_weights: Mapping[str, float]  # Read-only copy shared by every GradeState
+    score_one: Callable[[float, Mapping[str, int], float], float]
+    # (category, *counts) -> (base score, score), filled as grades run (see _score_categories)
+    scores: Dict[Tuple, Tuple[float, float]] = field(default_factory=dict)
+
+
+class CategoryReports(abc.Mapping):
+    """
+    Read-only {category: PrivacyCategoryReport} view over one report's per-category arrays.
+
+    Scores, grades, weights and percentiles are lists indexed by category id, and found
+    issues are kept only for categories that have any. A PrivacyCategoryReport (with its
+    good/neutral/bad tuples) is built the first time a category is accessed, so grading
+    allocates nothing per category without findings and nothing per category nobody reads.
+    Everything a caller can reach is immutable, since cached reports are shared.
+    """
+    __slots__ = ('layout', 'scores', 'grades', 'weights', 'percentiles', 'found', '_reports')
+
+    def __init__(self, layout: CategoryLayout, scores: Tuple[float, ...], grades: Tuple[str, ...],
+                 weights: Tuple[float, ...], percentiles: Optional[Tuple[float, ...]],
+                 found: Dict[str, Sequence[Tuple[str, CompiledIssue]]],
+                 reports: Dict[str, PrivacyCategoryReport] = None):
+        self.layout = layout
+        self.scores = scores            # Rounded percentages, as in PrivacyCategoryReport.score
+        self.grades = grades
+        self.weights = weights
+        self.percentiles = percentiles  # None without a score distribution
+        self.found = found
+        # Reports already built for the same categories, scores and issues (see GradingSession)
+        self._reports: Dict[str, PrivacyCategoryReport] = {} if reports is None else reports
+
+    def __getitem__(self, category: str) -> PrivacyCategoryReport:
+        report = self._reports.get(category)
+        if report is None:
+            report = self._reports[category] = self._materialize(category)
+        return report
+
+    def _materialize(self, category: str) -> PrivacyCategoryReport:
+        i = self.layout.index[category]
+        good_issues, neutral_issues, bad_issues = [], [], []  # Bad includes blockers
+        for privacy_issue, entry in self.found.get(category, ()):
+            if entry.classification == 'good':
+                good_issues.append(privacy_issue)
+            elif entry.classification == 'neutral':
+                neutral_issues.append(privacy_issue)
+            else:
+                bad_issues.append(privacy_issue)
+
+        return PrivacyCategoryReport(
+            parent_category=category,
+            grade=self.grades[i],
+            score=self.scores[i],
+            good_issues=tuple(good_issues),
+            neutral_issues=tuple(neutral_issues),
+            bad_issues=tuple(bad_issues),
+            total_possible_issues=self.layout.total_possible_issues[i],
+            category_weight=self.weights[i],
+            percentile=None if self.percentiles is None else self.percentiles[i]
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.layout.categories)
+
+    def __len__(self) -> int:
+        return len(self.layout.categories)
+
+    def __contains__(self, category: object) -> bool:
+        return category in self.layout.index
+
+    def scores_by_category(self) -> Dict[str, float]:
+        """{category: score} straight from the score array."""
+        return dict(zip(self.layout.categories, self.scores))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CategorySelection(abc.Sequence):
+    """
+    Read-only sequence of some categories' reports from a CategoryReports, in a fixed order.
+    Each report is built on first access, like any other in the CategoryReports, so picking
+    the worst categories costs no report nobody reads. Compares equal to a tuple of the same reports.
+    """
+    __slots__ = ('reports', 'categories')
+
+    def __init__(self, reports: CategoryReports, categories: Tuple[str, ...]):
+        self.reports = reports
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        return self.reports[self.categories[index]]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (tuple, CategorySelection)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(tuple(self))
 
-@dataclass
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+
+@dataclass(frozen=True, slots=True)
 class PrivacyReport:
     """Container for privacy grading results."""
     overall_grade: str
     overall_score: float
-    parent_category_grades: Dict[str, PrivacyCategoryReport]
-    worst_parent_categories: List[PrivacyCategoryReport]
-    unknown_issues: Optional[List[str]] = None
+    parent_category_grades: Mapping[str, PrivacyCategoryReport]
+    worst_parent_categories: CategorySelection
+    # Tuples, or IssueLog views in GradingSession snapshots
+    unknown_issues: Optional[Sequence[str]] = None
+    resolved_issues: Optional[Sequence["ResolvedIssue"]] = None
+    overall_percentile: Optional[float] = None
+    grade_state: Optional[GradeState] = field(default=None, repr=False, compare=False)
 
 
 class PrivacyGrader:
-    def __init__(self, mapping_df: pd.DataFrame, category_weights: Dict[str, float] = None):
-        # Store mapping DataFrame and create set of valid issues (converted to lowercase)
+    # Everything a report depends on. Assigning any of these drops the memoized config
+    # version; replace them rather than mutating them in place
+    _CONFIG_ATTRIBUTES = frozenset({
+        'category_weights', 'classification_weights', 'grade_boundaries', 'scoring_rules',
+        'issue_index', 'all_parent_categories', 'issue_resolver', 'score_distribution',
+    })
+    _config_version_memo: Optional[int] = None
+    # Most (category, counts) scores kept per config; a category's counts take few distinct values
+    _SCORE_MEMO_SIZE = 16384
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in self._CONFIG_ATTRIBUTES:
+            object.__setattr__(self, '_config_version_memo', None)
+        object.__setattr__(self, name, value)
+
+    def __init__(self, mapping_df: "pd.DataFrame", category_weights: Dict[str, float] = None,
+                 cache_size: int = 128, resolve_unknown: bool = False, resolve_threshold: float = 0.8,
+                 scoring_rules: ScoringRules = None):
+        # Store mapping DataFrame (with lowercase issues) and build the grader from its rows
         self.mapping_df = mapping_df.copy()
         self.mapping_df['privacy_issue'] = self.mapping_df['privacy_issue'].str.lower()
-        self.valid_privacy_issues = set(self.mapping_df['privacy_issue'].unique())
-
-        # Classification weights
-        self.classification_weights = {
-            'blocker': -2.0,  # Much stronger penalty
-            'bad': -0.7,  # Stronger penalty
-            'neutral': 0.0,  # no impact
-            'good': 0.1  # positive impact
-        }
+        catalog_rows = list(zip(mapping_df['parent_issue'], mapping_df['privacy_issue'], mapping_df['classification']))
+        self._build(catalog_rows, category_weights, cache_size, resolve_unknown, resolve_threshold, scoring_rules)
+
+    @classmethod
+    def from_artifact(cls, artifact_path: str, category_weights: Dict[str, float] = None,
+                      cache_size: int = 128, resolve_unknown: bool = False,
+                      resolve_threshold: float = 0.8, scoring_rules: ScoringRules = None) -> "PrivacyGrader":
+        """
+        Build a grader from a compiled grading artifact (see grading_artifact.py) without
+        pandas. The artifact's category weights and scoring rules are used unless others are given.
+        """
+        artifact = load_grading_artifact(artifact_path)
+        grader = cls.__new__(cls)
+        grader.mapping_df = None
+        grader._build(
+            artifact['catalog_rows'],
+            artifact['category_weights'] if category_weights is None else category_weights,
+            cache_size, resolve_unknown, resolve_threshold,
+            ScoringRules.from_dict(artifact['scoring_rules']) if scoring_rules is None else scoring_rules
+        )
+        return grader
+
+    def _build(self, catalog_rows: List[Tuple[str, str, str]], category_weights: Optional[Dict[str, float]],
+               cache_size: int, resolve_unknown: bool, resolve_threshold: float,
+               scoring_rules: ScoringRules = None) -> None:
+        """Derive every lookup structure from (parent_issue, privacy_issue, classification) rows."""
+        self.catalog_rows = catalog_rows
+
+        # Create set of valid issues (converted to lowercase)
+        self.valid_privacy_issues = {privacy_issue.lower() for _, privacy_issue, _ in catalog_rows}
+
+        # Scoring rules (classification weights, caps and floors), compiled on first use
+        self.scoring_rules = DEFAULT_SCORING_RULES if scoring_rules is None else scoring_rules
+        self.classification_weights = dict(self.scoring_rules.classification_weights)
+        self._compiled_rules = None
+        self._stability_estimator = None
 
         # Get all unique parent categories
-        self.all_parent_categories = set(self.mapping_df['parent_issue'].unique())
+        self.all_parent_categories = {parent_issue for parent_issue, _, _ in catalog_rows}
 
         # Create mapping of parent categories to their child issues
         self.issues_by_category = self._create_category_mapping()
+        self._layout = None
+        self._tables = None
+        self._lines = None
 
         # Create case mapping dictionary for preserving original case in reports
-        self.case_mapping = self._create_case_mapping(mapping_df)
+        self.case_mapping = self._case_mapping_for(privacy_issue for _, privacy_issue, _ in catalog_rows)
 
         # Set up category weights (default to equal weights if none provided)
         if category_weights is None:
@@ -105,6 +415,9 @@ class PrivacyGrader:
         else:
             self.category_weights = category_weights
 
+        # Compile (parent, issue) lookup table so grading never scans the mapping
+        self.issue_index = self._compile_issue_index(catalog_rows)
+
         # Define grade boundaries
         self.grade_boundaries = {
             0.95: Grade.A,
@@ -114,19 +427,134 @@ class PrivacyGrader:
             # Below 65% = F
         }
 
-    def _create_case_mapping(self, original_df: pd.DataFrame) -> Dict[str, str]:
+        # Optional fuzzy matching of paraphrased issues that miss the exact lookup
+        self.issue_resolver = None
+        if resolve_unknown:
+            from .issue_resolver import IssueResolver
+            self.issue_resolver = IssueResolver(self.issue_index, resolve_threshold)
+
+        # Optional corpus score distribution for percentile ranks (see load_score_distribution)
+        self.score_distribution = None
+
+        # LRU cache of finished reports, keyed by canonical issue set and config version
+        self._init_report_cache(cache_size)
+
+    def _init_report_cache(self, cache_size: int) -> None:
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Each entry keeps the issue list it was graded from, to tell exact repeats from equivalent lists
+        self._report_cache: "OrderedDict[str, Tuple[Tuple[str, ...], PrivacyReport]]" = OrderedDict()
+        # The exact issue list of every entry, so an exact repeat skips normalizing and hashing
+        self._report_cache_keys: Dict[Tuple[str, ...], str] = {}
+        self._report_cache_version = None
+        self._report_cache_lock = threading.Lock()
+
+    def with_category_weights(self, category_weights: Dict[str, float], cache_size: int = None) -> "PrivacyGrader":
+        """
+        Derive a grader that scores with other category weights (merged over this grader's).
+        The catalog, issue index, resolver and scoring rules are shared rather than rebuilt,
+        so a derived grader costs only its weights and its own report cache. The score
+        distribution is not shared: it ranks scores graded under this grader's weights, so the
+        derived grader reports no percentiles until one built for its weights is loaded.
+        """
+        unknown = set(category_weights) - self.all_parent_categories
+        if unknown:
+            raise ValueError(f"Category weights reference unknown categories: {sorted(unknown)}")
+
+        grader = copy.copy(self)
+        grader.category_weights = {**self.category_weights, **category_weights}
+        grader.classification_weights = dict(self.classification_weights)
+        grader.grade_boundaries = dict(self.grade_boundaries)
+        grader.score_distribution = None
+        grader._init_report_cache(self.cache_size if cache_size is None else cache_size)
+        return grader
+
+    def load_score_distribution(self, distribution_path: str) -> None:
+        """Load a precomputed corpus score distribution, so reports carry percentile ranks."""
+        from .score_distribution import ScoreDistribution
+        self.score_distribution = ScoreDistribution.load(distribution_path)
+
+    def _create_case_mapping(self, original_df: "pd.DataFrame") -> Dict[str, str]:
         """Create mapping of lowercase issues to their original case."""
-        return dict(zip(original_df['privacy_issue'].str.lower(), original_df['privacy_issue']))
+        return self._case_mapping_for(original_df['privacy_issue'])
+
+    @staticmethod
+    def _case_mapping_for(privacy_issues: Iterable[str]) -> Dict[str, str]:
+        """Map each lowercase issue to its original case (later duplicates win)."""
+        return {privacy_issue.lower(): privacy_issue for privacy_issue in privacy_issues}
+
+    def _compile_issue_index(self, catalog_rows: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str], CompiledIssue]:
+        """Create lookup of normalized (parent, issue) pairs to their classification and original-case text."""
+        issue_index = {}
+        for parent_issue, privacy_issue, classification in catalog_rows:
+            key = (parent_issue, privacy_issue.lower())
+            if key in issue_index:
+                continue  # Keep the first row, as the old mask lookup did
+            issue_index[key] = CompiledIssue(
+                parent_issue=parent_issue,
+                privacy_issue=privacy_issue,
+                classification=classification
+            )
+        return issue_index
 
     def _create_category_mapping(self) -> Dict[str, List[str]]:
         """Create dictionary of all possible child issues by parent category."""
-        category_mapping = {}
-        for category in self.all_parent_categories:
-            category_mapping[category] = self.mapping_df[
-                self.mapping_df['parent_issue'] == category
-                ]['privacy_issue'].tolist()
+        category_mapping = {category: [] for category in self.all_parent_categories}
+        for parent_issue, privacy_issue, _ in self.catalog_rows:
+            if parent_issue in category_mapping:
+                category_mapping[parent_issue].append(privacy_issue.lower())
         return category_mapping
 
+    def _category_layout(self) -> CategoryLayout:
+        """The category order report arrays use, rebuilt only if the category set is replaced."""
+        layout = self._layout
+        if layout is None or layout[0] is not self.all_parent_categories:
+            categories = tuple(self.all_parent_categories)
+            layout = self._layout = (self.all_parent_categories, CategoryLayout(
+                categories=categories,
+                index={category: i for i, category in enumerate(categories)},
+                total_possible_issues=tuple(len(self.issues_by_category[category]) for category in categories)
+            ))
+        return layout[1]
+
+    def _grading_tables(self) -> GradingTables:
+        """The layout, grade boundaries and weights grading reads, rebuilt only when the config version changes."""
+        config_version = self._config_version()
+        tables = self._tables
+        if tables is None or tables[0] != config_version:
+            layout = self._category_layout()
+            boundaries = sorted(self.grade_boundaries.items(), reverse=True)
+            weights = tuple(self.category_weights[category] for category in layout.categories)
+            tables = self._tables = (config_version, GradingTables(
+                layout=layout,
+                boundaries=[(threshold, grade.value) for threshold, grade in boundaries] + [(-inf, Grade.F.value)],
+                clean_grade=self._grade_for(1.0, boundaries).value,
+                penalized=tuple(c for c in self.classification_weights if c not in ('good', 'neutral')),
+                weights=weights,
+                total_weight=sum(weights),
+                classification_weights=MappingProxyType(dict(self.classification_weights)),
+                score_one=self.compiled_scoring_rules().score_one
+            ))
+        return tables[1]
+
+    def _catalog_lines(self) -> Dict[str, Tuple[str, CompiledIssue]]:
+        """
+        Each catalog entry written as "Parent: Issue" (the form the model is prompted with), mapped
+        to what _parse_issues would make of that exact string. Rebuilt only if the index is replaced.
+        """
+        lines = self._lines
+        if lines is None or lines[0] is not self.issue_index:
+            issue_index = self.issue_index
+            catalog_lines = {}
+            for entry in issue_index.values():
+                line = f"{entry.parent_issue}: {entry.privacy_issue}"
+                parent_issue, privacy_issue = map(str.strip, line.split(':', 1))
+                if issue_index.get((parent_issue, privacy_issue.lower())) is entry:
+                    catalog_lines[line] = (privacy_issue, entry)
+            lines = self._lines = (issue_index, catalog_lines)
+        return lines[1]
+
     def _validate_issues(self, found_issues: List[str]) -> Tuple[List[str], List[str]]:
         """Separate valid and unknown issues."""
         valid_issues = []
@@ -147,175 +575,470 @@ class PrivacyGrader:
                 unknown_issues.append(issue)
 
         return valid_issues, unknown_issues
-    def _calculate_category_scores(self, valid_issues: List[str]) -> Dict[str, float]:
-        """Calculate scores based on issue classifications with stricter penalties."""
-        category_scores = {category: 1.0 for category in self.all_parent_categories}
 
-        issues_by_category: Dict[str, List[str]] = {}
+    def _parse_issues(self, privacy_issues: List[str]) -> Tuple[Dict[str, List[Tuple[str, CompiledIssue]]], List[str]]:
+        """
+        _validate_issues and _group_issues in one pass over the strings: the catalog hits grouped
+        by parent category, and the unknown issues. A known issue under the wrong parent is in neither.
+        """
+        issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]] = {}
+        unknown_issues = []
+        issue_index = self.issue_index
+        catalog_lines = self._catalog_lines()
+        for issue in privacy_issues:
+            # Issues copied verbatim from the catalog skip splitting, stripping and lowercasing
+            hit = catalog_lines.get(issue)
+            if hit is not None:
+                issues_by_category.setdefault(hit[1].parent_issue, []).append(hit)
+                continue
+            if ':' not in issue:
+                unknown_issues.append(issue)
+                continue
+            parent_issue, privacy_issue = map(str.strip, issue.split(':', 1))
+            issue_lower = privacy_issue.lower()
+
+            entry = issue_index.get((parent_issue, issue_lower))
+            if entry is not None:
+                issues_by_category.setdefault(parent_issue, []).append((privacy_issue, entry))
+            elif issue_lower not in self.valid_privacy_issues:
+                unknown_issues.append(issue)
+        return issues_by_category, unknown_issues
+
+    def _add_resolved(self, issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]],
+                      resolved_issues: List["ResolvedIssue"]) -> None:
+        """Group resolver hits after the direct hits, as if appended to the issue list."""
+        for category, found_issues in self._group_issues([resolved.resolved for resolved in resolved_issues]).items():
+            issues_by_category.setdefault(category, []).extend(found_issues)
+
+    def _group_issues(self, valid_issues: List[str]) -> Dict[str, List[Tuple[str, CompiledIssue]]]:
+        """Resolve each issue once against the compiled index and group the hits by parent category."""
+        issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]] = {}
         for item in valid_issues:
             if ':' not in item:
                 continue
             parent_issue, privacy_issue = map(str.strip, item.split(':', 1))
 
-            if parent_issue not in self.all_parent_categories:
+            entry = self.issue_index.get((parent_issue, privacy_issue.lower()))
+            if entry is None:
                 continue
 
-            if parent_issue not in issues_by_category:
-                issues_by_category[parent_issue] = []
-            issues_by_category[parent_issue].append(privacy_issue.lower())
-
-        for category in self.all_parent_categories:
-            found_issues = issues_by_category.get(category, [])
-            if not found_issues:
-                continue
+            issues_by_category.setdefault(parent_issue, []).append((privacy_issue, entry))
+        return issues_by_category
 
-            base_score = 1.0
-            issue_classifications = []
+    def _calculate_category_scores(self, valid_issues: List[str]) -> Dict[str, float]:
+        """Calculate scores based on issue classifications with stricter penalties."""
+        return self._score_grouped_issues(self._group_issues(valid_issues))
 
-            # Get classifications for each issue
-            for issue in found_issues:
-                classification = self.mapping_df[
-                    (self.mapping_df['parent_issue'] == category) &
-                    (self.mapping_df['privacy_issue'].str.lower() == issue.lower())
-                    ]['classification'].iloc[0]
-                issue_classifications.append(classification)
+    def _score_grouped_issues(self, issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]]) -> Dict[str, float]:
+        """Score categories from issues already resolved by _group_issues."""
+        return self._score_category_states(self._category_states(issues_by_category))
 
-                # Apply impact from classification
-                base_score += self.classification_weights[classification]
+    def _category_states(self, issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]]) -> CategoryStates:
+        """Count each category's issues by classification and compute its uncapped base score."""
+        return self._score_categories(issues_by_category)[0]
 
+    def _score_categories(self, issues_by_category: Dict[str, List[Tuple[str, CompiledIssue]]]
+                          ) -> Tuple[CategoryStates, Dict[str, float]]:
+        """
+        The categories' states and their scores under this grader's weights, in one pass. Under
+        one config a score depends only on the category and its counts, so each such pair is
+        scored once and looked up in every later grade.
+        """
+        tables = self._grading_tables()
+        memo, score_one = tables.scores, tables.score_one
+        classification_weights, category_weights = self.classification_weights, self.category_weights
+        counts_by_category, base_scores, category_scores = {}, {}, {}
+        for category, found_issues in issues_by_category.items():
             # Count types of issues
-            blocker_count = issue_classifications.count('blocker')
-            bad_count = issue_classifications.count('bad')
-            good_count = issue_classifications.count('good')
-
-            # Enhanced penalty rules
-            if blocker_count > 0:
-                # Severe penalty for any blockers
-                base_score = min(base_score, 0.3)
-            elif bad_count > 0:
-                # Cap score if there are any bad issues
-                base_score = min(base_score, 0.7)
-
-            # Reduce the minimum score for all good issues
-            if len(found_issues) == good_count:
-                base_score = max(base_score, 0.7)
-
-            # Apply category weight
-            score = base_score * self.category_weights[category]
-
-            # Ensure score stays within bounds
-            category_scores[category] = max(min(score, 1.0), 0.0)
-
+            counts = dict.fromkeys(classification_weights, 0)
+            for _, entry in found_issues:
+                counts[entry.classification] += 1
+            counts_by_category[category] = counts
+
+            key = (category, *counts.values())
+            scored = memo.get(key)
+            if scored is None:
+                base_score = self._base_score(counts, classification_weights)
+                scored = (base_score, score_one(base_score, counts, category_weights[category]))
+                if len(memo) < self._SCORE_MEMO_SIZE:
+                    memo[key] = scored
+            base_scores[category], category_scores[category] = scored
+        return CategoryStates(counts_by_category, base_scores), category_scores
+
+    def compiled_scoring_rules(self) -> "CompiledScoringRules":
+        """The scoring rules compiled for the current classification weights (recompiled if they change)."""
+        key = (id(self.scoring_rules), tuple(self.classification_weights.items()))
+        compiled = self._compiled_rules
+        if compiled is None or compiled[0] != key:
+            compiled = self._compiled_rules = (key, self.scoring_rules.compile(self.classification_weights))
+        return compiled[1]
+
+    def _score_category_states(self, category_states: CategoryStates,
+                               category_weights: Dict[str, float] = None) -> Dict[str, float]:
+        """Score every category from its state; categories without findings score 1.0."""
+        category_scores = dict.fromkeys(self.all_parent_categories, 1.0)
+        category_scores.update(self._score_states(category_states, category_weights))
         return category_scores
 
+    def _score_states(self, category_states: CategoryStates,
+                      category_weights: Dict[str, float] = None) -> Dict[str, float]:
+        """Score just the given categories' states (one service, so in plain Python; BatchGrader vectorizes)."""
+        if category_weights is None:
+            category_weights, score_one = self.category_weights, self._grading_tables().score_one
+        else:
+            score_one = self.compiled_scoring_rules().score_one
+        base_scores = category_states.base_scores
+        return {
+            category: score_one(base_scores[category], counts, category_weights[category])
+            for category, counts in category_states.counts.items()
+        }
+
+    def _score_category(self, category: str, counts: Dict[str, int]) -> float:
+        """Score one category from its per-classification issue counts."""
+        base_score = self._base_score(counts, self.classification_weights)
+        return self._score_category_states(CategoryStates({category: counts}, {category: base_score}))[category]
 
-    def _calculate_overall_score(self, category_scores: Dict[str, float]) -> float:
+    @staticmethod
+    def _base_score(counts: Dict[str, int], classification_weights: Dict[str, float]) -> float:
+        """
+        Uncapped category score. The arithmetic is done in classification_weights order so
+        the vectorized batch path reproduces it bit for bit.
+        """
+        # Apply impact from each classification
+        base_score = 1.0
+        for classification, weight in classification_weights.items():
+            base_score += counts.get(classification, 0) * weight
+        return base_score
+
+    def _calculate_overall_score(self, category_scores: Dict[str, float],
+                                 category_weights: Dict[str, float] = None) -> float:
         """Calculate overall score as weighted average of category scores."""
-        total_weight = sum(self.category_weights[cat] for cat in category_scores.keys())
+        category_weights = self.category_weights if category_weights is None else category_weights
+        total_weight = sum(category_weights[cat] for cat in category_scores.keys())
 
         if total_weight == 0:
             return 0.0
 
         weighted_sum = sum(
-            score * self.category_weights[category]
+            score * category_weights[category]
             for category, score in category_scores.items()
         )
 
         return weighted_sum / total_weight
 
-    def _get_grade(self, score: float) -> Grade:
+    def _overall_score(self, found_scores: Dict[str, float]) -> float:
+        """
+        _calculate_overall_score over every category, given the scores of the categories with
+        findings (the rest score 1.0). Sums in the same order, so the result is identical.
+        """
+        tables = self._grading_tables()
+        if tables.total_weight == 0:
+            return 0.0
+        scores = [1.0] * len(tables.weights)
+        index = tables.layout.index
+        for category, score in found_scores.items():
+            scores[index[category]] = score
+        return sum(map(mul, scores, tables.weights)) / tables.total_weight
+
+    def _get_grade(self, score: float, grade_boundaries: Dict[float, Grade] = None) -> Grade:
         """Convert numerical score to letter grade using grade boundaries."""
-        for threshold, grade in sorted(self.grade_boundaries.items(), reverse=True):
+        grade_boundaries = self.grade_boundaries if grade_boundaries is None else grade_boundaries
+        return self._grade_for(score, sorted(grade_boundaries.items(), reverse=True))
+
+    @staticmethod
+    def _grade_for(score: float, sorted_boundaries: List[Tuple[float, Grade]]) -> Grade:
+        """Letter grade from boundaries already sorted from the highest threshold down."""
+        for threshold, grade in sorted_boundaries:
             if score >= threshold:
                 return grade
         return Grade.F
 
+    @staticmethod
+    def _letter_for(score: float, letter_boundaries: List[Tuple[float, str]]) -> str:
+        """_grade_for(...).value from GradingTables.boundaries, without Enum lookups per category."""
+        for threshold, letter in letter_boundaries:
+            if score >= threshold:
+                return letter
+        return Grade.F.value  # Only NaN misses the -inf entry
+
     def _restore_original_case(self, issues: List[str]) -> List[str]:
         """Restore the original case of issues using the case mapping."""
         return [self.case_mapping.get(issue, issue) for issue in issues]
 
+    def _config_version(self) -> int:
+        """
+        Fingerprint of the weights, boundaries and catalog that a report depends on, computed
+        once and kept until one of them is reassigned (see _CONFIG_ATTRIBUTES).
+        """
+        version = self._config_version_memo
+        if version is None:
+            version = self._config_version_memo = hash((
+                tuple(self.category_weights.items()),
+                tuple(self.classification_weights.items()),
+                tuple(self.grade_boundaries.items()),
+                id(self.issue_index), len(self.issue_index),
+                id(self.all_parent_categories), len(self.all_parent_categories),
+                id(self.issue_resolver), getattr(self.issue_resolver, 'threshold', None),
+                id(self.score_distribution), id(self.scoring_rules),
+            ))
+        return version
+
+    @staticmethod
+    def _normalize_issue(issue: str) -> str:
+        """An issue string as the report cache compares it: stripped, with the issue part lowercased."""
+        if ':' in issue:
+            parent_issue, privacy_issue = map(str.strip, issue.split(':', 1))
+            return f"{parent_issue}:{privacy_issue.lower()}"
+        return issue.strip()
+
+    def _canonical_issue_key(self, privacy_issues: List[str]) -> str:
+        """Hash the normalized issue multiset, so reordered or re-cased lists share a key."""
+        normalized = sorted(self._normalize_issue(issue) for issue in privacy_issues)
+        return hashlib.blake2b("\n".join(normalized).encode(), digest_size=16).hexdigest()
+
+    def clear_report_cache(self) -> None:
+        """Drop all cached reports and reset the hit/miss counters."""
+        with self._report_cache_lock:
+            self._report_cache.clear()
+            self._report_cache_keys.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
     def grade_privacy_issues(self, privacy_issues: List[str]) -> Optional[PrivacyReport]:
         """
         Grade privacy issues and generate a comprehensive report with issues grouped by classification.
+        Reports are cached by issue set, so repeated grades of the same policy reuse one
+        immutable report; the cache is flushed whenever the weights, boundaries or catalog change.
+        A reordered or re-cased list shares the cached scores but gets its own issue strings.
         """
-        valid_issues, unknown_issues = self._validate_issues(privacy_issues)
+        if self.cache_size <= 0:
+            return self._grade_privacy_issues(privacy_issues)
+
+        issues = tuple(privacy_issues)
+        config_version = self._config_version()
+
+        with self._report_cache_lock:
+            if config_version != self._report_cache_version:
+                self._report_cache.clear()
+                self._report_cache_keys.clear()
+                self._report_cache_version = config_version
+
+            # An exact repeat is a dict lookup; only other lists pay for the canonical key
+            cache_key = self._report_cache_keys.get(issues)
+            if cache_key is not None:
+                self._report_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return self._report_cache[cache_key][1]
+
+        cache_key = self._canonical_issue_key(privacy_issues)
+        with self._report_cache_lock:
+            cached = self._report_cache.get(cache_key)
+            if cached is not None:
+                self._report_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+        if cached is not None:
+            cached_issues, report = cached
+            return report if cached_issues == issues else self._rebind_report(report, privacy_issues)
 
-        if not valid_issues and not unknown_issues:
+        report = self._grade_privacy_issues(privacy_issues)
+        if report is None:
+            return None
+
+        with self._report_cache_lock:
+            if config_version == self._report_cache_version:
+                replaced = self._report_cache.get(cache_key)
+                if replaced is not None:
+                    del self._report_cache_keys[replaced[0]]
+                self._report_cache[cache_key] = (issues, report)
+                self._report_cache_keys[issues] = cache_key
+                while len(self._report_cache) > self.cache_size:
+                    _, (evicted_issues, _) = self._report_cache.popitem(last=False)
+                    del self._report_cache_keys[evicted_issues]
+        return report
+
+    def _rebind_report(self, report: PrivacyReport, privacy_issues: List[str]) -> PrivacyReport:
+        """
+        A cached report for an equivalent issue list (same canonical key) rebuilt around this
+        caller's strings: scores, grades and category states are reused, while the echoed issues,
+        their order and the order of categories follow privacy_issues.
+        """
+        found, unknown_issues = self._parse_issues(privacy_issues)
+
+        # Equivalent strings resolve alike, so reuse the cached resolutions instead of re-scoring
+        resolved_issues = []
+        if report.resolved_issues:
+            resolutions = {self._normalize_issue(resolved.original): resolved for resolved in report.resolved_issues}
+            still_unknown = []
+            for issue in unknown_issues:
+                resolved = resolutions.get(self._normalize_issue(issue))
+                if resolved is None:
+                    still_unknown.append(issue)
+                else:
+                    resolved_issues.append(replace(resolved, original=issue))
+            unknown_issues = still_unknown
+            self._add_resolved(found, resolved_issues)
+
+        cached = report.parent_category_grades
+        category_grades = CategoryReports(cached.layout, cached.scores, cached.grades, cached.weights,
+                                          cached.percentiles, found)
+        states = report.grade_state.categories
+        return replace(
+            report,
+            parent_category_grades=category_grades,
+            worst_parent_categories=self._worst_categories(category_grades, states.counts),
+            unknown_issues=tuple(unknown_issues) if unknown_issues else None,
+            resolved_issues=tuple(resolved_issues) if resolved_issues else None,
+            grade_state=replace(report.grade_state, categories=CategoryStates(
+                {category: states.counts[category] for category in found},
+                {category: states.base_scores[category] for category in found}
+            ))
+        )
+
+    def _grade_privacy_issues(self, privacy_issues: List[str]) -> Optional[PrivacyReport]:
+        """Build a report from scratch, bypassing the report cache."""
+        # Every issue is either valid or unknown, so there is nothing to grade only for an empty list
+        if not privacy_issues:
             print("No valid privacy issues found.")
             return None
 
-        # Group issues by category and classification
-        issues_by_category: Dict[str, Dict[str, List[str]]] = {}
+        # Resolve every issue once against the compiled index, grouping the hits by category
+        resolved_by_category, unknown_issues = self._parse_issues(privacy_issues)
 
-        for issue in valid_issues:
-            if ':' not in issue:
-                continue
+        # Map paraphrased unknown issues onto the catalog when a resolver is configured
+        resolved_issues = []
+        if self.issue_resolver is not None and unknown_issues:
+            resolved_issues, unknown_issues = self.issue_resolver.resolve(unknown_issues)
+            self._add_resolved(resolved_by_category, resolved_issues)
 
-            parent_issue, privacy_issue = map(str.strip, issue.split(':', 1))
+        # Calculate scores, keeping the per-category state for what-if re-grading. Only
+        # categories with findings are scored; the rest score 1.0
+        category_states, category_scores = self._score_categories(resolved_by_category)
 
-            if parent_issue not in self.all_parent_categories:
-                continue
+        # Category reports stay compact: arrays plus the resolved issues of categories with findings
+        category_grades = self._category_reports(category_scores, resolved_by_category)
+        return self._assemble_report(self._overall_score(category_scores), category_grades, category_states,
+                                     tuple(unknown_issues), tuple(resolved_issues))
 
-            if parent_issue not in issues_by_category:
-                issues_by_category[parent_issue] = {
-                    'good': [],
-                    'neutral': [],
-                    'bad': []  # Will include both bad and blocker
-                }
-
-            # Get classification from mapping_df
-            classification = self.mapping_df[
-                (self.mapping_df['parent_issue'] == parent_issue) &
-                (self.mapping_df['privacy_issue'].str.lower() == privacy_issue.lower())
-                ]['classification'].iloc[0]
-
-            # Group into good, neutral, or bad (including blockers)
-            if classification == 'good':
-                issues_by_category[parent_issue]['good'].append(privacy_issue)
-            elif classification == 'neutral':
-                issues_by_category[parent_issue]['neutral'].append(privacy_issue)
-            else:  # 'bad' or 'blocker'
-                issues_by_category[parent_issue]['bad'].append(privacy_issue)
-
-        # Calculate scores
-        category_scores = self._calculate_category_scores(valid_issues)
-
-        # Create detailed category reports
-        category_grades = {}
-        for category in self.all_parent_categories:
+    def _category_reports(self, category_scores: Dict[str, float],
+                          found: Dict[str, List[Tuple[str, CompiledIssue]]]) -> CategoryReports:
+        """
+        Lay every category's score, grade, weight and percentile out in category order. Only
+        categories with findings are rounded and graded; the rest score 1.0 and share one grade.
+        """
+        tables = self._grading_tables()
+        layout, boundaries, letter_for = tables.layout, tables.boundaries, self._letter_for
+        n_categories = len(layout.categories)
+        rounded_scores = [100.0] * n_categories
+        grades = [tables.clean_grade] * n_categories
+        for category in found:
+            i = layout.index[category]
             score = category_scores[category]
-            grade = self._get_grade(score)
-
-            category_grades[category] = PrivacyCategoryReport(
-                parent_category=category,
-                grade=grade.value,
-                score=round(score * 100, 2),
-                good_issues=issues_by_category.get(category, {}).get('good', []),
-                neutral_issues=issues_by_category.get(category, {}).get('neutral', []),
-                bad_issues=issues_by_category.get(category, {}).get('bad', []),
-                total_possible_issues=len(self.issues_by_category[category]),
-                category_weight=self.category_weights[category]
-            )
+            rounded_scores[i] = round(score * 100, 2)
+            grades[i] = letter_for(score, boundaries)
+
+        distribution = self.score_distribution
+        return CategoryReports(
+            layout,
+            scores=tuple(rounded_scores),
+            grades=tuple(grades),
+            weights=tables.weights,
+            percentiles=tuple(
+                distribution.category_percentile(category, score)
+                for category, score in zip(layout.categories, rounded_scores)
+            ) if distribution else None,
+            found=found
+        )
 
-        # Calculate overall score and grade
-        overall_score = self._calculate_overall_score(category_scores)
-        overall_grade = self._get_grade(overall_score)
+    def _assemble_report(self, overall_score: float, category_grades: CategoryReports,
+                         category_states: CategoryStates, unknown_issues: Sequence[str],
+                         resolved_issues: Sequence["ResolvedIssue"]) -> PrivacyReport:
+        """Combine finished category reports into the overall report."""
+        tables = self._grading_tables()
+        distribution = self.score_distribution
+        rounded_overall = round(overall_score * 100, 2)
+        return PrivacyReport(
+            overall_grade=self._letter_for(overall_score, tables.boundaries),
+            overall_score=rounded_overall,
+            parent_category_grades=category_grades,
+            worst_parent_categories=self._worst_categories(category_grades, category_states.counts),
+            unknown_issues=unknown_issues if unknown_issues else None,
+            resolved_issues=resolved_issues if resolved_issues else None,
+            overall_percentile=distribution.overall_percentile(rounded_overall) if distribution else None,
+            grade_state=GradeState(categories=category_states, classification_weights=tables.classification_weights)
+        )
 
-        # Identify worst categories (those with bad issues)
-        worst_categories = sorted(
+    def _worst_categories(self, category_grades: CategoryReports,
+                          category_counts: Mapping[str, Mapping[str, int]]) -> CategorySelection:
+        """
+        The (at most five) lowest-scoring categories with bad or blocker issues, told apart by
+        their counts rather than by scanning their issues; their reports are built when read.
+        """
+        index, scores = category_grades.layout.index, category_grades.scores
+        penalized = self._grading_tables().penalized
+        worst = sorted(
             [
-                report for category, report in category_grades.items()
-                if report.bad_issues
+                category for category in category_grades.found
+                if any(map(category_counts[category].get, penalized))
             ],
-            key=lambda x: x.score
-        )[:5]
+            key=lambda category: scores[index[category]]
+        )
+        return CategorySelection(category_grades, tuple(worst[:5]))
 
-        return PrivacyReport(
-            overall_grade=overall_grade.value,
+    def session(self) -> "GradingSession":
+        """Start an incremental grading session (see GradingSession)."""
+        return GradingSession(self)
+
+    def grade_stability(self, privacy_issues: List[str], n_samples: int = 2000, drop_rate: float = 0.1,
+                        add_rate: float = 0.05, seed: Optional[int] = None) -> "GradeStability":
+        """
+        Estimate how stable the overall grade is under extraction noise by grading n_samples
+        perturbed copies of the issue list in one vectorized pass (see grade_stability.py).
+        """
+        from .grade_stability import StabilityEstimator
+
+        config_version = self._config_version()
+        cached = self._stability_estimator
+        if cached is None or cached[0] != config_version:
+            cached = self._stability_estimator = (config_version, StabilityEstimator(self))
+        return cached[1].estimate(privacy_issues, n_samples, drop_rate, add_rate, seed)
+
+    def what_if(self, grade_state: GradeState,
+                category_weights: Dict[str, float] = None,
+                classification_weights: Dict[str, float] = None,
+                grade_boundaries: Dict[float, Grade] = None) -> WhatIfResult:
+        """
+        Re-score a previous grade (report.grade_state) under alternative weights or grade
+        boundaries. Only the per-category aggregation is recomputed, in O(categories); base
+        scores are reused unless the classification weights change. Category weights and
+        boundaries default to this grader's settings, classification weights to the ones the
+        state was graded with.
+        """
+        category_weights = self.category_weights if category_weights is None else category_weights
+        classification_weights = (
+            grade_state.classification_weights if classification_weights is None else classification_weights
+        )
+
+        category_states = grade_state.categories
+        if classification_weights != grade_state.classification_weights:
+            category_states = CategoryStates(category_states.counts, {
+                category: self._base_score(counts, classification_weights)
+                for category, counts in category_states.counts.items()
+            })
+
+        category_scores = self._score_category_states(category_states, category_weights)
+        overall_score = self._calculate_overall_score(category_scores, category_weights)
+
+        return WhatIfResult(
+            overall_grade=self._get_grade(overall_score, grade_boundaries).value,
             overall_score=round(overall_score * 100, 2),
-            parent_category_grades=category_grades,
-            worst_parent_categories=worst_categories,
-            unknown_issues=unknown_issues if unknown_issues else None
+            category_scores={category: round(score * 100, 2) for category, score in category_scores.items()},
+            category_grades={
+                category: self._get_grade(score, grade_boundaries).value
+                for category, score in category_scores.items()
+            }
         )
 
     def save_grade_to_csv(service_name: str, grade: str, csv_path: str = 'privacy_grades.csv') -> None:
@@ -323,11 +1046,15 @@ class PrivacyGrader:
         Save or update privacy grade for a service in CSV file.
         If service already exists, preserve the existing grade.
 
+        This rewrites the whole file on every call; use GradeStore (grade_store.py) for
+        anything beyond a handful of services and GradeStore.export_csv for a CSV copy.
+
         Args:
             service_name: Name of the service being graded
             grade: Privacy grade (A-F)
             csv_path: Path to CSV file storing grades
         """
+        import pandas as pd
         try:
             # Try to read existing CSV file
             try:
@@ -354,8 +1081,146 @@ class PrivacyGrader:
         except Exception as e:
             print(f"Error saving grade to CSV: {str(e)}")
 
+
+class GradingSession:
+    """
+    Incremental grading of an issue stream, e.g. a long document analyzed part by part.
+
+    Each batch is validated, resolved and grouped once, appended to per-category lists that
+    are never copied, and folded into running per-category counts. Only the categories a
+    batch touches are rescored, regraded and re-reported; every other category keeps its
+    array entries, issue view and already built report from the previous snapshot, so a
+    batch costs its own issues plus O(categories), never a rescan of earlier issues. Every
+    snapshot equals what grade_privacy_issues would return for all issues added so far.
+    """
+
+    def __init__(self, grader: PrivacyGrader):
+        self.grader = grader
+        self.unknown_issues: List[str] = []
+        self.resolved_issues: List["ResolvedIssue"] = []
+        self._has_issues = False
+        self._config_version = grader._config_version()
+
+        # Direct catalog hits and resolver hits are kept apart, because a one-shot grade
+        # lists every resolved issue after the direct ones
+        self._direct: Dict[str, List[Tuple[str, CompiledIssue]]] = {}
+        self._resolved: Dict[str, List[Tuple[str, CompiledIssue]]] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._found: Dict[str, IssueLog] = {}
+
+        # Copies of the counts as of each category's last change, and their base scores
+        self._state_counts: Dict[str, Dict[str, int]] = {}
+        self._base_scores: Dict[str, float] = {}
+        self._category_scores = dict.fromkeys(grader.all_parent_categories, 1.0)
+        self._reset_arrays()
+
+    def _reset_arrays(self) -> None:
+        """Lay out the report arrays for the grader's current categories, as if nothing were found."""
+        grader = self.grader
+        self._layout = grader._category_layout()
+        empty = grader._category_reports(dict.fromkeys(self._layout.categories, 1.0), {})
+        self._scores = list(empty.scores)
+        self._grades = list(empty.grades)
+        self._weights = list(empty.weights)
+        self._percentiles = None if empty.percentiles is None else list(empty.percentiles)
+        self._last: Optional[CategoryReports] = None
+
+    def add(self, privacy_issues: List[str]) -> Optional[PrivacyReport]:
+        """Fold a batch of issue strings into the session and return the updated snapshot."""
+        grader = self.grader
+        found, unknown_issues = grader._parse_issues(privacy_issues)
+        self._has_issues = self._has_issues or bool(privacy_issues)
+
+        resolved_issues = []
+        if grader.issue_resolver is not None and unknown_issues:
+            resolved_issues, unknown_issues = grader.issue_resolver.resolve(unknown_issues)
+        self.unknown_issues.extend(unknown_issues)
+        self.resolved_issues.extend(resolved_issues)
+
+        changed = set()
+        for bucket, issues_by_category in (
+                (self._direct, found),
+                (self._resolved, grader._group_issues([resolved.resolved for resolved in resolved_issues]))):
+            for category, found_issues in issues_by_category.items():
+                bucket.setdefault(category, []).extend(found_issues)
+                counts = self._counts.setdefault(category, dict.fromkeys(grader.classification_weights, 0))
+                for _, entry in found_issues:
+                    counts[entry.classification] += 1
+                changed.add(category)
+
+        # Weights, rules, boundaries or catalog changed since the last batch: re-report every category
+        config_version = grader._config_version()
+        if config_version != self._config_version:
+            self._config_version = config_version
+            self._reset_arrays()
+            changed = set(self._layout.categories)
+
+        self._update(changed)
+        return self.snapshot()
+
+    def _update(self, changed: Iterable[str]) -> None:
+        """Rescore and regrade the changed categories and take fresh views of their issues."""
+        grader = self.grader
+        changed = [category for category in changed if category in self._counts]
+        states = CategoryStates(
+            {category: dict(self._counts[category]) for category in changed},
+            {category: grader._base_score(self._counts[category], grader.classification_weights)
+             for category in changed}
+        )
+        self._state_counts.update(states.counts)
+        self._base_scores.update(states.base_scores)
+        self._category_scores.update(grader._score_states(states))
+
+        boundaries = sorted(grader.grade_boundaries.items(), reverse=True)
+        distribution = grader.score_distribution
+        for category in changed:
+            i = self._layout.index[category]
+            score = self._category_scores[category]
+            self._scores[i] = round(score * 100, 2)
+            self._grades[i] = grader._grade_for(score, boundaries).value
+            if distribution:
+                self._percentiles[i] = distribution.category_percentile(category, self._scores[i])
+            self._found[category] = IssueLog(self._direct.get(category, []), self._resolved.get(category, []))
+
+        # Reports of unchanged categories carry over to the next snapshot as they are
+        if self._last is not None:
+            self._last = CategoryReports(
+                self._layout, self._last.scores, self._last.grades, self._last.weights, self._last.percentiles,
+                self._last.found,
+                {category: report for category, report in self._last._reports.items() if category not in changed}
+            )
+
+    def snapshot(self) -> Optional[PrivacyReport]:
+        """The report for every issue added so far (None until any issue has been added)."""
+        if not self._has_issues:
+            return None
+
+        # Category state order follows first appearance, direct hits before resolved ones
+        order = list(self._direct) + [category for category in self._resolved if category not in self._direct]
+        reports = {} if self._last is None else self._last._reports
+        category_grades = self._last = CategoryReports(
+            self._layout,
+            scores=tuple(self._scores),
+            grades=tuple(self._grades),
+            weights=tuple(self._weights),
+            percentiles=None if self._percentiles is None else tuple(self._percentiles),
+            found={category: self._found[category] for category in order},
+            reports=reports
+        )
+        return self.grader._assemble_report(
+            self.grader._calculate_overall_score(self._category_scores),
+            category_grades,
+            CategoryStates({category: self._state_counts[category] for category in order},
+                           {category: self._base_scores[category] for category in order}),
+            IssueLog(self.unknown_issues),
+            IssueLog(self.resolved_issues)
+        )
+
+
 # Example usage
 if __name__ == "__main__":
+    import pandas as pd
+    from .get_issues import process_pdf_privacy_issues
     # mapping parent to child issues
     mapping_df = pd.read_csv("mapping_df.csv")
     mapping_path = "/app/mapping_df.csv"
@@ -434,4 +1299,5 @@ if __name__ == "__main__":
                 print("Good Privacy Practices:", category.good_issues)
             print(f"Total Possible Issues: {category.total_possible_issues}")
         # save privacy grade to csv
-        # report.save_grade_to_csv(service_name, report.overall_grade)
+        # with GradeStore("privacy_grades.db") as store:
+        #     store.save_report(service_name, report)
@@ -0,0 +1,192 @@
+"""
+Columnar export of PrivacyReports for analytics.
+
+Reports are flattened into two tables as they arrive: one row per report (overall grade)
+and one row per report and category (score, grade, issue counts, weight). Rows are buffered
+column by column and flushed as Arrow record batches, so a large grading run streams to
+Parquet or Arrow IPC files without keeping the reports around.
+
+pyarrow is an optional dependency, imported only when a writer is created.
+"""
+from typing import Dict, Iterable, List, Tuple
+from .privacy_grader import CategoryReports
+
+REPORT_COLUMNS = [
+    ('service_name', 'string'),
+    ('overall_grade', 'string'),
+    ('overall_score', 'float64'),
+    ('overall_percentile', 'float64'),
+    ('unknown_issues', 'int32'),
+    ('resolved_issues', 'int32'),
+]
+
+CATEGORY_COLUMNS = [
+    ('service_name', 'string'),
+    ('parent_category', 'string'),
+    ('grade', 'string'),
+    ('score', 'float64'),
+    ('category_weight', 'float64'),
+    ('good_issues', 'int32'),
+    ('neutral_issues', 'int32'),
+    ('bad_issues', 'int32'),       # Includes blockers, as in PrivacyCategoryReport.bad_issues
+    ('blocker_issues', 'int32'),   # From the report's grade_state; null when it is missing
+    ('total_possible_issues', 'int32'),
+    ('percentile', 'float64'),
+]
+
+FORMATS = ('parquet', 'arrow')
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Report export requires pyarrow: pip install pyarrow==17.0.0") from e
+    return pyarrow
+
+
+def _schema(pa, columns: List[Tuple[str, str]]):
+    return pa.schema([pa.field(name, getattr(pa, type_name)()) for name, type_name in columns])
+
+
+class ReportWriter:
+    """
+    Stream (service_name, PrivacyReport) pairs into a reports file and a categories file.
+
+    Use as a context manager, or call close() to flush the last batch and finish the files.
+    """
+
+    def __init__(self, reports_path: str, categories_path: str, format: str = 'parquet',
+                 batch_size: int = 10_000, compression: str = 'zstd'):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format {format!r}; expected one of {FORMATS}")
+        self.pa = _import_pyarrow()
+        self.batch_size = batch_size
+        self.rows_written = 0
+
+        self.report_schema = _schema(self.pa, REPORT_COLUMNS)
+        self.category_schema = _schema(self.pa, CATEGORY_COLUMNS)
+        self._report_buffer = self._empty_buffer(REPORT_COLUMNS)
+        self._category_buffer = self._empty_buffer(CATEGORY_COLUMNS)
+        self._buffered = 0
+
+        if format == 'parquet':
+            import pyarrow.parquet as pq
+            self._report_sink = pq.ParquetWriter(reports_path, self.report_schema, compression=compression)
+            self._category_sink = pq.ParquetWriter(categories_path, self.category_schema, compression=compression)
+        else:
+            import pyarrow.ipc
+            self._report_sink = pyarrow.ipc.new_file(reports_path, self.report_schema)
+            self._category_sink = pyarrow.ipc.new_file(categories_path, self.category_schema)
+        self._format = format
+
+    @staticmethod
+    def _empty_buffer(columns: List[Tuple[str, str]]) -> Dict[str, list]:
+        return {name: [] for name, _ in columns}
+
+    def write(self, service_name: str, report) -> None:
+        """Append one report's rows, flushing a record batch every batch_size reports."""
+        rows = self._report_buffer
+        rows['service_name'].append(service_name)
+        rows['overall_grade'].append(report.overall_grade)
+        rows['overall_score'].append(report.overall_score)
+        rows['overall_percentile'].append(report.overall_percentile)
+        rows['unknown_issues'].append(len(report.unknown_issues or ()))
+        rows['resolved_issues'].append(len(report.resolved_issues or ()))
+
+        states = report.grade_state.categories if report.grade_state is not None else None
+        category_grades = report.parent_category_grades
+        if isinstance(category_grades, CategoryReports):
+            self._append_category_arrays(service_name, category_grades, states)
+        else:
+            self._append_category_reports(service_name, category_grades, states)
+
+        self._buffered += 1
+        if self._buffered >= self.batch_size:
+            self.flush()
+
+    def _append_category_arrays(self, service_name: str, category_grades: CategoryReports,
+                                states) -> None:
+        """Category rows read straight from the report's arrays, without building a report per category."""
+        rows = self._category_buffer
+        layout = category_grades.layout
+        percentiles = category_grades.percentiles or (None,) * len(layout.categories)
+        for i, (category, score) in enumerate(category_grades.scores_by_category().items()):
+            counts = dict.fromkeys(('good', 'neutral', 'bad', 'blocker'), 0)
+            for _, entry in category_grades.found.get(category, ()):
+                counts[entry.classification] = counts.get(entry.classification, 0) + 1
+            rows['service_name'].append(service_name)
+            rows['parent_category'].append(category)
+            rows['grade'].append(category_grades.grades[i])
+            rows['score'].append(score)
+            rows['category_weight'].append(category_grades.weights[i])
+            rows['good_issues'].append(counts.pop('good'))
+            rows['neutral_issues'].append(counts.pop('neutral'))
+            rows['bad_issues'].append(sum(counts.values()))
+            rows['blocker_issues'].append(None if states is None else counts['blocker'])
+            rows['total_possible_issues'].append(layout.total_possible_issues[i])
+            rows['percentile'].append(percentiles[i])
+
+    def _append_category_reports(self, service_name: str, category_grades, states) -> None:
+        """Category rows from any {category: PrivacyCategoryReport} mapping."""
+        rows = self._category_buffer
+        for category, category_report in category_grades.items():
+            rows['service_name'].append(service_name)
+            rows['parent_category'].append(category)
+            rows['grade'].append(category_report.grade)
+            rows['score'].append(category_report.score)
+            rows['category_weight'].append(category_report.category_weight)
+            rows['good_issues'].append(len(category_report.good_issues))
+            rows['neutral_issues'].append(len(category_report.neutral_issues))
+            rows['bad_issues'].append(len(category_report.bad_issues))
+            if states is None:
+                rows['blocker_issues'].append(None)
+            else:
+                state = states.get(category)
+                rows['blocker_issues'].append(state.counts.get('blocker', 0) if state is not None else 0)
+            rows['total_possible_issues'].append(category_report.total_possible_issues)
+            rows['percentile'].append(category_report.percentile)
+
+    def write_many(self, reports: Iterable[Tuple[str, object]]) -> None:
+        for service_name, report in reports:
+            self.write(service_name, report)
+
+    def _write_batch(self, sink, schema, buffer: Dict[str, list]) -> None:
+        pa = self.pa
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(buffer[field.name], type=field.type) for field in schema], schema=schema
+        )
+        if self._format == 'parquet':
+            sink.write_table(pa.Table.from_batches([batch], schema=schema))
+        else:
+            sink.write_batch(batch)
+
+    def flush(self) -> None:
+        """Write the buffered rows as one record batch per file."""
+        if not self._buffered:
+            return
+        self._write_batch(self._report_sink, self.report_schema, self._report_buffer)
+        self._write_batch(self._category_sink, self.category_schema, self._category_buffer)
+        self.rows_written += self._buffered
+        self._report_buffer = self._empty_buffer(REPORT_COLUMNS)
+        self._category_buffer = self._empty_buffer(CATEGORY_COLUMNS)
+        self._buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._report_sink.close()
+        self._category_sink.close()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def export_reports(reports: Iterable[Tuple[str, object]], reports_path: str, categories_path: str,
+                   format: str = 'parquet', batch_size: int = 10_000) -> int:
+    """Stream (service_name, PrivacyReport) pairs to columnar files; returns the report count."""
+    with ReportWriter(reports_path, categories_path, format=format, batch_size=batch_size) as writer:
+        writer.write_many(reports)
+    return writer.rows_written
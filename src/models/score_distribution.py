@@ -0,0 +1,87 @@
+"""
+Sorted overall and per-category scores of every graded service, used to rank a new grade
+against the corpus with a binary search.
+
+Rebuild from src/:  python -m models.score_distribution [grades_db] [distribution_json]
+"""
+import json
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+DISTRIBUTION_VERSION = 1
+
+
+class ScoreDistribution:
+    """
+    Corpus score distribution for percentile ranks.
+
+    Scores are kept as ascending lists on the report's 0-100 scale, so ranking a score is
+    two bisects, O(log n), regardless of corpus size.
+    """
+
+    def __init__(self, overall_scores: List[float], category_scores: Dict[str, List[float]] = None):
+        self.overall_scores = sorted(overall_scores)
+        self.category_scores = {
+            category: sorted(scores) for category, scores in (category_scores or {}).items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.overall_scores)
+
+    @staticmethod
+    def _percentile(sorted_scores: List[float], score: float) -> Optional[float]:
+        """Percentile rank of score: services below it plus half of those tied with it."""
+        if not sorted_scores:
+            return None
+        below = bisect_left(sorted_scores, score)
+        at_or_below = bisect_right(sorted_scores, score)
+        return round(100.0 * (below + at_or_below) / (2 * len(sorted_scores)), 1)
+
+    def overall_percentile(self, score: float) -> Optional[float]:
+        """Percentile rank of an overall score, or None for an empty distribution."""
+        return self._percentile(self.overall_scores, score)
+
+    def category_percentile(self, category: str, score: float) -> Optional[float]:
+        """Percentile rank of a category score, or None if the category has no scores."""
+        return self._percentile(self.category_scores.get(category, []), score)
+
+    @classmethod
+    def from_grade_store(cls, store) -> "ScoreDistribution":
+        """Collect every stored overall and per-category score from a GradeStore."""
+        return cls(store.sorted_overall_scores(), store.sorted_category_scores())
+
+    def save(self, path: str) -> None:
+        """Write the distribution as JSON, atomically."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'version': DISTRIBUTION_VERSION,
+                'overall_scores': self.overall_scores,
+                'category_scores': self.category_scores,
+            }, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ScoreDistribution":
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('version') != DISTRIBUTION_VERSION:
+            raise ValueError(
+                f"Score distribution {path} has version {data.get('version')}, expected {DISTRIBUTION_VERSION}"
+            )
+        return cls(data['overall_scores'], data['category_scores'])
+
+
+if __name__ == "__main__":
+    from .grade_store import GradeStore
+
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'privacy_grades.db'
+    distribution_path = sys.argv[2] if len(sys.argv) > 2 else 'score_distribution.json'
+
+    with GradeStore(db_path) as store:
+        distribution = ScoreDistribution.from_grade_store(store)
+    distribution.save(distribution_path)
+    print(f"Wrote {distribution_path} ({len(distribution)} services, "
+          f"{len(distribution.category_scores)} categories)")
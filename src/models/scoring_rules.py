@@ -0,0 +1,185 @@
+"""
+Declarative category scoring rules: classification weights, score caps and score floors.
+
+A rule set is plain data that can be loaded per deployment from JSON:
+
+    {
+      "classification_weights": {"blocker": -2.0, "bad": -0.7, "neutral": 0.0, "good": 0.1},
+      "caps": [{"classification": "blocker", "limit": 0.3},
+               {"classification": "bad", "limit": 0.7}],
+      "floors": [{"classifications": ["good"], "limit": 0.7}]
+    }
+
+A category's base score is 1.0 plus each issue's classification weight. The first cap whose
+classification occurs in the category limits the base score from above; each floor whose
+classifications cover every issue in the category limits it from below. The result is
+scaled by the category weight and clipped to [0, 1].
+"""
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class ScoreCap:
+    """Cap the base score at `limit` when the category has any `classification` issue."""
+    classification: str
+    limit: float
+
+
+@dataclass(frozen=True)
+class ScoreFloor:
+    """Raise the base score to `limit` when every issue in the category is one of `classifications`."""
+    classifications: Tuple[str, ...]
+    limit: float
+
+
+@dataclass(frozen=True)
+class ScoringRules:
+    """A complete category scoring rule set; caps are tried in order and the first match wins."""
+    classification_weights: Dict[str, float]
+    caps: Tuple[ScoreCap, ...] = ()
+    floors: Tuple[ScoreFloor, ...] = ()
+
+    def __post_init__(self):
+        self.check_classifications(self.classification_weights)
+
+    def check_classifications(self, classifications: Iterable[str]) -> None:
+        """Raise ValueError if a cap or floor names a classification outside `classifications`."""
+        referenced = {cap.classification for cap in self.caps}
+        referenced.update(c for floor in self.floors for c in floor.classifications)
+        unknown = referenced - set(classifications)
+        if unknown:
+            raise ValueError(f"Scoring rules reference unknown classifications: {sorted(unknown)}")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ScoringRules":
+        return cls(
+            classification_weights={str(c): float(w) for c, w in data['classification_weights'].items()},
+            caps=tuple(ScoreCap(cap['classification'], float(cap['limit'])) for cap in data.get('caps', [])),
+            floors=tuple(
+                ScoreFloor(tuple(floor['classifications']), float(floor['limit'])) for floor in data.get('floors', [])
+            ),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'classification_weights': dict(self.classification_weights),
+            'caps': [{'classification': cap.classification, 'limit': cap.limit} for cap in self.caps],
+            'floors': [{'classifications': list(floor.classifications), 'limit': floor.limit}
+                       for floor in self.floors],
+        }
+
+    def compile(self, classification_weights: Dict[str, float] = None) -> "CompiledScoringRules":
+        """Lower the rules to a fixed classification order (optionally under other classification weights)."""
+        return CompiledScoringRules(
+            self, self.classification_weights if classification_weights is None else classification_weights
+        )
+
+
+DEFAULT_SCORING_RULES = ScoringRules(
+    classification_weights={
+        'blocker': -2.0,  # Much stronger penalty
+        'bad': -0.7,  # Stronger penalty
+        'neutral': 0.0,  # no impact
+        'good': 0.1  # positive impact
+    },
+    caps=(
+        ScoreCap('blocker', 0.3),  # Severe penalty for any blockers
+        ScoreCap('bad', 0.7),  # Cap score if there are any bad issues
+    ),
+    floors=(
+        ScoreFloor(('good',), 0.7),  # Minimum score for all good issues
+    ),
+)
+
+
+def load_scoring_rules(path: str) -> ScoringRules:
+    """Load a scoring rule set from a JSON file."""
+    with open(path) as f:
+        return ScoringRules.from_dict(json.load(f))
+
+
+class CompiledScoringRules:
+    """
+    A ScoringRules lowered to a fixed classification order.
+
+    score_one applies the rules to one category in plain Python, which is what grading a
+    single service needs. For many categories at once (a corpus, or Monte-Carlo samples),
+    base_scores and apply take arrays whose last axis is the classification (in
+    `classifications` order); the rules become a fixed sequence of np.where/np.minimum/
+    np.maximum steps with no data-dependent branches. Both paths do the float operations in
+    the same order as the original scalar code, so their results are identical.
+    """
+
+    def __init__(self, rules: ScoringRules, classification_weights: Dict[str, float]):
+        rules.check_classifications(classification_weights)
+        self.classifications: List[str] = list(classification_weights)
+        self.weights: List[float] = [classification_weights[c] for c in self.classifications]
+        index = {classification: i for i, classification in enumerate(self.classifications)}
+
+        self.caps: List[Tuple[str, float]] = [(cap.classification, cap.limit) for cap in rules.caps]
+        self.cap_columns = [index[cap.classification] for cap in rules.caps]
+        self.cap_limits = [cap.limit for cap in rules.caps]
+        self.floors: List[Tuple[Tuple[str, ...], float]] = [(floor.classifications, floor.limit)
+                                                            for floor in rules.floors]
+        # (classifications, floors) 0/1 rows: counts @ floor_masks gives each floor's covered count
+        self.floor_masks = [[int(c in floor.classifications) for floor in rules.floors] for c in self.classifications]
+        self.floor_limits = [floor.limit for floor in rules.floors]
+
+    def score_one(self, base_score: float, counts: Dict[str, int], category_weight: float) -> float:
+        """
+        Apply caps, floors, the category weight and the [0, 1] clip to one category. This runs
+        once per category with findings in every grade, so comparisons stand in for min/max
+        calls; they pick the same operand, so the result is unchanged.
+        """
+        for classification, limit in self.caps:
+            if counts.get(classification, 0) > 0:
+                if limit < base_score:
+                    base_score = limit
+                break
+
+        if self.floors:
+            total = sum(counts.values())
+            for classifications, limit in self.floors:
+                covered = 0
+                for classification in classifications:
+                    covered += counts.get(classification, 0)
+                if total == covered and limit > base_score:
+                    base_score = limit
+
+        score = base_score * category_weight
+        return 1.0 if score > 1.0 else (0.0 if score < 0.0 else score)
+
+    def base_scores(self, counts) -> "np.ndarray":
+        """Uncapped base scores, summed in classification order."""
+        import numpy as np
+        counts = np.asarray(counts)
+        base_scores = np.full(counts.shape[:-1], 1.0)
+        for i, weight in enumerate(self.weights):
+            base_scores = base_scores + counts[..., i] * weight
+        return base_scores
+
+    def apply(self, base_scores, counts, category_weights) -> "np.ndarray":
+        """Apply caps, floors, category weights and the [0, 1] clip to arrays of base scores."""
+        import numpy as np
+        base_scores = np.asarray(base_scores, dtype=np.float64)
+        counts = np.asarray(counts)
+
+        # Earlier caps take precedence, so fold them in reverse and let each overwrite the next
+        limit = np.full(base_scores.shape, np.inf)
+        for column, cap_limit in zip(reversed(self.cap_columns), reversed(self.cap_limits)):
+            limit = np.where(counts[..., column] > 0, cap_limit, limit)
+        base_scores = np.minimum(base_scores, limit)
+
+        if self.floor_limits:
+            totals = counts.sum(axis=-1)
+            covered = counts @ np.array(self.floor_masks, dtype=np.int64)
+            for i, floor_limit in enumerate(self.floor_limits):
+                base_scores = np.where(totals == covered[..., i], np.maximum(base_scores, floor_limit), base_scores)
+
+        return np.clip(base_scores * np.asarray(category_weights, dtype=np.float64), 0.0, 1.0)
+
+    def score(self, counts, category_weights) -> "np.ndarray":
+        """Score count vectors from scratch."""
+        return self.apply(self.base_scores(counts), counts, category_weights)
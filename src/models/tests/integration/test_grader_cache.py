@@ -0,0 +1,63 @@
+import os
+import threading
+import pytest
+from api_service.api.utils import privacy_grader
+from api_service.api.utils.privacy_grader import get_privacy_grader
+
+MAPPING_CSV = """parent_issue,privacy_issue,classification
+Ownership,This service takes credit for your content,bad
+User Rights,You can delete your content from the service,good
+"""
+
+WEIGHTS_CSV = """parent_category,weight
+Ownership,1.0
+User Rights,1.0
+"""
+
+
+@pytest.fixture
+def grading_csvs(tmp_path):
+    mapping_path = tmp_path / "mapping_df.csv"
+    weights_path = tmp_path / "category_weights.csv"
+    mapping_path.write_text(MAPPING_CSV)
+    weights_path.write_text(WEIGHTS_CSV)
+    yield str(mapping_path), str(weights_path)
+    privacy_grader._grader_cache.clear()
+
+
+def test_get_privacy_grader_reuses_instance(grading_csvs):
+    """The same grader is returned while the CSV files are unchanged."""
+    first = get_privacy_grader(*grading_csvs)
+    second = get_privacy_grader(*grading_csvs)
+    assert first is second
+
+
+def test_get_privacy_grader_rebuilds_on_change(grading_csvs):
+    """Editing a CSV file invalidates the cached grader."""
+    mapping_path, weights_path = grading_csvs
+    first = get_privacy_grader(mapping_path, weights_path)
+
+    with open(weights_path, "w") as f:
+        f.write(WEIGHTS_CSV.replace("Ownership,1.0", "Ownership,0.5"))
+    stat = os.stat(weights_path)
+    os.utime(weights_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = get_privacy_grader(mapping_path, weights_path)
+    assert second is not first
+    assert second.category_weights["Ownership"] == 0.5
+
+
+def test_get_privacy_grader_concurrent_first_use(grading_csvs):
+    """Concurrent first requests all receive one fully built grader."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_privacy_grader(*grading_csvs)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(grader is results[0] for grader in results)
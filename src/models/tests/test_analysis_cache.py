@@ -0,0 +1,125 @@
+import sqlite3
+import time
+import zlib
+import fitz
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+from models.analysis_cache import AnalysisCache, CachedAnalysis, content_digest
+from models.get_issues import MODEL_POOL, analyze_pdf
+
+
+@pytest.fixture
+def pdf_and_csv(tmp_path):
+    pdf_path = tmp_path / "policy.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "This service takes credit for your content.")
+    doc.save(pdf_path)
+    doc.close()
+
+    csv_path = tmp_path / "mapping.csv"
+    pd.DataFrame({
+        "parent_issue": ["Ownership"],
+        "privacy_issue": ["this service takes credit for your content"],
+    }).to_csv(csv_path, index=False)
+    return str(pdf_path), str(csv_path)
+
+
+def test_get_put_and_persistence(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    with AnalysisCache(db_path) as cache:
+        assert cache.get("sha", "endpoint", "1") is None
+        cache.put("sha", "endpoint", "1", text="policy text", issues=["Ownership: x"])
+        cached = cache.get("sha", "endpoint", "1")
+        assert (cached.text, cached.issues) == ("policy text", ["Ownership: x"])
+        assert cache.get("sha", "other endpoint", "1") is None
+        assert cache.get("sha", "endpoint", "2") is None
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    with AnalysisCache(db_path) as cache:
+        assert cache.get("sha", "endpoint", "1").issues == ["Ownership: x"]
+
+
+def test_lru_eviction_keeps_under_max_bytes():
+    entry_bytes = 200
+    with AnalysisCache(":memory:", max_bytes=3 * entry_bytes) as cache:
+        def put(key):
+            cache.put(key, "m", "1", text="", issues=["x" * (entry_bytes - 14)])
+        for key in ("a", "b", "c"):
+            put(key)
+        assert len(cache) == 3
+
+        cache.get("a", "m", "1")  # "b" is now the least recently used
+        put("d")
+        assert cache.total_bytes <= cache.max_bytes
+        assert [key for key in "abcd" if cache.get(key, "m", "1") is not None] == ["a", "c", "d"]
+
+        cache.put("huge", "m", "1", text="", issues=["x" * 10_000])
+        assert cache.get("huge", "m", "1") is None and len(cache) == 3
+
+
+def test_lru_order_is_shared_by_caches_on_one_file(tmp_path):
+    """Two workers' caches on one database agree on which entry was used least recently."""
+    db_path = str(tmp_path / "cache.db")
+    entry_bytes = 200
+    with AnalysisCache(db_path, max_bytes=2 * entry_bytes) as first, \
+            AnalysisCache(db_path, max_bytes=2 * entry_bytes) as second:
+        def put(cache, key):
+            cache.put(key, "m", "1", text="", issues=["x" * (entry_bytes - 14)])
+        put(first, "a")
+        for _ in range(3):
+            first.get("a", "m", "1")
+        put(second, "b")  # Written after every use of "a", so "a" is now the least recently used
+        put(second, "c")
+        assert [key for key in "abc" if first.get(key, "m", "1") is not None] == ["b", "c"]
+
+
+def test_analyze_pdf_repeat_upload_hits_cache(tmp_path, pdf_and_csv):
+    pdf_path, csv_path = pdf_and_csv
+    MODEL_POOL.clear()
+    response = MagicMock(text="this service takes credit for your content")
+
+    with AnalysisCache(str(tmp_path / "cache.db")) as cache, \
+            patch("models.get_issues.vertexai.init"), \
+            patch("models.get_issues.GenerativeModel") as MockGenerativeModel, \
+            patch("builtins.print"):
+        MockGenerativeModel.return_value.start_chat.return_value.send_message.return_value = response
+
+        first = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", cache=cache)
+        assert not first.cache_hit
+        assert first.issues == ["Ownership: this service takes credit for your content"]
+
+        with patch("models.get_issues.extract_pdf_text") as extract:
+            start = time.perf_counter()
+            second = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", cache=cache)
+            elapsed = time.perf_counter() - start
+        extract.assert_not_called()
+        assert MockGenerativeModel.return_value.start_chat.call_count == 1
+        assert second.cache_hit and (second.text, second.issues) == (first.text, first.issues)
+        assert (second.chars_saved, second.tokens_saved) == (first.chars_saved, first.tokens_saved)
+        assert elapsed < 0.1
+
+        # Another endpoint or extraction limit is a different analysis
+        assert not analyze_pdf(pdf_path, csv_path, "project", "location", "other", cache=cache).cache_hit
+        assert not analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", max_pages=1,
+                               cache=cache).cache_hit
+        assert cache.get(content_digest(pdf_path), "projects/project/locations/location/endpoints/endpoint",
+                         "missing") is None
+    MODEL_POOL.clear()
+
+
+def test_savings_are_stored_and_old_files_are_upgraded(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE analyses (content_sha256 TEXT NOT NULL, model TEXT NOT NULL, prompt_version TEXT NOT NULL, "
+            "text BLOB NOT NULL, issues TEXT NOT NULL, size INTEGER NOT NULL, last_access INTEGER NOT NULL, "
+            "PRIMARY KEY (content_sha256, model, prompt_version)) WITHOUT ROWID"
+        )
+        connection.execute("INSERT INTO analyses VALUES ('old', 'm', '1', ?, '[]', 10, 1)", (zlib.compress(b"old"),))
+    connection.close()
+
+    with AnalysisCache(db_path) as cache:
+        assert cache.get("old", "m", "1") == CachedAnalysis(text="old", issues=[])
+        cache.put("new", "m", "1", text="new", issues=["x"], chars_saved=120, tokens_saved=30)
+        assert (cache.get("new", "m", "1").chars_saved, cache.get("new", "m", "1").tokens_saved) == (120, 30)
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+import fitz
+import httpx
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi import FastAPI
+from models import get_issues
+from models.analysis_cache import AnalysisCache
+from models.get_issues import IssueCatalog, ModelPool, analyze_pdf_async, analyze_sections_async
+
+DELAY = 0.2
+CATALOG = IssueCatalog(
+    prompt_block="Ownership: issue a",
+    parent_by_issue={"issue a": "Ownership"},
+    digest="0" * 64,
+)
+
+
+class SlowAsyncModel:
+    """Stand-in endpoint that takes DELAY seconds to answer, tracking how many calls overlap."""
+
+    def __init__(self, delay=DELAY):
+        self.delay = delay
+        self.in_flight = self.max_in_flight = self.calls = 0
+
+    def start_chat(self):
+        return self
+
+    def send_message(self, messages, generation_config=None):
+        raise AssertionError("the blocking API stalls the event loop")
+
+    async def send_message_async(self, messages, generation_config=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return SimpleNamespace(text="issue a" if "issue a" in messages[1] else "")
+
+
+def write_pdf(path, text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+async def longest_stall(work):
+    """Await work while a 10ms heartbeat runs; return its result and the longest gap between beats."""
+    beats = [time.perf_counter()]
+
+    async def heartbeat():
+        while True:
+            await asyncio.sleep(0.01)
+            beats.append(time.perf_counter())
+
+    ticker = asyncio.create_task(heartbeat())
+    try:
+        result = await work
+    finally:
+        ticker.cancel()
+    beats.append(time.perf_counter())
+    return result, max(later - earlier for earlier, later in zip(beats, beats[1:]))
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "mapping.csv"
+    pd.DataFrame({"parent_issue": ["Ownership"], "privacy_issue": ["issue a"]}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_analyze_sections_async_bounds_in_flight_calls():
+    model = SlowAsyncModel(delay=0.02)
+    sections = ["has issue a", "nothing"] * 5
+    issues = asyncio.run(analyze_sections_async(model, CATALOG, sections, concurrency=3))
+    assert issues == ["Ownership: issue a"]
+    assert model.calls == 10 and model.max_in_flight == 3
+
+
+def test_analyses_overlap_without_stalling_the_loop(tmp_path, csv_path):
+    pdf_paths = [write_pdf(tmp_path / f"policy{i}.pdf", f"Policy {i} has issue a.") for i in range(16)]
+
+    async def run(n, model):
+        pool = ModelPool(model_factory=lambda endpoint: model, init=lambda **kwargs: None)
+        return await longest_stall(asyncio.gather(*(
+            analyze_pdf_async(path, csv_path, "project", "location", "endpoint", models=pool)
+            for path in pdf_paths[:n]
+        )))
+
+    with patch("builtins.print"):
+        for n in (1, 4, 16):
+            model = SlowAsyncModel()
+            analyses, longest_gap = asyncio.run(run(n, model))
+            assert all(analysis.issues == ["Ownership: issue a"] for analysis in analyses)
+            # Every upload's model call is in flight at once, and the loop never waits on one
+            assert model.max_in_flight == n
+            assert longest_gap < DELAY / 2
+
+
+def test_blocking_setup_runs_off_the_event_loop(tmp_path, csv_path):
+    """The first catalog load, Vertex AI init and section split all run in the executor."""
+    threads = {}
+
+    def recorded(name, func):
+        def wrapper(*args, **kwargs):
+            threads[name] = threading.current_thread()
+            return func(*args, **kwargs)
+        return wrapper
+
+    model = SlowAsyncModel(delay=0)
+    pool = ModelPool(model_factory=lambda endpoint: model, init=recorded("init", lambda **kwargs: None))
+    pdf_path = write_pdf(tmp_path / "policy.pdf", "This policy has issue a. " * 20)
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+
+    async def analyze():
+        loop_thread = threading.current_thread()
+        analysis = await analyze_pdf_async(pdf_path, csv_path, "project", "location", "endpoint",
+                                           cache=cache, models=pool, chunk_tokens=20,
+                                           chunk_overlap_tokens=5)
+        return analysis, loop_thread
+
+    with patch.object(get_issues, "load_issue_catalog", recorded("catalog", get_issues.load_issue_catalog)), \
+            patch.object(get_issues, "split_sections", recorded("split", get_issues.split_sections)), \
+            patch("builtins.print"):
+        analysis, loop_thread = asyncio.run(analyze())
+
+    assert analysis.issues == ["Ownership: issue a"] and model.calls > 1
+    assert set(threads) == {"catalog", "init", "split"}
+    assert loop_thread not in threads.values()
+
+
+def test_process_pdf_endpoint_serves_uploads_concurrently(tmp_path, monkeypatch):
+    from api_service.api.routers import summarize
+    from api_service.api.utils import analysis_cache, process_pdf
+
+    model = SlowAsyncModel()
+    pool = ModelPool(model_factory=lambda endpoint: model, init=lambda **kwargs: None)
+    app = FastAPI()
+    app.include_router(summarize.router)
+    uploads = [write_pdf(tmp_path / f"policy{i}.pdf", f"Uploaded policy number {i}.") for i in range(8)]
+
+    # Uploads and the cache opened for tmp_path stay local to this test
+    caches = {}
+    monkeypatch.setattr(process_pdf, "MODEL_POOL", pool)
+    monkeypatch.setattr(analysis_cache, "_analysis_caches", caches)
+    monkeypatch.setattr(summarize, "analysis_cache_path", str(tmp_path / "cache.db"))
+    monkeypatch.setattr(summarize, "parsed_uploads", {})
+    monkeypatch.setattr(summarize, "parsed_issues_storage", {"issues": []})
+
+    async def upload_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async def upload(path):
+                with open(path, "rb") as f:
+                    files = {"pdf_file": ("policy.pdf", f.read(), "application/pdf")}
+                return await client.post("/process-pdf/", files=files)
+            return await longest_stall(asyncio.gather(*(upload(path) for path in uploads)))
+
+    try:
+        with patch("builtins.print"):
+            responses, longest_gap = asyncio.run(upload_all())
+    finally:
+        for cache in caches.values():
+            cache.close()
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert model.max_in_flight == 8
+    assert longest_gap < DELAY / 2
+    # Each upload is stored under an id of its own
+    upload_ids = {response.json()["upload_id"] for response in responses}
+    assert len(upload_ids) == 8 and upload_ids == set(summarize.parsed_uploads)
+    assert list(caches) == [str(tmp_path / "cache.db")]
+
+
+def test_get_grade_grades_the_requested_upload(monkeypatch):
+    from fastapi.testclient import TestClient
+    from api_service.api.routers import summarize
+
+    class EchoGrader:
+        def grade_privacy_issues(self, issues):
+            return SimpleNamespace(overall_grade=issues[0], overall_score=len(issues), overall_percentile=None,
+                                   parent_category_grades={})
+
+    monkeypatch.setattr(summarize, "get_privacy_grader", lambda *args, **kwargs: EchoGrader())
+    monkeypatch.setattr(summarize, "parsed_uploads", {})
+    monkeypatch.setattr(summarize, "parsed_issues_storage", {"issues": []})
+    monkeypatch.setattr(summarize, "MAX_STORED_UPLOADS", 2)
+    first = summarize.store_issues(["first"])
+    second = summarize.store_issues(["second", "issue"])
+
+    client = TestClient(FastAPI(routes=summarize.router.routes))
+    assert client.post("/get-grade/", params={"upload_id": first}).json()["overall_grade"] == "first"
+    assert client.post("/get-grade/", params={"upload_id": second}).json()["overall_grade"] == "second"
+    assert client.post("/get-grade/").json()["overall_grade"] == "second"
+    assert client.post("/get-grade/", params={"upload_id": "missing"}).status_code == 404
+
+    # Only the most recent MAX_STORED_UPLOADS uploads are kept
+    summarize.store_issues(["third"])
+    assert client.post("/get-grade/", params={"upload_id": first}).status_code == 404
@@ -0,0 +1,91 @@
+import os
+import random
+import pandas as pd
+import pytest
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+from models.batch_grader import BatchGrader
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def grader():
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    return PrivacyGrader(mapping_df, category_weights)
+
+
+@pytest.fixture(scope="module")
+def issue_lists(grader):
+    """Random services drawn from the real catalog, with duplicates and junk mixed in."""
+    catalog = [f"{entry.parent_issue}: {entry.privacy_issue}" for entry in grader.issue_index.values()]
+    rng = random.Random(215)
+    lists = [[]]
+    for _ in range(300):
+        issues = rng.sample(catalog, rng.randint(1, 40))
+        issues += rng.sample(issues, min(2, len(issues)))  # repeated findings
+        issues += ["not an issue", "Ownership: made up issue"]
+        rng.shuffle(issues)
+        lists.append(issues)
+    return lists
+
+
+# System test: batch results must equal the scalar grader exactly
+def test_batch_matches_scalar(grader, issue_lists):
+    result = BatchGrader(grader).grade(issue_lists)
+
+    for row, issues in enumerate(issue_lists):
+        valid_issues, _ = grader._validate_issues(issues)
+        category_scores = grader._calculate_category_scores(valid_issues)
+        overall_score = grader._calculate_overall_score(category_scores)
+
+        assert result.category_scores_for(row) == category_scores
+        assert result.overall_scores[row] == overall_score
+        assert result.overall_grades[row] == grader._get_grade(overall_score).value
+        for category, grade in zip(result.categories, result.category_grades[row]):
+            assert grade == grader._get_grade(category_scores[category]).value
+
+
+def test_batch_issue_counts(grader):
+    result = BatchGrader(grader).grade([
+        ["Ownership: This service takes credit for your content", "garbage"],
+        [],
+    ])
+    assert result.issue_counts.tolist() == [1, 0]
+    assert result.overall_scores[1] == 1.0
+    assert result.overall_grades[1] == "A"
+
+
+# System test: with a resolver, batch results equal grade_privacy_issues, which resolves unknown issues
+def test_batch_matches_scalar_with_resolver(grader, issue_lists):
+    resolving = PrivacyGrader(grader.mapping_df, grader.category_weights, cache_size=0, resolve_unknown=True)
+    rng = random.Random(216)
+    paraphrased = []
+    for issues in issue_lists:
+        # Re-case, re-punctuate or re-parent some findings so only the resolver can match them
+        issues = [
+            rng.choice([f"Unknown: {issue.split(':', 1)[1].upper()}.", f"{issue}!", "Ownership" + issue[issue.find(':'):]])
+            if ':' in issue and rng.random() < 0.3 else issue
+            for issue in issues
+        ]
+        paraphrased.append(issues)
+
+    result = BatchGrader(resolving).grade(paraphrased)
+    resolved_rows = 0
+    for row, issues in enumerate(paraphrased):
+        report = resolving.grade_privacy_issues(issues)
+        resolved_rows += bool(report and report.resolved_issues)
+        found, unknown_issues = resolving._parse_issues(issues)
+        resolved_issues, _ = resolving.issue_resolver.resolve(unknown_issues)
+        resolving._add_resolved(found, resolved_issues)
+        _, found_scores = resolving._score_categories(found)
+        category_scores = {**dict.fromkeys(resolving.all_parent_categories, 1.0), **found_scores}
+
+        assert result.category_scores_for(row) == category_scores
+        assert result.overall_scores[row] == resolving._calculate_overall_score(category_scores)
+        if report is not None:
+            assert result.overall_grades[row] == report.overall_grade
+    assert resolved_rows > 100
+
+    # Without a resolver the same strings stay unknown
+    assert (BatchGrader(grader).grade(paraphrased).issue_counts < result.issue_counts).any()
@@ -0,0 +1,112 @@
+import threading
+import time
+import fitz
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+from models.get_issues import (CHARS_PER_TOKEN, IssueCatalog, ModelPool, analyze_pdf, analyze_sections,
+                               estimate_tokens, merge_issue_lists, split_sections)
+
+CATALOG = IssueCatalog(
+    prompt_block="Ownership: issue a\nUser Rights: issue b",
+    parent_by_issue={"issue a": "Ownership", "issue b": "User Rights"},
+    digest="0" * 64,
+)
+
+
+def paragraphs(n, words=40):
+    return "\n\n".join(f"Paragraph {i} " + " ".join(f"w{i}_{j}" for j in range(words)) for i in range(n))
+
+
+def test_sections_respect_token_bound_and_paragraphs():
+    text = paragraphs(60)
+    sections = split_sections(text, max_tokens=300, overlap_tokens=100)
+    assert len(sections) > 1
+    assert all(estimate_tokens(section) <= 300 for section in sections)
+
+    # Every paragraph survives whole, in order, and consecutive sections overlap
+    originals = text.split("\n\n")
+    seen = [p for section in sections for p in section.split("\n\n")]
+    assert all(p in originals for p in seen)
+    assert list(dict.fromkeys(seen)) == originals
+    for previous, section in zip(sections, sections[1:]):
+        assert section.split("\n\n")[0] in previous.split("\n\n")
+
+
+def test_oversized_paragraph_is_split_and_short_text_is_one_section():
+    long_line = "x" * (1000 * CHARS_PER_TOKEN)
+    sections = split_sections(long_line + "\n\nshort tail", max_tokens=300, overlap_tokens=0)
+    assert all(estimate_tokens(section) <= 300 for section in sections)
+    assert "".join(sections).replace("\n\n", "").startswith(long_line)
+
+    assert split_sections("one\n\ntwo", max_tokens=300) == ["one\n\ntwo"]
+    assert split_sections("", max_tokens=300) == []
+    with pytest.raises(ValueError):
+        split_sections("text", max_tokens=100, overlap_tokens=100)
+
+
+def test_merge_issue_lists_dedupes_in_first_seen_order():
+    assert merge_issue_lists([
+        ["Ownership: issue a", "User Rights: issue b"],
+        ["ownership: ISSUE A", "Unknown: issue c"],
+    ]) == ["Ownership: issue a", "User Rights: issue b", "Unknown: issue c"]
+
+
+class SlowModel:
+    """Stand-in endpoint answering by keyword with a fixed delay, tracking calls in flight."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def start_chat(self):
+        return self
+
+    def send_message(self, messages, generation_config=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        section = messages[1]
+        found = [issue for issue in ("issue a", "issue b") if issue in section]
+        return MagicMock(text=", ".join(found))
+
+
+def test_analyze_sections_runs_concurrently_and_merges():
+    sections = ["has issue a", "has issue b", "issue a again", "nothing"] * 2
+    model = SlowModel(delay=0.05)
+    start = time.perf_counter()
+    issues = analyze_sections(model, CATALOG, sections, concurrency=4)
+    elapsed = time.perf_counter() - start
+
+    assert issues[:2] == ["Ownership: issue a", "User Rights: issue b"]
+    assert model.max_in_flight == 4
+    assert elapsed < 8 * 0.05
+    assert analyze_sections(model, CATALOG, [], concurrency=4) == []
+
+
+def test_analyze_pdf_chunks_long_documents(tmp_path):
+    pdf_path = str(tmp_path / "policy.pdf")
+    doc = fitz.open()
+    for page_text in ("Filler about cookies.\n" * 30, "This policy has issue a.", "Filler again.\n" * 30,
+                      "And issue b at the end."):
+        doc.new_page().insert_text((72, 72), page_text)
+    doc.save(pdf_path)
+    doc.close()
+    csv_path = str(tmp_path / "mapping.csv")
+    pd.DataFrame({"parent_issue": ["Ownership", "User Rights"],
+                  "privacy_issue": ["issue a", "issue b"]}).to_csv(csv_path, index=False)
+
+    model = SlowModel(delay=0)
+    pool = ModelPool(model_factory=lambda endpoint: model, init=lambda **kwargs: None)
+    with patch("builtins.print"), patch.object(model, "send_message", wraps=model.send_message) as send:
+        whole = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", models=pool)
+        assert send.call_count == 1
+        chunked = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", models=pool,
+                              chunk_tokens=150, chunk_overlap_tokens=20)
+    assert send.call_count > 2
+    assert chunked.text == whole.text
+    assert chunked.issues == whole.issues == ["Ownership: issue a", "User Rights: issue b"]
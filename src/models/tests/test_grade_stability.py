@@ -0,0 +1,53 @@
+import os
+import random
+import pandas as pd
+import pytest
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def grader():
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    return PrivacyGrader(mapping_df, category_weights)
+
+
+@pytest.fixture(scope="module")
+def issues(grader):
+    catalog = [f"{entry.parent_issue}: {entry.privacy_issue}" for entry in grader.issue_index.values()]
+    return random.Random(215).sample(catalog, 25) + ["not an issue"]
+
+
+def test_stability_without_noise(grader, issues):
+    report = grader.grade_privacy_issues(issues)
+    stability = grader.grade_stability(issues, n_samples=50, drop_rate=0.0, add_rate=0.0)
+
+    assert stability.grade == report.overall_grade
+    assert stability.stability == 1.0
+    assert stability.grade_distribution == {report.overall_grade: 1.0}
+    assert set(stability.score_percentiles.values()) == {report.overall_score}
+
+
+def test_stability_under_noise(grader, issues):
+    stability = grader.grade_stability(issues, n_samples=2000, seed=7)
+
+    assert stability.grade == grader.grade_privacy_issues(issues).overall_grade
+    assert stability.n_samples == 2000
+    assert sum(stability.grade_distribution.values()) == pytest.approx(1.0)
+    assert stability.stability == stability.grade_distribution.get(stability.grade, 0.0)
+    assert stability.score_percentiles[5] <= stability.score_percentiles[50] <= stability.score_percentiles[95]
+    assert grader.grade_stability(issues, n_samples=2000, seed=7) == stability
+
+
+def test_stability_dropping_everything(grader, issues):
+    # With every issue dropped and nothing added, each sample grades like an empty policy
+    stability = grader.grade_stability(issues, n_samples=100, drop_rate=1.0, add_rate=0.0, seed=1)
+    assert stability.grade_distribution == {"A": 1.0}
+    assert stability.score_percentiles[50] == 100.0
+
+
+def test_stability_requires_samples(grader, issues):
+    with pytest.raises(ValueError):
+        grader.grade_stability(issues, n_samples=0)
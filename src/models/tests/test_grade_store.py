@@ -0,0 +1,76 @@
+from dataclasses import replace
+import pandas as pd
+import pytest
+from models.grade_store import GradeStore, StoredGrade
+from models.privacy_grader import PrivacyGrader
+
+
+@pytest.fixture
+def store(tmp_path):
+    with GradeStore(tmp_path / "grades.db") as store:
+        yield store
+
+
+def test_upsert_and_get(store):
+    store.upsert("Service1", "A", 96.5)
+    store.upsert("Service1", "C", 78.0)
+    assert store.get("Service1") == StoredGrade("Service1", "C", 78.0)
+    assert store.get("Missing") is None
+    assert len(store) == 1
+
+
+def test_upsert_preserves_existing_grade(store):
+    """overwrite=False keeps the first grade, like save_grade_to_csv."""
+    store.upsert("Service1", "A")
+    store.upsert("Service1", "F", overwrite=False)
+    assert store.get("Service1").grade == "A"
+
+
+def test_upsert_many_and_export_csv(store, tmp_path):
+    store.upsert_many([(f"Service{i}", "B", 85.0) for i in range(100)])
+    assert len(store) == 100
+    assert "Service42" in store
+
+    csv_path = tmp_path / "privacy_grades.csv"
+    assert store.export_csv(csv_path) == 100
+    df = pd.read_csv(csv_path)
+    assert list(df.columns) == ["service_name", "grade", "overall_score"]
+    assert df[df["service_name"] == "Service7"]["grade"].iloc[0] == "B"
+
+
+def test_import_csv(store, tmp_path):
+    csv_path = tmp_path / "privacy_grades.csv"
+    PrivacyGrader.save_grade_to_csv("Service1", "A", csv_path)
+    PrivacyGrader.save_grade_to_csv("Service2", "D", csv_path)
+    assert store.import_csv(csv_path) == 2
+    assert store.get("Service2") == StoredGrade("Service2", "D", None)
+
+
+def test_save_report_persists_category_scores(tmp_path):
+    mapping_df = pd.DataFrame({
+        "parent_issue": ["Ownership", "User Rights"],
+        "privacy_issue": ["This service takes credit for your content", "You can delete your content"],
+        "classification": ["bad", "good"],
+    })
+    report = PrivacyGrader(mapping_df).grade_privacy_issues(
+        ["Ownership: This service takes credit for your content"]
+    )
+    db_path = tmp_path / "grades.db"
+    with GradeStore(db_path) as store:
+        store.save_report("Service1", report)
+
+    with GradeStore(db_path) as reopened:
+        assert reopened.get("Service1").grade == report.overall_grade
+        assert reopened.get_category_scores("Service1") == {"Ownership": 30.0, "User Rights": 100.0}
+
+
+def test_save_report_reads_only_public_report_fields(store):
+    mapping_df = pd.DataFrame({
+        "parent_issue": ["Ownership"],
+        "privacy_issue": ["This service takes credit for your content"],
+        "classification": ["bad"],
+    })
+    report = PrivacyGrader(mapping_df).grade_privacy_issues(["Ownership: This service takes credit for your content"])
+    # Any mapping of category reports will do, not just the grader's lazy CategoryReports
+    store.save_report("Service1", replace(report, parent_category_grades=dict(report.parent_category_grades)))
+    assert store.get_category_scores("Service1") == {"Ownership": 30.0}
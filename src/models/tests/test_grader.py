@@ -253,7 +253,7 @@ def test_grade_privacy_issues_only_unknown(grader):
     unknown_issues = ["InvalidCategory: this issue is invalid"]
     report = grader.grade_privacy_issues(unknown_issues)
     assert report is not None
-    assert report.unknown_issues == unknown_issues
+    assert report.unknown_issues == tuple(unknown_issues)
     assert report.overall_score == 100.0  # No valid issues = perfect score
 def test_grade_privacy_issues_empty(grader):
     """Test grade_privacy_issues with no issues provided."""
@@ -297,4 +297,190 @@ def test_save_grade_to_csv_multiple_services(tmp_path):
     PrivacyGrader.save_grade_to_csv("Service2", "B", csv_path)
     df = pd.read_csv(csv_path)
     assert df[df["service_name"] == "Service1"]["grade"].iloc[0] == "A"
-    assert df[df["service_name"] == "Service2"]["grade"].iloc[0] == "B"
\ No newline at end of file
+    assert df[df["service_name"] == "Service2"]["grade"].iloc[0] == "B"
+
+def test_compile_issue_index(grader):
+    """Test the compiled (parent, issue) lookup table."""
+    entry = grader.issue_index[("Ownership", "this service takes credit for your content")]
+    assert entry.classification == "bad"
+    assert entry.privacy_issue == "This service takes credit for your content"
+    assert len(grader.issue_index) == 5
+
+def test_calculate_category_scores_issue_under_wrong_parent(grader):
+    """Test that a known issue filed under the wrong parent category is skipped instead of raising."""
+    valid_issues = ["Ownership: the app requires broad device permissions"]
+    scores = grader._calculate_category_scores(valid_issues)
+    assert all(score == 1.0 for score in scores.values())
+
+def test_grade_cache_reordered_issues(grader):
+    """Test that reordered issue lists are served from the report cache."""
+    issues = [
+        "Ownership: this service takes credit for your content",
+        "Device Permissions: the app requires broad device permissions",
+    ]
+    first = grader.grade_privacy_issues(issues)
+    assert grader.grade_privacy_issues(list(issues)) is first
+    second = grader.grade_privacy_issues(list(reversed(issues)))
+    assert (grader.cache_hits, grader.cache_misses) == (2, 1)
+    with pytest.raises(AttributeError):
+        first.overall_grade = "A"
+
+    # The reordered list shares the scores but keeps its own order
+    assert second is not first
+    assert second.overall_score == first.overall_score
+    assert second.parent_category_grades == first.parent_category_grades
+    assert list(second.grade_state.categories) == list(reversed(first.grade_state.categories))
+
+def test_grade_cache_echoes_each_callers_issues(mock_mapping_df, mock_category_weights):
+    """Test that a cache hit reports the caller's own issue strings, not the first caller's."""
+    grader = PrivacyGrader(mock_mapping_df, mock_category_weights)
+    first = grader.grade_privacy_issues(["Ownership: this service takes credit for your content", "Made up"])
+    second = grader.grade_privacy_issues(["Made up", "Ownership:  THIS SERVICE takes credit for your content "])
+    assert grader.cache_hits == 1
+    assert second.unknown_issues == ("Made up",)
+    assert second.parent_category_grades["Ownership"].bad_issues == ("THIS SERVICE takes credit for your content",)
+    assert second.worst_parent_categories[0].bad_issues == ("THIS SERVICE takes credit for your content",)
+    assert first.parent_category_grades["Ownership"].bad_issues == ("this service takes credit for your content",)
+
+def test_cached_report_cannot_be_corrupted_by_callers(grader):
+    """Test that mutating a returned report fails instead of leaking into later grades."""
+    issues = ["Ownership: this service takes credit for your content", "InvalidCategory: not an issue"]
+    report = grader.grade_privacy_issues(issues)
+    ownership = report.parent_category_grades["Ownership"]
+    for mutate in (
+        lambda: report.unknown_issues.append("injected"),
+        lambda: report.worst_parent_categories.append(ownership),
+        lambda: ownership.bad_issues.append("injected"),
+        lambda: report.parent_category_grades.scores.append(0.0),
+        lambda: report.grade_state.categories["Ownership"].counts.update(bad=5),
+        lambda: report.grade_state.categories.pop("Ownership"),
+    ):
+        with pytest.raises((AttributeError, TypeError)):
+            mutate()
+
+    again = grader.grade_privacy_issues(issues)
+    assert grader.cache_hits == 1
+    assert again.unknown_issues == ("InvalidCategory: not an issue",)
+    assert again.parent_category_grades["Ownership"].bad_issues == ("this service takes credit for your content",)
+    assert again.grade_state.categories["Ownership"].counts["bad"] == 1
+
+def test_grade_cache_flushed_on_weight_change(grader):
+    """Test that changing category weights invalidates cached reports."""
+    issues = ["Ownership: this service takes credit for your content"]
+    first = grader.grade_privacy_issues(issues)
+    grader.category_weights = {category: 1.0 for category in grader.all_parent_categories}
+    second = grader.grade_privacy_issues(issues)
+    assert second is not first
+    assert second.overall_score != first.overall_score
+    assert grader.cache_misses == 2
+
+def test_grade_cache_lru_eviction(mock_mapping_df, mock_category_weights):
+    """Test that the least recently used report is evicted once the cache is full."""
+    grader = PrivacyGrader(mock_mapping_df, mock_category_weights, cache_size=1)
+    grader.grade_privacy_issues(["Ownership: this service takes credit for your content"])
+    grader.grade_privacy_issues(["User Rights: you can delete your content from the service"])
+    grader.grade_privacy_issues(["Ownership: this service takes credit for your content"])
+    assert grader.cache_hits == 0
+    assert grader.cache_misses == 3
+    assert len(grader._report_cache) == 1
+
+def test_grade_cache_exact_repeat_is_a_lookup(mock_mapping_df, mock_category_weights):
+    """Test that an exact repeat skips the canonical key, and that reassigning a setting re-keys the cache."""
+    grader = PrivacyGrader(mock_mapping_df, mock_category_weights, cache_size=1)
+    issues = ["Ownership: this service takes credit for your content", "Made up"]
+    first = grader.grade_privacy_issues(issues)
+    version = grader._config_version_memo
+    with patch.object(grader, "_canonical_issue_key") as canonical_key:
+        assert grader.grade_privacy_issues(list(issues)) is first
+    canonical_key.assert_not_called()
+    assert grader._config_version_memo == version
+
+    grader.grade_boundaries = {0.5: Grade.A}
+    assert grader._config_version_memo is None
+    assert grader.grade_privacy_issues(issues) is not first
+    grader.grade_privacy_issues(["User Rights: you can delete your content from the service"])
+    assert list(grader._report_cache_keys) == [("User Rights: you can delete your content from the service",)]
+    assert grader.cache_hits == 1 and grader.cache_misses == 3
+
+def test_what_if_category_weights(grader, mock_mapping_df):
+    """Test that what-if re-grading matches a full re-grade under the new category weights."""
+    issues = [
+        "Ownership: this service takes credit for your content",
+        "User Rights: you can delete your content from the service",
+    ]
+    report = grader.grade_privacy_issues(issues)
+    new_weights = {"Ownership": 1.0, "Data Protection": 0.5, "Device Permissions": 0.5, "User Rights": 1.0}
+
+    result = grader.what_if(report.grade_state, category_weights=new_weights)
+    expected = PrivacyGrader(mock_mapping_df, new_weights).grade_privacy_issues(issues)
+
+    assert result.overall_score == expected.overall_score
+    assert result.overall_grade == expected.overall_grade
+    assert result.category_scores == {
+        category: category_report.score for category, category_report in expected.parent_category_grades.items()
+    }
+
+def test_what_if_classification_weights_and_boundaries(grader, mock_mapping_df, mock_category_weights):
+    """Test what-if re-grading with new classification weights and grade boundaries."""
+    issues = ["User Rights: you can delete your content from the service"]
+    report = grader.grade_privacy_issues(issues)
+    state = report.grade_state
+    assert state.categories["User Rights"].counts["good"] == 1
+
+    new_classification_weights = {"blocker": -2.0, "bad": -0.7, "neutral": 0.0, "good": 0.5}
+    new_boundaries = {0.99: Grade.A, 0.5: Grade.B}
+    result = grader.what_if(state, classification_weights=new_classification_weights,
+                            grade_boundaries=new_boundaries)
+
+    expected_grader = PrivacyGrader(mock_mapping_df, mock_category_weights)
+    expected_grader.classification_weights = new_classification_weights
+    expected_grader.grade_boundaries = new_boundaries
+    expected_scores = expected_grader._calculate_category_scores(issues)
+    assert result.category_scores["User Rights"] == round(expected_scores["User Rights"] * 100, 2)
+    assert result.overall_grade == expected_grader._get_grade(
+        expected_grader._calculate_overall_score(expected_scores)).value
+    # The original state is untouched
+    assert state.categories["User Rights"].base_score == 1.1
+
+def test_category_reports_are_lazy_and_serialize_like_dicts(grader):
+    """Category reports are built on first access and encode to the same JSON as a plain dict."""
+    issues = [
+        "Ownership: this service takes credit for your content",
+        "Ownership: if you offer suggestions to the service they become the owner",
+    ]
+    report = grader.grade_privacy_issues(issues)
+    category_grades = report.parent_category_grades
+    assert set(category_grades.found) == {"Ownership"}
+    assert not category_grades._reports  # Not even the worst categories are built before they are read
+    assert report.worst_parent_categories == (category_grades["Ownership"],)
+    assert report.worst_parent_categories[0] is category_grades._reports["Ownership"]
+    assert "User Rights" not in category_grades._reports
+
+    ownership = category_grades["Ownership"]
+    assert ownership.bad_issues == ("this service takes credit for your content",)
+    assert ownership.neutral_issues == ("if you offer suggestions to the service they become the owner",)
+    assert category_grades["User Rights"].good_issues == ()
+    assert category_grades["Ownership"] is ownership
+    assert category_grades.scores_by_category() == {c: r.score for c, r in category_grades.items()}
+
+    # Category states are lazy too: grading builds no CategoryState until one is read
+    states = report.grade_state.categories
+    assert list(states) == ["Ownership"] and not states._states
+    assert dict(states["Ownership"].counts) == {"blocker": 0, "bad": 1, "neutral": 1, "good": 0}
+    assert states["Ownership"] is states["Ownership"]
+
+    encoders = pytest.importorskip("fastapi.encoders")
+    assert encoders.jsonable_encoder(category_grades) == encoders.jsonable_encoder(dict(category_grades))
+
+def test_category_score_memo_follows_config(mock_mapping_df, mock_category_weights):
+    """Memoized category scores are reused within a config and dropped when a weight changes."""
+    grader = PrivacyGrader(mock_mapping_df, mock_category_weights, cache_size=0)
+    issues = ["Ownership: this service takes credit for your content"]
+    first = grader.grade_privacy_issues(issues)
+    assert list(grader._grading_tables().scores) == [("Ownership", 0, 1, 0, 0)]
+    assert grader.grade_privacy_issues(issues) == first
+
+    new_weights = {**mock_category_weights, "Ownership": 0.5}
+    grader.category_weights = new_weights
+    expected = PrivacyGrader(mock_mapping_df, new_weights, cache_size=0).grade_privacy_issues(issues)
+    assert grader.grade_privacy_issues(issues) == expected != first
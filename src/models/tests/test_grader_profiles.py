@@ -0,0 +1,95 @@
+import json
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from models.grader_profiles import GraderProfiles, UnknownProfile, load_weight_profiles
+from models.privacy_grader import PrivacyGrader
+from models.score_distribution import ScoreDistribution
+
+
+@pytest.fixture
+def base_grader():
+    mapping_df = pd.DataFrame({
+        "parent_issue": ["Ownership", "User Rights"],
+        "privacy_issue": ["This service takes credit for your content", "You can delete your content from the service"],
+        "classification": ["bad", "good"],
+    })
+    return PrivacyGrader(mapping_df, {"Ownership": 0.5, "User Rights": 0.5})
+
+
+ISSUES = ["Ownership: This service takes credit for your content",
+          "User Rights: You can delete your content from the service"]
+
+
+def test_profiles_share_catalog(base_grader):
+    profiles = GraderProfiles(base_grader, {"rights-first": {"User Rights": 0.9}})
+    grader = profiles.get("rights-first")
+
+    assert profiles.get() is base_grader
+    assert grader.category_weights == {"Ownership": 0.5, "User Rights": 0.9}
+    assert base_grader.category_weights == {"Ownership": 0.5, "User Rights": 0.5}
+    assert grader.issue_index is base_grader.issue_index
+    assert grader.issues_by_category is base_grader.issues_by_category
+    assert grader._report_cache is not base_grader._report_cache
+
+
+def test_profiles_grade_with_their_weights(base_grader):
+    profiles = GraderProfiles(base_grader, {"rights-first": {"User Rights": 0.9}})
+    base_report = profiles.get().grade_privacy_issues(ISSUES)
+    profile_report = profiles.get("rights-first").grade_privacy_issues(ISSUES)
+
+    expected = base_grader.with_category_weights({"User Rights": 0.9}, cache_size=0).grade_privacy_issues(ISSUES)
+    assert profile_report == expected
+    assert profile_report.overall_score != base_report.overall_score
+    # Grading one profile never serves another profile's cached report
+    assert profiles.get().grade_privacy_issues(ISSUES) == base_report
+
+
+def test_profile_errors(base_grader):
+    profiles = GraderProfiles(base_grader)
+    with pytest.raises(UnknownProfile, match="missing"):
+        profiles.get("missing")
+    with pytest.raises(ValueError, match="Unknown Category"):
+        profiles.add("typo", {"Unknown Category": 1.0})
+    with pytest.raises(ValueError):
+        profiles.add("default", {"Ownership": 1.0})
+
+
+def test_load_weight_profiles(tmp_path, base_grader):
+    path = tmp_path / "weight_profiles.json"
+    path.write_text(json.dumps({"a": {"Ownership": 1}, "b": {"User Rights": 0.25}}))
+    profiles = GraderProfiles(base_grader, load_weight_profiles(path))
+    assert profiles.names == ["a", "b", "default"]
+    assert profiles.get("a").category_weights["Ownership"] == 1.0
+
+
+def test_only_the_default_profile_reports_percentiles(base_grader, tmp_path):
+    path = str(tmp_path / "score_distribution.json")
+    ScoreDistribution([40.0, 60.0, 80.0], {"Ownership": [30.0, 100.0]}).save(path)
+    base_grader.load_score_distribution(path)
+    profiles = GraderProfiles(base_grader, {"rights-first": {"User Rights": 0.9}})
+
+    assert profiles.get().grade_privacy_issues(ISSUES).overall_percentile is not None
+    profile_report = profiles.get("rights-first").grade_privacy_issues(ISSUES)
+    assert profile_report.overall_percentile is None
+    assert profile_report.parent_category_grades["Ownership"].percentile is None
+
+
+def test_get_grade_maps_only_unknown_profiles_to_404(monkeypatch):
+    from api_service.api.routers import summarize
+
+    client = TestClient(FastAPI(routes=summarize.router.routes))
+    monkeypatch.setitem(summarize.parsed_issues_storage, "issues", ISSUES)
+    response = client.post("/get-grade/", params={"profile": "missing"})
+    assert response.status_code == 404
+    assert "missing" in response.json()["detail"]
+
+    # A KeyError from grading itself is a bug, not a missing profile
+    def broken_grader(*args, **kwargs):
+        raise KeyError("weight")
+    monkeypatch.setattr(summarize, "get_privacy_grader", broken_grader)
+    monkeypatch.setattr(summarize.traceback, "print_exc", lambda: None)
+    with patch("builtins.print"):
+        assert client.post("/get-grade/").status_code == 500
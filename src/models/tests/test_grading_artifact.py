@@ -0,0 +1,51 @@
+import os
+import pickle
+import pandas as pd
+import pytest
+from models.grading_artifact import (
+    MODELS_DIR, GradingArtifactError, artifact_is_current, build_grading_artifact, load_grading_artifact
+)
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+
+MAPPING_CSV = os.path.join(MODELS_DIR, "mapping_df.csv")
+WEIGHTS_CSV = os.path.join(MODELS_DIR, "category_weights.csv")
+
+
+@pytest.fixture
+def artifact_path(tmp_path):
+    path = str(tmp_path / "grading_artifact.pkl")
+    build_grading_artifact(MAPPING_CSV, WEIGHTS_CSV, path)
+    return path
+
+
+def test_from_artifact_grades_like_csv_grader(artifact_path):
+    csv_grader = PrivacyGrader(pd.read_csv(MAPPING_CSV), load_weights_from_csv(WEIGHTS_CSV))
+    artifact_grader = PrivacyGrader.from_artifact(artifact_path)
+
+    assert artifact_grader.issue_index == csv_grader.issue_index
+    assert artifact_grader.category_weights == csv_grader.category_weights
+    assert artifact_grader.issues_by_category == csv_grader.issues_by_category
+
+    issues = [f"{parent}: {issue}" for parent, issue, _ in csv_grader.catalog_rows[::25]] + ["Unknown: not listed"]
+    assert artifact_grader.grade_privacy_issues(issues) == csv_grader.grade_privacy_issues(issues)
+
+
+def test_artifact_is_current(artifact_path, tmp_path):
+    assert artifact_is_current(artifact_path, MAPPING_CSV, WEIGHTS_CSV)
+
+    edited_weights = tmp_path / "category_weights.csv"
+    edited_weights.write_text(open(WEIGHTS_CSV).read() + "\n")
+    assert not artifact_is_current(artifact_path, MAPPING_CSV, str(edited_weights))
+    assert not artifact_is_current(str(tmp_path / "missing.pkl"), MAPPING_CSV, WEIGHTS_CSV)
+
+
+def test_load_rejects_other_version(artifact_path):
+    with open(artifact_path, 'rb') as f:
+        artifact = pickle.load(f)
+    artifact['version'] += 1
+    with open(artifact_path, 'wb') as f:
+        pickle.dump(artifact, f)
+
+    with pytest.raises(GradingArtifactError):
+        load_grading_artifact(artifact_path)
+    assert not artifact_is_current(artifact_path, MAPPING_CSV, WEIGHTS_CSV)
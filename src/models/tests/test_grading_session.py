@@ -0,0 +1,103 @@
+import os
+import random
+import pandas as pd
+import pytest
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    return mapping_df, category_weights
+
+
+def stream(grader, seed):
+    """A shuffled issue list with repeats, junk and paraphrases, split into uneven batches."""
+    rng = random.Random(seed)
+    catalog_issues = [f"{e.parent_issue}: {e.privacy_issue}" for e in grader.issue_index.values()]
+    issues = rng.sample(catalog_issues, 40)
+    issues += rng.sample(issues, 5) + ["not an issue", "Ownership: made up issue"]
+    issues += [issue.upper() for issue in rng.sample(issues[:40], 3)]
+    issues += [issue.rstrip('.') + ' as well' for issue in rng.sample(issues[:40], 3)]
+    rng.shuffle(issues)
+
+    cuts = sorted(rng.sample(range(1, len(issues)), 6))
+    return issues, [issues[a:b] for a, b in zip([0] + cuts, cuts + [len(issues)])]
+
+
+@pytest.mark.parametrize("resolve_unknown", [False, True])
+def test_session_matches_one_shot(catalog, resolve_unknown):
+    mapping_df, category_weights = catalog
+    grader = PrivacyGrader(mapping_df, category_weights, resolve_unknown=resolve_unknown, cache_size=0)
+    issues, batches = stream(grader, seed=11)
+
+    session = grader.session()
+    seen = []
+    for batch in batches:
+        seen += batch
+        snapshot = session.add(batch)
+        expected = grader.grade_privacy_issues(seen)
+        assert snapshot == expected
+        assert snapshot.grade_state == expected.grade_state
+        assert list(snapshot.grade_state.categories) == list(expected.grade_state.categories)
+
+    assert session.snapshot() == grader.grade_privacy_issues(issues)
+
+
+def test_session_only_touches_changed_categories(catalog, monkeypatch):
+    mapping_df, category_weights = catalog
+    grader = PrivacyGrader(mapping_df, category_weights)
+    session = grader.session()
+    first = session.add(["Ownership: This service takes credit for your content"])
+
+    rescored = []
+    score_states = grader._score_states
+    monkeypatch.setattr(grader, "_score_states", lambda states, *args: rescored.append(set(states)) or
+                        score_states(states, *args))
+    second = session.add(["Ownership: This service takes credit for your content"])
+    assert rescored == [{"Ownership"}]
+
+    changed = {c for c in grader.all_parent_categories
+               if first.parent_category_grades[c] != second.parent_category_grades[c]}
+    assert changed == {"Ownership"}
+
+
+def test_session_empty_and_config_change(catalog):
+    mapping_df, category_weights = catalog
+    grader = PrivacyGrader(mapping_df, category_weights)
+    session = grader.session()
+    assert session.snapshot() is None
+    assert session.add([]) is None
+
+    issues = ["Ownership: This service takes credit for your content"]
+    session.add(issues)
+    grader.category_weights = {**grader.category_weights, "Ownership": 0.1}
+    assert session.add([]) == grader.grade_privacy_issues(issues)
+
+
+def test_session_reuses_reports_of_unchanged_categories(catalog):
+    mapping_df, category_weights = catalog
+    grader = PrivacyGrader(mapping_df, category_weights)
+    session = grader.session()
+    first = session.add(["Ownership: This service takes credit for your content", "not an issue"])
+    ownership = first.parent_category_grades["Ownership"]
+    untouched = first.parent_category_grades["Transparency"]
+
+    other = next(f"{e.parent_issue}: {e.privacy_issue}" for e in grader.issue_index.values()
+                 if e.parent_issue not in ("Ownership", "Transparency"))
+    second = session.add([other, "still not an issue"])
+    assert second.parent_category_grades["Ownership"] is ownership
+    assert second.parent_category_grades["Transparency"] is untouched
+    assert second.parent_category_grades[other.split(":")[0]] is not first.parent_category_grades[other.split(":")[0]]
+
+    third = session.add(["Ownership: This service takes credit for your content"])
+    assert third.parent_category_grades["Ownership"] is not ownership
+    assert len(third.parent_category_grades["Ownership"].bad_issues) == 2
+
+    # Later batches append in place without changing what earlier snapshots show
+    assert ownership.bad_issues == ("This service takes credit for your content",)
+    assert first.unknown_issues == ("not an issue",)
+    assert second.unknown_issues == ("not an issue", "still not an issue")
@@ -0,0 +1,130 @@
+import os
+import re
+import fitz
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from models.get_issues import (ModelPool, analyze_pdf, extract_pdf_text, get_issue_catalog, get_issue_index,
+                               prefilter, split_sections, PREFILTER_SECTION_TOKENS, PREFILTER_TOP_ISSUES)
+from models.issue_prefilter import IssueIndex, tokenize
+
+LINES = [
+    "Ownership: This service takes credit for your content",
+    "Trackers: Third party cookies are employed but with opt out instructions",
+    "Dispute Resolution: You are forced into binding arbitration in case of disputes",
+    "Law and Government Requests: Your personal data may be disclosed to comply with government requests",
+]
+SECTIONS = [
+    "We use cookies, including third-party cookies. You can opt out of these cookies in your settings.",
+    "Any dispute will be resolved through binding arbitration. You waive the right to a class action.",
+    "Our offices are open Monday to Friday.",
+]
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Hand labels of the bundled PDFs: one row per document and catalog issue, with the passage that supports it
+PDF_LABELS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "prefilter_labels.csv")
+# Measured recall@N of those labels (54 issues in 4 documents), less a little slack, so ranking
+# changes that lose labelled issues fail here; see models/benchmarks/bench_issue_prefilter.py
+MIN_RECALL = {20: 0.25, 40: 0.35, 80: 0.55, PREFILTER_TOP_ISSUES: 0.78}
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "mapping.csv"
+    pd.DataFrame({
+        "parent_issue": [line.split(": ", 1)[0] for line in LINES],
+        "privacy_issue": [line.split(": ", 1)[1] for line in LINES],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def test_tokenize_drops_stopwords_and_stems():
+    assert tokenize("This service shares your cookies, sharing them") == ["shar", "cooki", "shar"]
+    assert tokenize("Share a cookie") == ["shar", "cooki"]
+
+
+def test_select_ranks_matching_issues_and_sections():
+    index = IssueIndex(LINES)
+    scores = index.score(SECTIONS)
+    assert scores.shape == (4, 3)
+    assert scores[1].argmax() == 0 and scores[2].argmax() == 1
+    assert scores[0].max() == 0  # Nothing about content ownership
+
+    issues, kept = index.select(SECTIONS, top_issues=2, top_sections=2)
+    assert issues == [1, 2]
+    assert kept == [0, 1]
+    assert index.select(SECTIONS, top_issues=2) == ([1, 2], [0, 1, 2])
+    assert index.select([], top_issues=2, top_sections=1) == ([0, 1], [])
+
+
+def test_prefilter_narrows_prompt_but_keeps_lookup(csv_path):
+    catalog = get_issue_catalog(csv_path)
+    narrowed, text = prefilter(catalog, "\n\n".join(SECTIONS), top_issues=2, top_sections=1, section_tokens=30)
+    assert narrowed.prompt_block == "\n".join(LINES[1:3])
+    assert narrowed.parent_by_issue == catalog.parent_by_issue
+    assert text in SECTIONS[:2]
+
+
+def test_analyze_pdf_sends_only_candidate_issues(tmp_path, csv_path):
+    pdf_path = str(tmp_path / "policy.pdf")
+    doc = fitz.open()
+    for section in SECTIONS:
+        doc.new_page().insert_text((72, 72), section[:60] + "\n" + section[60:])
+    doc.save(pdf_path)
+    doc.close()
+
+    prompts = []
+
+    class RecordingModel:
+        def start_chat(self):
+            return self
+
+        def send_message(self, messages, generation_config=None):
+            prompts.append(messages)
+            return SimpleNamespace(text="You are forced into binding arbitration in case of disputes")
+
+    pool = ModelPool(model_factory=lambda endpoint: RecordingModel(), init=lambda **kwargs: None)
+    with patch("builtins.print"):
+        full = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", models=pool)
+        filtered = analyze_pdf(pdf_path, csv_path, "project", "location", "endpoint", models=pool,
+                               top_issues=2)
+
+    assert all(line in prompts[0][0] for line in LINES)
+    assert prompts[1][0].splitlines()[1:] == [LINES[1], LINES[2]]
+    assert filtered.issues == full.issues == [LINES[2]]
+    assert filtered.text == full.text
+
+
+@pytest.fixture(scope="module")
+def labelled_pdfs():
+    labels = pd.read_csv(PDF_LABELS)
+    texts = {
+        document: extract_pdf_text(os.path.join(MODELS_DIR, "pdf_directory", f"{document}.pdf")).text
+        for document in labels["document"].unique()
+    }
+    return labels, texts
+
+
+def test_pdf_labels_name_catalog_issues_found_in_the_documents(labelled_pdfs):
+    labels, texts = labelled_pdfs
+    lines = set(get_issue_index(get_issue_catalog(os.path.join(MODELS_DIR, "mapping_df.csv"))).lines)
+    for row in labels.itertuples():
+        assert f"{row.parent_issue}: {row.privacy_issue}" in lines
+        assert row.evidence in re.sub(r"\s+", " ", texts[row.document])
+
+
+def test_prefilter_recall_on_labelled_pdfs(labelled_pdfs):
+    labels, texts = labelled_pdfs
+    index = get_issue_index(get_issue_catalog(os.path.join(MODELS_DIR, "mapping_df.csv")))
+    row_by_line = {line: row for row, line in enumerate(index.lines)}
+
+    found = dict.fromkeys(MIN_RECALL, 0)
+    for document, rows in labels.groupby("document"):
+        sections = split_sections(texts[document], PREFILTER_SECTION_TOKENS, 0)
+        wanted = {row_by_line[f"{parent}: {issue}"] for parent, issue in zip(rows["parent_issue"], rows["privacy_issue"])}
+        for n in MIN_RECALL:
+            found[n] += len(wanted.intersection(index.select(sections, n)[0]))
+
+    recall = {n: found[n] / len(labels) for n in MIN_RECALL}
+    assert all(recall[n] >= MIN_RECALL[n] for n in MIN_RECALL), recall
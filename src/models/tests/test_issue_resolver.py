@@ -0,0 +1,70 @@
+import os
+import pandas as pd
+import pytest
+from models.privacy_grader import PrivacyGrader
+from models.issue_resolver import IssueResolver, ResolvedIssue
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def catalog_grader():
+    return PrivacyGrader(pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv")), resolve_unknown=True)
+
+
+def test_best_match_paraphrase(catalog_grader):
+    resolver = catalog_grader.issue_resolver
+    match, score = resolver.best_match("Unknown: The service takes credit for your content.")
+    assert match == "Ownership: This service takes credit for your content"
+    assert score > 0.9
+
+
+def test_resolve_threshold(catalog_grader):
+    """Unrelated text and opposite-polarity paraphrases stay unknown."""
+    issues = [
+        "Unknown: you retain ownership of your content",
+        "Unknown: The weather is nice today",
+        "Unknown: Your personal data is sold to advertisers",
+        "",
+    ]
+    resolved, unresolved = catalog_grader.issue_resolver.resolve(issues)
+    assert [r.resolved for r in resolved] == ["Ownership: You maintain ownership of your content"]
+    assert unresolved == issues[1:]
+
+
+def test_resolver_empty_catalog():
+    resolver = IssueResolver({})
+    assert resolver.best_match("Ownership: anything") == (None, 0.0)
+    assert resolver.resolve(["Ownership: anything"]) == ([], ["Ownership: anything"])
+
+
+def test_grade_with_resolver_reports_resolutions(catalog_grader):
+    report = catalog_grader.grade_privacy_issues([
+        "Unknown: The service takes credit for your content.",
+        "Unknown: The weather is nice today",
+    ])
+    assert report.unknown_issues == ("Unknown: The weather is nice today",)
+    assert len(report.resolved_issues) == 1
+    resolution = report.resolved_issues[0]
+    assert isinstance(resolution, ResolvedIssue)
+    assert resolution.original == "Unknown: The service takes credit for your content."
+    assert report.parent_category_grades["Ownership"].bad_issues == ("This service takes credit for your content",)
+
+
+def test_cached_resolutions_echo_the_callers_strings(catalog_grader):
+    issues = ["Unknown: The service takes credit for your content.", "Unknown: The weather is nice today"]
+    first = catalog_grader.grade_privacy_issues(issues)
+    second = catalog_grader.grade_privacy_issues(["Unknown: the weather is nice today",
+                                                  "Unknown:  the SERVICE takes credit for your content."])
+    assert second.resolved_issues[0].original == "Unknown:  the SERVICE takes credit for your content."
+    assert second.resolved_issues[0].resolved == first.resolved_issues[0].resolved
+    assert second.unknown_issues == ("Unknown: the weather is nice today",)
+    assert second.overall_score == first.overall_score
+
+
+def test_grade_without_resolver_keeps_unknown():
+    grader = PrivacyGrader(pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv")))
+    report = grader.grade_privacy_issues(["Unknown: The service takes credit for your content."])
+    assert grader.issue_resolver is None
+    assert report.resolved_issues is None
+    assert report.overall_score == 100.0
@@ -1,9 +1,21 @@
 import pytest
 import fitz
 from unittest.mock import patch, MagicMock
-from models.get_issues import extract_text_from_pdf, process_pdf_privacy_issues
+import os
+import threading
+from models.get_issues import (MODEL_POOL, ModelPool, analyze_pdf, extract_text_from_pdf, get_issue_catalog,
+                                get_page_pool, iter_pdf_pages, join_pages, process_pdf_privacy_issues)
 import pandas as pd
 
+
+@pytest.fixture(autouse=True)
+def fresh_model_pool():
+    """Model handles are shared per process; start every test without any."""
+    MODEL_POOL.clear()
+    yield
+    MODEL_POOL.clear()
+
+
 # Fixture to create a temporary PDF with known content for testing
 @pytest.fixture
 def mock_pdf_with_content(tmp_path):
@@ -35,6 +47,88 @@ def test_extract_text_from_pdf(mock_pdf_with_content):
     assert extracted_text.strip() == expected_text, "Extracted text should match the content of the PDF."
 
 
+@pytest.fixture
+def multi_page_pdf(tmp_path):
+    pdf_path = tmp_path / "multi_page.pdf"
+    doc = fitz.open()
+    for i in range(5):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1} text.")
+    doc.save(pdf_path)
+    doc.close()
+    return str(pdf_path)
+
+
+# Unit Test: Pages are streamed with their numbers and joined in order
+def test_iter_pdf_pages(multi_page_pdf):
+    pages = list(iter_pdf_pages(multi_page_pdf))
+    assert [page.number for page in pages] == [1, 2, 3, 4, 5]
+    assert [page.text.strip() for page in pages] == [f"Page {i} text." for i in range(1, 6)]
+    assert extract_text_from_pdf(multi_page_pdf) == join_pages(pages)
+
+
+# Unit Test: max_pages and max_chars stop extraction early
+def test_iter_pdf_pages_limits(multi_page_pdf):
+    assert [page.number for page in iter_pdf_pages(multi_page_pdf, max_pages=2)] == [1, 2]
+
+    page_length = len(next(iter_pdf_pages(multi_page_pdf)).text)
+    pages = list(iter_pdf_pages(multi_page_pdf, max_chars=page_length + 3))
+    assert [page.number for page in pages] == [1, 2]
+    assert len(pages[1].text) == 3
+    assert len(extract_text_from_pdf(multi_page_pdf, max_chars=page_length)) == page_length
+    assert extract_text_from_pdf(multi_page_pdf, max_pages=0) == ""
+
+
+# Unit Test: A process pool returns the same pages in order; small files stay serial
+def test_iter_pdf_pages_parallel(multi_page_pdf):
+    serial = list(iter_pdf_pages(multi_page_pdf))
+    assert list(iter_pdf_pages(multi_page_pdf, workers=2, parallel_threshold=1)) == serial
+    assert list(iter_pdf_pages(multi_page_pdf, workers=8, parallel_threshold=1)) == serial
+    assert list(iter_pdf_pages(multi_page_pdf, max_chars=20, workers=2, parallel_threshold=1)) == \
+        list(iter_pdf_pages(multi_page_pdf, max_chars=20))
+
+    with patch("models.get_issues.ProcessPoolExecutor") as pool:
+        assert list(iter_pdf_pages(multi_page_pdf, workers=4)) == serial
+    pool.assert_not_called()
+
+
+# Unit Test: Parallel extractions share one process pool per worker count
+def test_parallel_extractions_reuse_the_pool(multi_page_pdf):
+    serial = list(iter_pdf_pages(multi_page_pdf))
+    assert list(iter_pdf_pages(multi_page_pdf, workers=2, parallel_threshold=1)) == serial
+    pool = get_page_pool(2)
+    with patch("models.get_issues.ProcessPoolExecutor") as new_pool:
+        assert list(iter_pdf_pages(multi_page_pdf, workers=2, parallel_threshold=1)) == serial
+        assert list(iter_pdf_pages(multi_page_pdf, max_chars=20, workers=2, parallel_threshold=1)) == \
+            list(iter_pdf_pages(multi_page_pdf, max_chars=20))
+    new_pool.assert_not_called()
+    assert get_page_pool(2) is pool
+
+
+# Unit Test: The catalog renders the same prompt block as row-by-row formatting and is loaded once
+def test_issue_catalog_loaded_once(tmp_path):
+    mapping_csv = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mapping_df.csv")
+    df = pd.read_csv(mapping_csv)
+    catalog = get_issue_catalog(mapping_csv)
+    assert catalog.prompt_block == "\n".join(
+        f"{row['parent_issue']}: {row['privacy_issue']}" for _, row in df.iterrows()
+    )
+    assert dict(catalog.parent_by_issue) == dict(zip(df['privacy_issue'].str.lower(), df['parent_issue']))
+    with pytest.raises(TypeError):
+        catalog.parent_by_issue["new issue"] = "Ownership"
+
+    csv_path = tmp_path / "mapping.csv"
+    csv_path.write_text("parent_issue,privacy_issue\nOwnership,First Issue\n")
+    first = get_issue_catalog(str(csv_path))
+    with patch("models.get_issues.load_issue_catalog") as load:
+        assert get_issue_catalog(str(csv_path)) is first
+    load.assert_not_called()
+
+    csv_path.write_text("parent_issue,privacy_issue\nOwnership,First Issue\nUser Rights,Second Issue\n")
+    reloaded = get_issue_catalog(str(csv_path))
+    assert reloaded.parent_by_issue == {"first issue": "Ownership", "second issue": "User Rights"}
+    assert reloaded.digest != first.digest
+
+
 # Unit Test: Test Vertex AI initialization and chat response with mocks
 def test_process_pdf_privacy_issues(mock_pdf_with_content, mock_csv_file):
     pdf_path, test_content = mock_pdf_with_content
@@ -109,4 +203,55 @@ def test_end_to_end_process(mock_pdf_with_content, mock_csv_file):
         # Validate final response was printed
         mock_print.assert_any_call("Identified privacy attributes:")      
         # mock_print.assert_any_call(mock_response.text)
-        mock_print.assert_any_call(f"- Unknown: {mock_response.text}")
\ No newline at end of file
+        mock_print.assert_any_call(f"- Unknown: {mock_response.text}")
+
+
+class FakeChat:
+    def __init__(self, model):
+        self.model = model
+
+    def send_message(self, messages, generation_config=None):
+        self.model.messages.append(messages)
+        return MagicMock(text="this service takes credit for your content")
+
+
+class FakeModel:
+    """Local stand-in for a GenerativeModel endpoint handle."""
+    def __init__(self, resource_name):
+        self.resource_name = resource_name
+        self.messages = []
+
+    def start_chat(self):
+        return FakeChat(self)
+
+
+# Unit Test: Model handles are built once per endpoint and shared, also across threads
+def test_model_pool_reuses_handles(mock_pdf_with_content, mock_csv_file):
+    pdf_path, _ = mock_pdf_with_content
+    init, built = MagicMock(), []
+
+    def factory(resource_name):
+        built.append(resource_name)
+        return FakeModel(resource_name)
+
+    pool = ModelPool(model_factory=factory, init=init)
+    with patch("builtins.print"):
+        for _ in range(3):
+            analysis = analyze_pdf(pdf_path, mock_csv_file, "project", "location", "endpoint", models=pool)
+        analyze_pdf(pdf_path, mock_csv_file, "project", "location", "other-endpoint", models=pool)
+
+    assert analysis.issues == ["ownership: this service takes credit for your content"]
+    assert built == ["projects/project/locations/location/endpoints/endpoint",
+                     "projects/project/locations/location/endpoints/other-endpoint"]
+    init.assert_called_once_with(project="project", location="location")
+    assert len(pool.get("project", "location", "endpoint").messages) == 3
+    assert set(pool.setup_seconds) == {("project", "location", "endpoint"), ("project", "location", "other-endpoint")}
+
+    handles = []
+    threads = [threading.Thread(target=lambda: handles.append(pool.get("project", "location", "third")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, handles))) == 1 and len(built) == 3
@@ -0,0 +1,83 @@
+import os
+from dataclasses import replace
+import pandas as pd
+import pytest
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+from models.report_export import ReportWriter, export_reports
+
+pa = pytest.importorskip("pyarrow")
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def reports():
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    grader = PrivacyGrader(mapping_df, category_weights, cache_size=0)
+    catalog_issues = [f"{e.parent_issue}: {e.privacy_issue}" for e in grader.issue_index.values()]
+    return [
+        (f"service-{i}", grader.grade_privacy_issues(catalog_issues[i::7] + ["not an issue"]))
+        for i in range(7)
+    ]
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_export_round_trip(tmp_path, reports, format):
+    reports_path, categories_path = str(tmp_path / "reports"), str(tmp_path / "categories")
+    assert export_reports(reports, reports_path, categories_path, format=format, batch_size=3) == len(reports)
+
+    if format == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        overall, categories = pq.read_table(reports_path), pq.read_table(categories_path)
+    else:
+        import pyarrow.ipc
+        overall = pyarrow.ipc.open_file(reports_path).read_all()
+        categories = pyarrow.ipc.open_file(categories_path).read_all()
+
+    assert overall.column("service_name").to_pylist() == [name for name, _ in reports]
+    assert overall.column("overall_grade").to_pylist() == [report.overall_grade for _, report in reports]
+    assert overall.column("overall_score").to_pylist() == [report.overall_score for _, report in reports]
+    assert overall.column("unknown_issues").to_pylist() == [1] * len(reports)
+
+    rows = categories.to_pylist()
+    assert len(rows) == sum(len(report.parent_category_grades) for _, report in reports)
+    by_key = {(row["service_name"], row["parent_category"]): row for row in rows}
+    for name, report in reports:
+        for category, category_report in report.parent_category_grades.items():
+            row = by_key[(name, category)]
+            assert row["score"] == category_report.score
+            assert row["grade"] == category_report.grade
+            assert row["category_weight"] == category_report.category_weight
+            assert row["good_issues"] == len(category_report.good_issues)
+            assert row["neutral_issues"] == len(category_report.neutral_issues)
+            assert row["bad_issues"] == len(category_report.bad_issues)
+            assert row["total_possible_issues"] == category_report.total_possible_issues
+            assert row["percentile"] == category_report.percentile
+            state = report.grade_state.categories.get(category)
+            assert row["blocker_issues"] == (state.counts.get("blocker", 0) if state else 0)
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        ReportWriter(str(tmp_path / "a"), str(tmp_path / "b"), format="csv")
+
+
+def test_write_reads_scores_without_building_category_reports(tmp_path):
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    grader = PrivacyGrader(mapping_df, category_weights, cache_size=0)
+    issues = [f"{e.parent_issue}: {e.privacy_issue}" for e in grader.issue_index.values()][::3]
+    report = grader.grade_privacy_issues(issues)
+    built = set(report.parent_category_grades._reports)  # Only the worst categories
+
+    with ReportWriter(str(tmp_path / "reports"), str(tmp_path / "categories")) as writer:
+        writer.write("service", report)
+        assert set(report.parent_category_grades._reports) == built < set(report.parent_category_grades)
+        # Reports holding a plain dict of category reports are written the same way
+        writer.write("copy", replace(report, parent_category_grades=dict(report.parent_category_grades)))
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = pq.read_table(str(tmp_path / "categories")).to_pylist()
+    half = len(rows) // 2
+    assert [{**row, "service_name": "copy"} for row in rows[:half]] == rows[half:]
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+from models.grade_store import GradeStore
+from models.privacy_grader import PrivacyGrader
+from models.score_distribution import ScoreDistribution
+
+
+@pytest.fixture
+def grader():
+    mapping_df = pd.DataFrame({
+        "parent_issue": ["Ownership", "Ownership", "User Rights", "User Rights"],
+        "privacy_issue": ["This service takes credit for your content", "You keep ownership of your content",
+                          "You can delete your content from the service", "You cannot delete your account"],
+        "classification": ["bad", "good", "good", "blocker"],
+    })
+    return PrivacyGrader(mapping_df, {"Ownership": 0.6, "User Rights": 0.4})
+
+
+CORPUS = {
+    "Good": ["Ownership: You keep ownership of your content", "User Rights: You can delete your content from the service"],
+    "Mixed": ["Ownership: This service takes credit for your content", "User Rights: You can delete your content from the service"],
+    "Bad": ["Ownership: This service takes credit for your content", "User Rights: You cannot delete your account"],
+}
+
+
+def test_percentile_ranks():
+    distribution = ScoreDistribution([30.0, 10.0, 20.0, 20.0], {"Ownership": [50.0, 100.0]})
+    assert distribution.overall_scores == [10.0, 20.0, 20.0, 30.0]
+    assert distribution.overall_percentile(5.0) == 0.0
+    assert distribution.overall_percentile(20.0) == 50.0  # ties count half
+    assert distribution.overall_percentile(35.0) == 100.0
+    assert distribution.category_percentile("Ownership", 75.0) == 50.0
+    assert distribution.category_percentile("Missing", 75.0) is None
+    assert ScoreDistribution([]).overall_percentile(50.0) is None
+
+
+def test_rebuild_from_grade_store(grader, tmp_path):
+    with GradeStore(tmp_path / "grades.db") as store:
+        for service_name, issues in CORPUS.items():
+            store.save_report(service_name, grader.grade_privacy_issues(issues))
+        distribution = ScoreDistribution.from_grade_store(store)
+
+    assert len(distribution) == 3
+    assert distribution.overall_scores == sorted(distribution.overall_scores)
+    assert set(distribution.category_scores) == {"Ownership", "User Rights"}
+
+    path = tmp_path / "score_distribution.json"
+    distribution.save(path)
+    loaded = ScoreDistribution.load(path)
+    assert loaded.overall_scores == distribution.overall_scores
+    assert loaded.category_scores == distribution.category_scores
+
+
+def test_grade_reports_percentiles(grader, tmp_path):
+    # Reports graded before a distribution is loaded carry no ranks, and are not served from cache after
+    assert grader.grade_privacy_issues(CORPUS["Mixed"]).overall_percentile is None
+
+    reports = {service_name: grader.grade_privacy_issues(issues) for service_name, issues in CORPUS.items()}
+    ScoreDistribution(
+        [report.overall_score for report in reports.values()],
+        {category: [report.parent_category_grades[category].score for report in reports.values()]
+         for category in grader.all_parent_categories}
+    ).save(tmp_path / "score_distribution.json")
+    grader.load_score_distribution(tmp_path / "score_distribution.json")
+
+    best = grader.grade_privacy_issues(CORPUS["Good"])
+    worst = grader.grade_privacy_issues(CORPUS["Bad"])
+    assert best.overall_percentile == pytest.approx(100 * 2.5 / 3, abs=0.1)
+    assert worst.overall_percentile == pytest.approx(100 * 0.5 / 3, abs=0.1)
+    assert worst.parent_category_grades["User Rights"].percentile < best.parent_category_grades["User Rights"].percentile
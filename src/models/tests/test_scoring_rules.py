@@ -0,0 +1,89 @@
+import os
+import random
+import numpy as np
+import pandas as pd
+import pytest
+from models.batch_grader import BatchGrader
+from models.grading_artifact import build_grading_artifact
+from models.privacy_grader import PrivacyGrader, load_weights_from_csv
+from models.scoring_rules import DEFAULT_SCORING_RULES, ScoreCap, ScoringRules, load_scoring_rules
+
+MODELS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_category_score(counts, category_weight):
+    """The hard-coded rules the default rule set replaces."""
+    base_score = 1.0
+    for classification, weight in DEFAULT_SCORING_RULES.classification_weights.items():
+        base_score += counts[classification] * weight
+    if counts['blocker'] > 0:
+        base_score = min(base_score, 0.3)
+    elif counts['bad'] > 0:
+        base_score = min(base_score, 0.7)
+    if sum(counts.values()) == counts['good']:
+        base_score = max(base_score, 0.7)
+    return max(min(base_score * category_weight, 1.0), 0.0)
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    mapping_df = pd.read_csv(os.path.join(MODELS_DIR, "mapping_df.csv"))
+    category_weights = load_weights_from_csv(os.path.join(MODELS_DIR, "category_weights.csv"))
+    return mapping_df, category_weights
+
+
+def test_default_rules_match_legacy_rules():
+    rng = random.Random(215)
+    rules = DEFAULT_SCORING_RULES.compile()
+    samples = [
+        ({c: rng.choice([0, 0, 1, 2, 5]) for c in rules.classifications}, rng.uniform(0.0, 2.0))
+        for _ in range(2000)
+    ]
+    scores = rules.score(
+        [[counts[c] for c in rules.classifications] for counts, _ in samples],
+        [weight for _, weight in samples]
+    )
+    assert scores.tolist() == [legacy_category_score(counts, weight) for counts, weight in samples]
+    # The plain-Python path single grades use gives the same floats
+    assert scores.tolist() == [
+        rules.score_one(rules.base_scores([counts[c] for c in rules.classifications]).item(), counts, weight)
+        for counts, weight in samples
+    ]
+
+
+def test_load_scoring_rules_file():
+    assert load_scoring_rules(os.path.join(MODELS_DIR, "scoring_rules.json")) == DEFAULT_SCORING_RULES
+    assert ScoringRules.from_dict(DEFAULT_SCORING_RULES.to_dict()) == DEFAULT_SCORING_RULES
+
+
+def test_rules_reject_unknown_classification():
+    with pytest.raises(ValueError, match="critical"):
+        ScoringRules(classification_weights={"bad": -0.7}, caps=(ScoreCap("critical", 0.1),))
+    with pytest.raises(ValueError, match="blocker"):
+        DEFAULT_SCORING_RULES.compile({"bad": -0.7, "neutral": 0.0, "good": 0.1})
+
+
+def test_custom_rules_scalar_and_batch_agree(catalog, tmp_path):
+    mapping_df, category_weights = catalog
+    strict = ScoringRules.from_dict({
+        **DEFAULT_SCORING_RULES.to_dict(),
+        "caps": [{"classification": "blocker", "limit": 0.1}, {"classification": "bad", "limit": 0.5}],
+    })
+    default_grader = PrivacyGrader(mapping_df, category_weights)
+    strict_grader = PrivacyGrader(mapping_df, category_weights, scoring_rules=strict)
+
+    rng = random.Random(7)
+    catalog_issues = [f"{e.parent_issue}: {e.privacy_issue}" for e in strict_grader.issue_index.values()]
+    issue_lists = [rng.sample(catalog_issues, rng.randint(3, 40)) for _ in range(200)]
+
+    batch = BatchGrader(strict_grader).grade(issue_lists)
+    for row, issues in enumerate(issue_lists):
+        report = strict_grader.grade_privacy_issues(issues)
+        assert report.overall_score == round(float(batch.overall_scores[row]) * 100, 2)
+        assert report.overall_score <= default_grader.grade_privacy_issues(issues).overall_score
+
+    # The artifact carries the rules it was built with
+    artifact_path = str(tmp_path / "grading_artifact.pkl")
+    build_grading_artifact(os.path.join(MODELS_DIR, "mapping_df.csv"),
+                           os.path.join(MODELS_DIR, "category_weights.csv"), artifact_path, scoring_rules=strict)
+    assert PrivacyGrader.from_artifact(artifact_path).scoring_rules == strict
@@ -0,0 +1,128 @@
+import fitz
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from models.get_issues import (ModelPool, analyze_pdf, estimate_tokens, extract_pdf_text, extract_text_from_pdf,
+                               tokens_saved)
+from models.analysis_cache import AnalysisCache
+from models.text_normalizer import normalize_pages
+
+HEADER = "ACME Corp   Privacy Policy"
+BODY = [
+    "We collect your email address when you sign up.\nWe never sell it to advertisers.",
+    "You can delete your account at any time from the settings page.",
+    "Questions? Write to privacy@acme.example and we will answer within 30 days.",
+]
+
+
+def page(number, body, total=3):
+    return f"{HEADER}\nHome | Products | Support\n{body}\n\nPage {number} of {total}\n"
+
+
+def test_repeated_edge_lines_are_dropped_and_whitespace_collapsed():
+    normalized = normalize_pages([page(i + 1, body) for i, body in enumerate(BODY)])
+    assert normalized.text == "\n\n".join(BODY)
+    assert normalized.repeated_lines == 9
+    assert normalized.chars_saved == normalized.original_chars - len(normalized.text) > 0
+
+
+def test_body_lines_matching_a_header_are_kept():
+    pages = [page(i + 1, body) for i, body in enumerate(BODY)]
+    pages[1] = page(2, "One\nTwo\nThree\nHome | Products | Support\nFour\nFive\nSix")
+    normalized = normalize_pages(pages)
+    assert "Three\nHome | Products | Support\nFour" in normalized.text
+    assert not normalized.text.startswith("Home")
+
+
+def test_lines_on_few_pages_or_single_page_documents_are_kept():
+    pages = [f"ACME Handbook\n{body}\n" for body in BODY]
+    # "ACME Handbook" opens 3 of 3 pages and goes, but not once it is on too few of the pages
+    assert normalize_pages(pages).repeated_lines == 3
+    assert normalize_pages(pages + ["Glossary\nTerms.\n"], min_page_fraction=0.9).repeated_lines == 0
+    assert normalize_pages([page(1, BODY[0], total=1)]).repeated_lines == 0
+
+
+def test_numbered_headings_are_not_page_numbers():
+    pages = [f"Section {i + 1}\n{body}\n\n{i + 1}/3\n" for i, body in enumerate(BODY)]
+    normalized = normalize_pages(pages)
+    assert normalized.text == "\n\n".join(f"Section {i + 1}\n{body}" for i, body in enumerate(BODY))
+    assert normalized.repeated_lines == 3  # Only the "n/3" counters
+    assert normalize_pages(pages[:2]).text.startswith("Section 1\n")
+
+
+def test_duplicate_paragraphs_are_dropped_short_repeats_kept():
+    pages = [f"{BODY[0]}\n\nSummary\n\n{BODY[1]}\n", f"Summary\n\n{BODY[0]}\n\n{BODY[2]}\n"]
+    normalized = normalize_pages(pages, edge_lines=0)
+    assert normalized.text == "\n\n".join([BODY[0], "Summary", BODY[1], "Summary", BODY[2]])
+    assert normalized.duplicate_paragraphs == 1
+
+
+@pytest.fixture
+def boilerplate_pdf(tmp_path):
+    pdf_path = str(tmp_path / "policy.pdf")
+    doc = fitz.open()
+    for i, body in enumerate(BODY * 3):
+        doc.new_page().insert_text((72, 72), page(i + 1, body, total=9))
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+def test_extract_pdf_text_reports_savings(boilerplate_pdf):
+    raw = extract_text_from_pdf(boilerplate_pdf)
+    unchanged = extract_pdf_text(boilerplate_pdf)
+    assert unchanged.text == raw and unchanged.chars_saved == 0
+
+    # Normalization reads the same text as blocks, with blank lines between them
+    normalized = extract_pdf_text(boilerplate_pdf, normalize=True)
+    assert normalized.original_chars >= len(raw)
+    assert normalized.text == "\n\n".join(BODY)
+    assert normalized.duplicate_paragraphs == 6
+    assert tokens_saved(normalized) >= estimate_tokens(raw) - estimate_tokens(normalized.text) > 0.6 * len(raw) / 4
+
+
+def test_analyze_pdf_prompts_with_normalized_text(tmp_path, boilerplate_pdf):
+    csv_path = tmp_path / "mapping.csv"
+    pd.DataFrame({"parent_issue": ["Ownership"], "privacy_issue": ["issue a"]}).to_csv(csv_path, index=False)
+    prompts = []
+
+    class RecordingModel:
+        def start_chat(self):
+            return self
+
+        def send_message(self, messages, generation_config=None):
+            prompts.append(messages[1])
+            return SimpleNamespace(text="")
+
+    pool = ModelPool(model_factory=lambda endpoint: RecordingModel(), init=lambda **kwargs: None)
+    with patch("builtins.print"):
+        normalized = analyze_pdf(boilerplate_pdf, str(csv_path), "project", "location", "endpoint", models=pool,
+                                 normalize=True)
+        raw = analyze_pdf(boilerplate_pdf, str(csv_path), "project", "location", "endpoint", models=pool)
+
+    assert "Page 1 of 9" not in prompts[0] and "Page 1 of 9" in prompts[1]
+    assert normalized.text == "\n\n".join(BODY)
+    assert normalized.tokens_saved > 0 and raw.tokens_saved == raw.chars_saved == 0
+
+
+def test_cache_hits_report_what_normalization_saved(tmp_path, boilerplate_pdf):
+    csv_path = tmp_path / "mapping.csv"
+    pd.DataFrame({"parent_issue": ["Ownership"], "privacy_issue": ["issue a"]}).to_csv(csv_path, index=False)
+
+    class Model:
+        def start_chat(self):
+            return self
+
+        def send_message(self, messages, generation_config=None):
+            return SimpleNamespace(text="")
+
+    pool = ModelPool(model_factory=lambda endpoint: Model(), init=lambda **kwargs: None)
+    with AnalysisCache(str(tmp_path / "cache.db")) as cache, patch("builtins.print"):
+        first = analyze_pdf(boilerplate_pdf, str(csv_path), "project", "location", "endpoint", models=pool,
+                            cache=cache, normalize=True)
+        second = analyze_pdf(boilerplate_pdf, str(csv_path), "project", "location", "endpoint", models=pool,
+                             cache=cache, normalize=True)
+    assert second.cache_hit and not first.cache_hit
+    assert (second.chars_saved, second.tokens_saved) == (first.chars_saved, first.tokens_saved)
+    assert second.tokens_saved > 0
@@ -0,0 +1,102 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List
+
+_DIGITS = re.compile(r'\d+')
+_WORDS = re.compile(r'[a-z]+')
+_WHITESPACE = re.compile(r'\s+')
+# The only words a page counter or print timestamp line may contain ("Page 3 of 9", "1/8", "2:50 PM")
+_COUNTER_WORDS = frozenset({'page', 'pg', 'p', 'of', 'am', 'pm'})
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """Page text with repeated headers/footers and duplicate paragraphs removed, and what that saved."""
+    text: str
+    original_chars: int
+    repeated_lines: int        # Header/footer lines dropped
+    duplicate_paragraphs: int  # Repeats of an earlier paragraph dropped
+
+    @property
+    def chars_saved(self) -> int:
+        return self.original_chars - len(self.text)
+
+
+def _line_key(line: str) -> str:
+    """
+    Compare lines case-insensitively. Numbers are masked only in page counter lines, so
+    "Page 3 of 9" matches "page 4 of 9" but numbered headings ("Section 1", "Section 2") differ.
+    """
+    line = line.lower()
+    if _COUNTER_WORDS.issuperset(_WORDS.findall(line)):
+        return _DIGITS.sub('#', line)
+    return line
+
+
+def normalize_pages(page_texts: Iterable[str], edge_lines: int = 3, min_page_fraction: float = 0.5,
+                    min_duplicate_chars: int = 40) -> NormalizedText:
+    """
+    Normalize extracted PDF text before prompting.
+
+    Whitespace runs collapse to one space and whitespace-only lines become paragraph breaks.
+    A line among the first or last edge_lines non-blank lines of a page is a header or
+    footer when the same line (page numbers masked) sits at a page edge on at least
+    min_page_fraction of the pages (and at least two); it is dropped wherever it sits at an
+    edge, so identical sentences in the body are kept. Paragraphs run across page breaks,
+    and a paragraph of at least min_duplicate_chars identical to an earlier one is dropped;
+    shorter repeats (headings, bullets) are kept.
+    """
+    pages: List[List[str]] = []
+    original_chars = 0
+    for text in page_texts:
+        original_chars += len(text)
+        pages.append([_WHITESPACE.sub(' ', line).strip() for line in text.split('\n')])
+
+    edge_keys = []
+    pages_per_key = Counter()
+    for lines in pages:
+        content = [i for i, line in enumerate(lines) if line]
+        edges = content[:edge_lines] + content[max(len(content) - edge_lines, edge_lines):]
+        keys = {i: _line_key(lines[i]) for i in edges}
+        edge_keys.append(keys)
+        pages_per_key.update(set(keys.values()))
+    min_pages = max(2, math.ceil(min_page_fraction * len(pages)))
+    repeated = {key for key, count in pages_per_key.items() if count >= min_pages}
+
+    paragraphs: List[str] = []
+    seen = set()
+    repeated_lines = duplicate_paragraphs = 0
+    current: List[str] = []
+
+    def end_paragraph() -> None:
+        nonlocal duplicate_paragraphs
+        if not current:
+            return
+        paragraph = "\n".join(current)
+        key = " ".join(current).lower()
+        current.clear()
+        if len(key) >= min_duplicate_chars:
+            if key in seen:
+                duplicate_paragraphs += 1
+                return
+            seen.add(key)
+        paragraphs.append(paragraph)
+
+    for lines, keys in zip(pages, edge_keys):
+        for i, line in enumerate(lines):
+            if keys.get(i) in repeated:
+                repeated_lines += 1
+            elif line:
+                current.append(line)
+            else:
+                end_paragraph()
+    end_paragraph()
+
+    return NormalizedText(
+        text="\n\n".join(paragraphs),
+        original_chars=original_chars,
+        repeated_lines=repeated_lines,
+        duplicate_paragraphs=duplicate_paragraphs,
+    )